@@ -5,7 +5,7 @@ Provides functions to load player, enemy, obstacle, and tile sprites.
 
 import pygame
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 class AssetLoader:
     """Manages loading and caching of all game assets"""
@@ -13,6 +13,7 @@ class AssetLoader:
     def __init__(self):
         self.sprite_cache: Dict = {}
         self.animation_cache: Dict = {}
+        self.variant_cache: Dict = {}
         self.asset_dir = 'assets'
         self.available = self._check_assets()
     
@@ -112,6 +113,76 @@ class AssetLoader:
         self.animation_cache[cache_key] = animation_frames
         return animation_frames
     
+    def get_variant(self, path: str, size: Optional[Tuple[int, int]] = None,
+                    flip_x: bool = False, alpha: Optional[int] = None) -> Optional[pygame.Surface]:
+        """
+        Get a scaled, flipped and/or translucent version of a sprite.
+        Each variant is transformed once and then shared, so callers must
+        not modify the returned surface.
+        
+        Args:
+            path: Relative path to sprite file (relative to assets dir)
+            size: Optional (width, height) to scale to
+            flip_x: Whether to mirror the sprite horizontally
+            alpha: Optional surface alpha (0-255)
+        
+        Returns:
+            Shared pygame Surface or None if the sprite can't be loaded
+        """
+        key = (path, size, flip_x, alpha)
+        if key in self.variant_cache:
+            return self.variant_cache[key]
+        
+        sprite = self.load_sprite(path)
+        if sprite is None:
+            return None
+        
+        variant = sprite
+        if size is not None and size != sprite.get_size():
+            variant = pygame.transform.scale(variant, size)
+        if flip_x:
+            variant = pygame.transform.flip(variant, True, False)
+        if alpha is not None:
+            if variant is sprite:
+                # Never change the alpha of the shared original
+                variant = sprite.copy()
+            variant.set_alpha(alpha)
+        
+        self.variant_cache[key] = variant
+        return variant
+    
+    def get_animation_variant(self, name_pattern: str, frames: int, size: Optional[Tuple[int, int]] = None,
+                              flip_x: bool = False, alpha: Optional[int] = None) -> Optional[list]:
+        """
+        Get shared, pre-transformed frames of an animation (see get_variant).
+        
+        Args:
+            name_pattern: Pattern like 'animations/player_walk' (frame number added)
+            frames: Number of frames in animation
+            size: Optional (width, height) to scale each frame to
+            flip_x: Whether to mirror the frames horizontally
+            alpha: Optional surface alpha (0-255)
+        
+        Returns:
+            List of shared pygame Surfaces or None if load fails
+        """
+        if not self.available:
+            return None
+        
+        cache_key = (name_pattern, frames, size, flip_x, alpha)
+        if cache_key in self.animation_cache:
+            return self.animation_cache[cache_key]
+        
+        animation_frames = []
+        for frame in range(frames):
+            variant = self.get_variant(f"{name_pattern}_{frame}.png", size, flip_x, alpha)
+            if variant is None:
+                return None
+            animation_frames.append(variant)
+        
+        self.animation_cache[cache_key] = animation_frames
+        return animation_frames
+    
     def get_player_idle(self) -> Optional[pygame.Surface]:
         """Get player idle sprite"""
         return self.load_sprite('player/player_idle.png')
@@ -4,9 +4,14 @@ import os
 from enemies import Enemy
 from settings import PURPLE, ENEMY_SIZE, GRAVITY, WIDTH, HEIGHT, YELLOW, GREEN, BLACK, ORANGE, RED
 from asset_loader import get_loader
+from physics import sweep_landing
+from collision import LAYER_PLAYER, LAYER_ATTACK, LAYER_ENEMY
 
 class Boss(pygame.sprite.Sprite):
     """Boss enemy with distinct behavior and higher difficulty"""
+    collision_layer = LAYER_ENEMY
+    collision_mask = LAYER_PLAYER | LAYER_ATTACK
+    
     def __init__(self, x, y):
         super().__init__()
         # Try to load the scary bear asset
@@ -34,6 +39,7 @@ class Boss(pygame.sprite.Sprite):
         self.ranged = True
         self.fire_cooldown = 0
         self.phase = 1  # Boss has phases
+        self._image_phase = None  # Phase the current image was drawn for
         self.phase_timer = 0
         self.attack_pattern = 0
         self.hitbox = self.rect.copy()
@@ -58,16 +64,22 @@ class Boss(pygame.sprite.Sprite):
 
     def update_phase_color(self):
         """Update boss color based on health phase"""
+        # The image only changes with the phase, so skip the work between phase changes
+        if self.phase == self._image_phase:
+            return
+        self._image_phase = self.phase
+        
         # Only update if we have a base image (fallback case)
         if hasattr(self, 'base_image') and self.base_image is not None:
             # For the bear image (not the fallback square), just keep it as-is
             # The bear sprite will naturally look different as it doesn't need color changes
-            self.image = self.base_image.copy()
+            self.image = self.base_image
             
             # Only color-modify the fallback square case (check if it's a drawn square, not the bear)
             # We check if the image is the hand-drawn crown square by looking at its typical size
             if self.base_image.get_size() == (ENEMY_SIZE * 2, ENEMY_SIZE * 2):
-                # This is the fallback square, apply color changes
+                # This is the fallback square, apply color changes on a copy
+                self.image = self.base_image.copy()
                 if self.phase == 1:
                     # Phase 1: Purple (normal)
                     color = PURPLE
@@ -117,6 +129,18 @@ class Boss(pygame.sprite.Sprite):
         # Border
         pygame.draw.rect(surface, BLACK, (bar_x, bar_y, bar_width, bar_height), 2)
 
+    def get_state(self):
+        """Return the boss's mutable state as a tuple (see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.health, self.vx, self.vy, self.fire_cooldown,
+                self.phase, self.phase_timer, self.attack_pattern)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        (self.rect.x, self.rect.y, self.health, self.vx, self.vy, self.fire_cooldown,
+         self.phase, self.phase_timer, self.attack_pattern) = state
+        self.update_phase_color()
+        self.hitbox = self.rect.copy()
+
     def update(self, player, platforms, projectiles_group=None):
         """Boss has advanced movement and attack patterns"""
         
@@ -131,6 +155,9 @@ class Boss(pygame.sprite.Sprite):
         
         self.phase_timer += 1
         
+        # Where the step started, for the swept platform landing
+        prev_left = self.rect.left
+        
         # Boss movement pattern
         if self.phase == 1:
             # Normal patrol
@@ -168,12 +195,11 @@ class Boss(pygame.sprite.Sprite):
 
         # Gravity and platform collision
         self.apply_gravity()
+        prev_bottom = self.rect.bottom
         self.rect.y += self.vy
-        for p in platforms:
-            if self.rect.colliderect(p.rect):
-                if self.vy > 0:
-                    self.rect.bottom = p.rect.top
-                    self.vy = 0
+        if self.vy > 0:
+            if sweep_landing(platforms, self.rect, prev_bottom, prev_left=prev_left) is not None:
+                self.vy = 0
 
         # Prevent falling off screen (both bottom and top)
         if self.rect.bottom > HEIGHT:
@@ -222,6 +248,9 @@ class Boss(pygame.sprite.Sprite):
             vy = (dy / distance) * 7
         else:
             vx, vy = 7, 0
+        if hasattr(projectiles_group, 'spawn'):
+            projectiles_group.spawn(self.rect.centerx, self.rect.centery, vx=vx, vy=vy, dmg=15)
+            return
         proj = Projectile(self.rect.centerx, self.rect.centery, vx=vx, vy=vy, dmg=15)
         if hasattr(projectiles_group, 'add'):
             projectiles_group.add(proj)
@@ -238,6 +267,9 @@ class Boss(pygame.sprite.Sprite):
             angle = angle_offset
             vx = base_speed * (1 + angle)
             vy = base_speed * angle * 0.5
+            if hasattr(projectiles_group, 'spawn'):
+                projectiles_group.spawn(self.rect.centerx, self.rect.centery, vx=vx, vy=vy, dmg=12)
+                continue
             proj = Projectile(self.rect.centerx, self.rect.centery, vx=vx, vy=vy, dmg=12)
             if hasattr(projectiles_group, 'add'):
                 projectiles_group.add(proj)
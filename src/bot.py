@@ -0,0 +1,331 @@
+"""
+Scripted playtest bot.
+PlaytestBot is an input source that plays a level by itself: it hunts down
+the enemies (the boss included), then goes to the door. Platforms are
+one-way and a player that overlaps a platform while falling lands on top
+of it, so the bot climbs by jumping up from under the next platform of a
+shortest path through the level's platforms, and goes down by walking off
+an edge. Routes are worked out once per level and a frame's decision is a
+handful of rect comparisons, so levels play headless far faster than real
+time. playtest() runs the bot over seeds and levels on the rollout pool
+and reports whether each level was cleared, how long it took and how much
+damage the bot took.
+
+Usage:
+    python src/bot.py --seeds 50 --workers 8
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from settings import PLAYER_WIDTH, SIM_HZ, ROLLOUT_MAX_FRAMES
+from input_source import INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_ATTACK
+from rollout import run_rollouts, ALL_LEVELS, OUTCOME_COMPLETE
+from reachability import RUN_SPEED, reachability_graph
+
+ATTACK_REACH = 28                # Widest gap to a target that a swing still hits (see Player.attack)
+ATTACK_HALF_HEIGHT = 25          # Half the height of a swing, around the player's centre
+STUCK_FRAMES = 10                # Frames without moving before the bot tries to get free
+
+# Leeway kept between the player's centre and a platform's edge
+EDGE_MARGIN = PLAYER_WIDTH // 2
+
+
+def _takeoff(here, step):
+    """
+    Where to jump from to get onto a higher platform: anywhere under it, or
+    failing that the edge nearest it, with half the body over the edge.
+
+    Args:
+        here: Platform jumped from
+        step: Platform jumped to
+
+    Returns:
+        (left, right) range of x for the player's centre
+    """
+    left = max(here.rect.left, step.rect.left) + EDGE_MARGIN
+    right = min(here.rect.right, step.rect.right) - EDGE_MARGIN
+    if left <= right:
+        return left, right
+    if step.rect.centerx > here.rect.centerx:
+        return here.rect.right, here.rect.right
+    return here.rect.left, here.rect.left
+
+
+def _find_routes(platforms):
+    """
+    Work out how to get between platforms.
+
+    Which platform can be got onto from which comes from the reachability
+    graph (see reachability.py), so the bot plans with the player's own jump.
+
+    Args:
+        platforms: The level's platforms
+
+    Returns:
+        Dict mapping (from, to) platform pairs to (hops, first platform to go to)
+    """
+    graph = reachability_graph([platform.rect for platform in platforms])
+    neighbours = {a: [platforms[j] for j in graph[i]] for i, a in enumerate(platforms)}
+
+    routes = {}
+    for start in platforms:
+        routes[start, start] = (0, start)
+        queue = deque((b, b) for b in neighbours[start])
+        for b in neighbours[start]:
+            routes[start, b] = (1, b)
+        while queue:
+            platform, first = queue.popleft()
+            hops = routes[start, platform][0]
+            for neighbour in neighbours[platform]:
+                if (start, neighbour) not in routes:
+                    routes[start, neighbour] = (hops + 1, first)
+                    queue.append((neighbour, first))
+    return routes
+
+
+class PlaytestBot:
+    """Input source that plays the attached game's level by itself"""
+
+    def __init__(self, game=None):
+        """
+        Initialize the bot.
+
+        Args:
+            game: Game whose player reads this bot (can also be set later with attach)
+        """
+        self._routes = {}
+        self.attach(game)
+
+    def attach(self, game):
+        """
+        Start playing a game's current level.
+
+        Args:
+            game: Game whose player reads this bot
+        """
+        self.game = game
+        # Routes are worked out again for each level's platforms
+        self._index = None
+        self._here = None
+        self._step = None
+        self._last_pos = None
+        self._stuck = 0
+        self._detour = 0
+        self._detour_buttons = 0
+
+    def _platform_under(self, rect):
+        """The highest platform at or below a rect's feet that it overlaps horizontally"""
+        best = None
+        for platform in self._index:
+            other = platform.rect
+            if other.left < rect.right and other.right > rect.left and other.top >= rect.bottom - 4:
+                if best is None or other.top < best.rect.top:
+                    best = platform
+        return best
+
+    def _in_reach(self, rect, target, facing_right):
+        """Whether a swing facing this way would hit the target"""
+        if abs(target.centery - rect.centery) >= ATTACK_HALF_HEIGHT + target.height // 2:
+            return False
+        if facing_right:
+            return rect.centerx <= target.centerx and target.left - rect.right <= ATTACK_REACH
+        return target.centerx <= rect.centerx and rect.left - target.right <= ATTACK_REACH
+
+    def _choose_target(self, rect):
+        """Nearest enemy the bot can get to, else the door"""
+        here = self._here
+        target = None
+        best = None
+        for enemy in self.game.enemies:
+            route = self._routes.get((here, self._platform_under(enemy.rect)))
+            if route is None:
+                # Unreachable from here for now (or the bot is not on a platform)
+                cost = 10000
+            else:
+                cost = route[0] * 1000
+            cost += abs(enemy.rect.centerx - rect.centerx)
+            if best is None or cost < best:
+                best = cost
+                target = enemy
+        if target is None:
+            target = next(iter(self.game.doors), None)
+        return target
+
+    def read(self):
+        """Return the bitmask of buttons for this step"""
+        game = self.game
+        if game is None:
+            return 0
+        if game.platform_index is not self._index:
+            self._index = game.platform_index
+            self._routes = _find_routes(list(self._index))
+            self._here = None
+        player = game.player
+        rect = player.rect
+        if player.on_ground:
+            self._here = self._platform_under(rect)
+
+        buttons = 0
+        # Swing at anything harmful or in the way, turning round for it if needed
+        for facing_right in (player.facing_right, not player.facing_right):
+            if any(self._in_reach(rect, enemy.rect, facing_right) for enemy in game.enemies) or \
+                    any((obstacle.damage > 0 or obstacle.blocking) and
+                        self._in_reach(rect, obstacle.rect, facing_right) for obstacle in game.obstacles):
+                if player.attack_cooldown <= 0:
+                    if facing_right != player.facing_right:
+                        buttons |= INPUT_RIGHT if facing_right else INPUT_LEFT
+                    return buttons | INPUT_ATTACK
+                break
+
+        target = self._choose_target(rect)
+        if target is None:
+            return 0
+        goal_x = self._goal_x(player, rect, target)
+        if goal_x is None:
+            buttons |= INPUT_JUMP
+        elif goal_x > rect.centerx + RUN_SPEED // 2:
+            buttons |= INPUT_RIGHT
+        elif goal_x < rect.centerx - RUN_SPEED // 2:
+            buttons |= INPUT_LEFT
+
+        # Get past whatever stops the bot: jump (and swing) over something
+        # in the way, or walk off something it is perched on, e.g. a block
+        if self._detour and rect.top == self._last_pos[1]:
+            self._detour -= 1
+            return self._detour_buttons
+        self._detour = 0
+        if player.on_ground:
+            stuck = buttons & (INPUT_LEFT | INPUT_RIGHT) and rect.topleft == self._last_pos
+        else:
+            # Neither standing on a platform nor rising or falling
+            stuck = self._last_pos is not None and rect.top == self._last_pos[1]
+        if stuck:
+            self._stuck += 1
+            if self._stuck > STUCK_FRAMES:
+                self._stuck = 0
+                if player.on_ground:
+                    buttons |= INPUT_JUMP | INPUT_ATTACK
+                else:
+                    self._detour = STUCK_FRAMES * 5
+                    self._detour_buttons = INPUT_LEFT if target.rect.centerx < rect.centerx else INPUT_RIGHT
+        else:
+            self._stuck = 0
+        self._last_pos = rect.topleft
+        return buttons
+
+    def _goal_x(self, player, rect, target):
+        """
+        Decide where to move to next.
+
+        Args:
+            player: The player
+            rect: The player's rect
+            target: Enemy or door being headed for
+
+        Returns:
+            The x to walk towards, or None to jump where the player stands
+        """
+        if not player.on_ground:
+            return self._steer(rect, target)
+        here = self._here
+        route = self._routes.get((here, self._platform_under(target.rect)))
+        if route is None or route[1] is here:
+            # Same platform (or no way there): walk up to the target,
+            # stopping just within reach of an enemy
+            self._step = None
+            if target not in self.game.enemies:
+                return target.rect.centerx
+            stand_off = ATTACK_REACH // 2 + rect.width // 2
+            if target.rect.centerx > rect.centerx:
+                return target.rect.left - stand_off
+            return target.rect.right + stand_off
+
+        step = route[1]
+        self._step = step
+        if step.rect.top <= here.rect.top:
+            # Jump up from under the next platform (or from the nearest edge
+            # towards it, or across to one at the same height)
+            left, right = _takeoff(here, step)
+            goal_x = min(max(rect.centerx, left), right)
+            if abs(goal_x - rect.centerx) <= RUN_SPEED // 2:
+                return None
+            return goal_x
+
+        # Walk off the edge nearest the platform below
+        if step.rect.right > here.rect.right and (step.rect.left >= here.rect.left or
+                                                  rect.centerx > here.rect.centerx):
+            return here.rect.right + rect.width
+        return here.rect.left - rect.width
+
+    def _steer(self, rect, target):
+        """Where to steer while in the air"""
+        step = self._step
+        here = self._here
+        if step is None:
+            return target.rect.centerx
+        if here is not None and step.rect.top > here.rect.top and rect.top <= here.rect.bottom + 2:
+            # Still beside the platform just walked off: keep clear of it
+            return rect.centerx
+        left = step.rect.left + EDGE_MARGIN
+        right = step.rect.right - EDGE_MARGIN
+        return min(max(rect.centerx, left), right)
+
+
+def bot_input(seed, level):
+    """Input factory for rollouts: a fresh bot for each run"""
+    return PlaytestBot()
+
+
+def playtest(seeds, levels=ALL_LEVELS, workers=None, max_frames=ROLLOUT_MAX_FRAMES):
+    """
+    Let the bot play every (seed, level) pair.
+
+    Args:
+        seeds: Level seeds to play
+        levels: Levels to play for each seed
+        workers: Worker processes (defaults to one per core; 0 plays in this process)
+        max_frames: Frames before a run counts as a timeout
+
+    Returns:
+        Iterator of RolloutResult, in (seed, level) order; a cleared level
+        has outcome OUTCOME_COMPLETE and took frames / SIM_HZ seconds
+    """
+    return run_rollouts(seeds, levels, workers=workers, input_factory=bot_input, max_frames=max_frames)
+
+
+def main(argv=None):
+    """Playtest a range of seeds from the command line and print per-level results"""
+    parser = argparse.ArgumentParser(description="Let the playtest bot play every level for a range of seeds")
+    parser.add_argument('--seeds', type=int, default=20, help="Number of seeds to play")
+    parser.add_argument('--first-seed', type=int, default=0, help="First seed of the range")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--max-frames', type=int, default=ROLLOUT_MAX_FRAMES, help="Frames before a run times out")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    results = {level: [] for level in ALL_LEVELS}
+    start = time.perf_counter()
+    for result in playtest(seeds, workers=args.workers, max_frames=args.max_frames):
+        results[result.level].append(result)
+    elapsed = time.perf_counter() - start
+
+    frames = 0
+    for level in ALL_LEVELS:
+        cleared = [r for r in results[level] if r.outcome == OUTCOME_COMPLETE]
+        frames += sum(r.frames for r in results[level])
+        if cleared:
+            clear_time = sum(r.frames for r in cleared) / len(cleared) / SIM_HZ
+            damage = sum(r.damage_taken for r in cleared) / len(cleared)
+            print(f"Level {level}: cleared {len(cleared)}/{args.seeds}, {clear_time:.1f}s average time to clear, "
+                  f"{damage:.1f} average damage taken")
+        else:
+            print(f"Level {level}: cleared 0/{args.seeds}")
+    game_time = frames / SIM_HZ
+    print(f"[+] {game_time:.0f}s of play in {elapsed:.1f}s ({game_time / elapsed:.0f}x real time)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
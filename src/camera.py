@@ -1,6 +1,7 @@
 import pygame
 import math
 from settings import WIDTH, HEIGHT, WHITE, GRAY
+from parallax import ParallaxLayer, draw_layers
 
 class Camera:
     """
@@ -53,6 +54,9 @@ class Camera:
         # Camera scroll threshold: only scroll upward once player is above this height
         # Start scrolling when player gets high enough (within top 30% of the screen)
         self.scroll_threshold_y = level_height - screen_height + int(screen_height * 0.7)
+        
+        # Built on first use by draw_parallax_background
+        self._default_parallax_layers = None
 
     def update(self, player_rect):
         """
@@ -77,12 +81,24 @@ class Camera:
         # Apply smooth scrolling (lerp)
         if self.smooth_enabled:
             self.y = self._lerp(self.y, self.target_y, self.smooth_factor)
+            # Settle exactly on the target once within half a pixel, so an
+            # idle camera is truly stationary instead of creeping forever
+            if abs(self.target_y - self.y) < 0.5:
+                self.y = self.target_y
         else:
             self.y = self.target_y
         
         # Clamp camera to level boundaries
         self._clamp_to_boundaries()
 
+    def get_state(self):
+        """Return the camera position as a tuple (see Game.snapshot)"""
+        return (self.x, self.y, self.target_x, self.target_y)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        self.x, self.y, self.target_x, self.target_y = state
+
     def _lerp(self, start, end, factor):
         """
         Linear interpolation between two values.
@@ -183,45 +199,23 @@ class Camera:
         
         Args:
             surface: Pygame surface to draw on
-            layers: List of dicts with keys:
-                   - 'color': RGB tuple
-                   - 'depth': float (0.0-1.0), lower = further away, slower movement
-                   - 'offset_y': optional starting y offset
+            layers: List of ParallaxLayer objects ordered from farthest to
+                    nearest; defaults to three plain color layers
+        
+        Returns:
+            True if the layers covered the whole surface
         """
         if layers is None:
-            # Default parallax layers
-            layers = [
-                {'color': (50, 30, 60), 'depth': 0.1},    # Far background
-                {'color': (80, 50, 100), 'depth': 0.3},   # Mid background
-                {'color': (120, 70, 140), 'depth': 0.6},  # Near background
-            ]
-        
-        for layer in layers:
-            color = layer['color']
-            depth = layer['depth']
-            
-            # Calculate parallax offset - multiply camera y by depth factor
-            parallax_y = int(self.y * depth)
-            
-            # Draw multiple sections to handle wrapping
-            section_height = self.screen_height
-            
-            # Calculate which section we're in
-            section_offset = parallax_y % section_height
-            
-            # Draw the current section and wrap around
-            surface.fill(color, (0, 0, self.screen_width, section_height))
-            
-            # Optional: Draw pattern or texture on background
-            # This creates visual interest without much performance cost
-            if depth == 0.1:  # Farthest layer - draw stars
-                pygame.draw.line(surface, (255, 255, 255), 
-                               (100, 50), (150, 50), 2)
-            elif depth == 0.3:  # Mid layer - draw clouds
-                pygame.draw.circle(surface, (200, 200, 200), (100, 100), 30)
-            
-            # Important: draw only once per update since parallax is pre-calculated
-            break  # For now, use simple background - expand this for visual polish
+            if self._default_parallax_layers is None:
+                # Default parallax layers
+                self._default_parallax_layers = [
+                    ParallaxLayer(0.1, color=(50, 30, 60), screen_height=self.screen_height),    # Far background
+                    ParallaxLayer(0.3, color=(80, 50, 100), screen_height=self.screen_height),   # Mid background
+                    ParallaxLayer(0.6, color=(120, 70, 140), screen_height=self.screen_height),  # Near background
+                ]
+            layers = self._default_parallax_layers
+        
+        return draw_layers(surface, layers, self.y)
 
     def reset(self):
         """Reset camera to origin"""
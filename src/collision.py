@@ -0,0 +1,146 @@
+"""
+Collision pipeline with layer masks.
+Every collidable entity class declares a collision_layer bit and a
+collision_mask of the layers it reacts to. The pipeline buckets all targets
+into one spatial hash (or lets a system such as the projectile arrays answer
+for its own layer), queries it once per mover, and dispatches each
+overlapping pair to the handler registered for its (layer, layer)
+combination.
+"""
+
+from typing import Callable, Dict, List, Tuple
+from settings import COLLISION_CELL_SIZE
+from spatial_hash import SpatialHash
+
+# Collision layers (one bit each)
+LAYER_PLAYER = 1
+LAYER_ATTACK = 2
+LAYER_ENEMY = 4
+LAYER_PROJECTILE = 8
+LAYER_OBSTACLE = 16
+LAYER_PICKUP = 32
+LAYER_POWERUP = 64
+LAYER_TREASURE = 128
+
+
+class CollisionPipeline:
+    """Resolves collisions between movers and targets through a handler table"""
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        """
+        Initialize an empty pipeline.
+
+        Args:
+            cell_size: Spatial hash cell size for the broad-phase
+        """
+        self.grid = SpatialHash(cell_size)
+        # Targets that never move are kept in their own grid, which is only
+        # rebuilt when the membership of their groups changes
+        self.static_grid = SpatialHash(cell_size)
+        self._static_members = None
+        self._static_layers = 0
+        # Dicts keep insertion order, so handlers run in registration order
+        self.handlers: Dict[Tuple[int, int], Callable] = {}
+        # The same handlers as (target layer, handler) lists per mover layer
+        self._mover_handlers: Dict[int, List[Tuple[int, Callable]]] = {}
+        # Layers answered by a system's own collide_rect instead of the grid
+        self.systems: Dict[int, object] = {}
+        # Union of the layers in either grid this frame
+        self.grid_layers = 0
+
+    def register(self, mover_layer, target_layer, handler):
+        """
+        Register the handler for one layer pair. A mover's handlers run in
+        the order they are registered.
+
+        Args:
+            mover_layer: Layer of the entity doing the colliding (player, attack)
+            target_layer: Layer of the entity collided with
+            handler: Called as handler(mover, targets) with the overlapping
+                targets in group order (for a system, whatever its
+                collide_rect returns)
+        """
+        self.handlers[(mover_layer, target_layer)] = handler
+        mover_handlers = {}
+        for (mover, target), registered in self.handlers.items():
+            mover_handlers.setdefault(mover, []).append((target, registered))
+        self._mover_handlers = mover_handlers
+
+    def build(self, *groups, static=()):
+        """
+        Rebuild the broad-phase from this frame's target positions.
+
+        Args:
+            groups: Sprite groups whose members can be collided with, or
+                systems providing collide_rect(rect) for their collision_layer
+            static: Sprite groups whose members never move (obstacles,
+                pickups). They are only re-inserted when a group gains or
+                loses members, and must not share a layer with `groups`.
+        """
+        grid = self.grid
+        grid.clear()
+        self.systems.clear()
+        layers = 0
+        for group in groups:
+            if hasattr(group, 'collide_rect'):
+                self.systems[group.collision_layer] = group
+                continue
+            for sprite in group:
+                grid.insert(sprite)
+                layers |= sprite.collision_layer
+
+        members = [group.sprites() for group in static]
+        if members != self._static_members:
+            self._static_members = members
+            self.static_grid.clear()
+            static_layers = 0
+            for sprites in members:
+                for sprite in sprites:
+                    self.static_grid.insert(sprite)
+                    static_layers |= sprite.collision_layer
+            self._static_layers = static_layers
+        self.grid_layers = layers | self._static_layers
+
+    def run(self, movers):
+        """
+        Dispatch every overlapping (mover, target) pair to its handler.
+        Movers are resolved one at a time, each running the handlers for
+        its layer in registration order.
+
+        Args:
+            movers: Entities that collide against the targets, in order
+        """
+        grid = self.grid
+        static_grid = self.static_grid
+        systems = self.systems
+        grid_layers = self.grid_layers
+        for mover in movers:
+            handlers = self._mover_handlers.get(mover.collision_layer)
+            if handlers is None:
+                continue
+            mask = mover.collision_mask
+            queried = None
+            for target_layer, handler in handlers:
+                if not mask & target_layer:
+                    continue
+                system = systems.get(target_layer)
+                if system is not None:
+                    hits = system.collide_rect(mover.rect)
+                elif grid_layers & target_layer:
+                    # One grid query covers all of the mover's layers, bucketed
+                    # by target layer. It is only repeated if an earlier
+                    # handler moved the mover.
+                    if queried is None or queried != mover.rect:
+                        queried = mover.rect.copy()
+                        by_layer = {}
+                        for target in grid.query(queried, mask) + static_grid.query(queried, mask):
+                            by_layer.setdefault(target.collision_layer, []).append(target)
+                    candidates = by_layer.get(target_layer)
+                    if candidates is None:
+                        continue
+                    # Skip targets killed by an earlier handler
+                    hits = [target for target in candidates if target.alive()]
+                else:
+                    continue
+                if len(hits):
+                    handler(mover, hits)
@@ -0,0 +1,395 @@
+"""
+Monte Carlo difficulty estimates.
+Large batches of seeds are played through every requested level on the
+rollout pool, by the playtest bot or by random input, and folded into
+per-level statistics: clear rate, what killed the player (obstacle type,
+enemy, projectile or boss phase) and NumPy histograms of how long cleared
+and lost runs took. Statistics are plain counts, so a batch merges into an
+existing results file by adding them up: each run of the tool continues
+with the seeds after the ones already in the file. The seeds played on
+each level are recorded as ranges, and a batch that replays any of them is
+refused rather than counted twice.
+
+Usage:
+    python src/difficulty.py --seeds 1000 --levels 1 2 3 4 5 6 7 8 9
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+import numpy as np
+from settings import SIM_HZ, ROLLOUT_MAX_FRAMES, DIFFICULTY_BIN_FRAMES, DIFFICULTY_RESULTS_PATH
+from utils import level_difficulty
+from rollout import run_rollouts, random_input, ALL_LEVELS, OUTCOME_COMPLETE, OUTCOME_DEATH, OUTCOME_TIMEOUT
+from bot import bot_input
+
+# Bump whenever the results file layout changes
+RESULTS_VERSION = 2
+
+# Who plays the runs, as rollout input factories
+PLAYERS = {
+    'bot': bot_input,
+    'random': random_input,
+}
+
+
+def _union_ranges(ranges):
+    """
+    Collapse seed ranges into sorted, non-overlapping ones.
+
+    Args:
+        ranges: Iterable of (start, stop) seed ranges, stop exclusive
+
+    Returns:
+        List of (start, stop) tuples, adjacent ranges joined
+    """
+    merged = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return [(start, stop) for start, stop in merged]
+
+
+class DifficultyResults:
+    """Per-level clear rates, death causes and duration histograms"""
+
+    def __init__(self, player='bot', max_frames=ROLLOUT_MAX_FRAMES, bin_frames=DIFFICULTY_BIN_FRAMES):
+        """
+        Initialize empty results.
+
+        Args:
+            player: Name of the PLAYERS entry that played the runs
+            max_frames: Frames before a run counted as a timeout
+            bin_frames: Width of a duration histogram bin in frames
+        """
+        self.player = player
+        self.max_frames = max_frames
+        self.bin_frames = bin_frames
+        # Bin edges in frames; the last bin also holds runs that took exactly max_frames
+        self.bin_edges = np.arange(0, max_frames + bin_frames, bin_frames)
+        # First seed not played yet, where the next batch carries on
+        self.next_seed = 0
+        self.levels = {}
+
+    def _level(self, level):
+        """Statistics for a level, created empty on first use"""
+        stats = self.levels.get(level)
+        if stats is None:
+            bins = len(self.bin_edges) - 1
+            stats = {
+                'difficulty': level_difficulty(level),
+                'outcomes': Counter(),
+                'death_causes': Counter(),
+                'clear_frames': np.zeros(bins, dtype=np.int64),
+                'death_frames': np.zeros(bins, dtype=np.int64),
+                # Seeds played, as sorted (start, stop) ranges
+                'seeds': [],
+            }
+            self.levels[level] = stats
+        return stats
+
+    def add(self, results):
+        """
+        Fold finished runs in.
+
+        Args:
+            results: Iterable of RolloutResults played with this player and max_frames
+        """
+        frames = defaultdict(list)
+        seeds = defaultdict(list)
+        for result in results:
+            stats = self._level(result.level)
+            stats['outcomes'][result.outcome] += 1
+            if result.outcome == OUTCOME_DEATH:
+                stats['death_causes'][result.death_cause] += 1
+            frames[result.level, result.outcome].append(result.frames)
+            seeds[result.level].append((result.seed, result.seed + 1))
+            self.next_seed = max(self.next_seed, result.seed + 1)
+
+        for level, played in seeds.items():
+            stats = self.levels[level]
+            stats['seeds'] = _union_ranges(stats['seeds'] + played)
+
+        # Bin each level's durations in one go
+        for (level, outcome), durations in frames.items():
+            if outcome == OUTCOME_TIMEOUT:
+                continue
+            counts, _ = np.histogram(durations, self.bin_edges)
+            self.levels[level]['clear_frames' if outcome == OUTCOME_COMPLETE else 'death_frames'] += counts
+
+    def check_compatible(self, player, max_frames, bin_frames):
+        """
+        Make sure runs played with these settings can be added to these results.
+
+        Args:
+            player: Name of the PLAYERS entry that played the runs
+            max_frames: Frames before a run counted as a timeout
+            bin_frames: Width of a duration histogram bin in frames
+
+        Raises:
+            ValueError: If the settings differ from the ones these results were made with
+        """
+        if (player, max_frames, bin_frames) != (self.player, self.max_frames, self.bin_frames):
+            raise ValueError(f"Results of {player} over {max_frames} frames ({bin_frames}-frame bins) "
+                             f"cannot be merged into results of {self.player} over {self.max_frames} frames "
+                             f"({self.bin_frames}-frame bins)")
+
+    def first_played(self, level, start, stop):
+        """
+        Find a seed of a range that has already been played on a level.
+
+        Args:
+            level: Level number
+            start: First seed of the range
+            stop: Seed after the last one of the range
+
+        Returns:
+            The lowest seed in [start, stop) already in these results, or None
+        """
+        stats = self.levels.get(level)
+        if stats is None:
+            return None
+        for played_start, played_stop in stats['seeds']:
+            if played_start < stop and start < played_stop:
+                return max(start, played_start)
+        return None
+
+    def merge(self, other):
+        """
+        Add another set of results (e.g. a new batch, or one from another machine) to these.
+
+        Args:
+            other: DifficultyResults made with the same player, max_frames and
+                bin_frames, over seeds not in these results
+
+        Raises:
+            ValueError: If the settings differ, or if a seed was played on the
+                same level in both (its runs would be counted twice)
+        """
+        self.check_compatible(other.player, other.max_frames, other.bin_frames)
+        for level, other_stats in other.levels.items():
+            for start, stop in other_stats['seeds']:
+                seed = self.first_played(level, start, stop)
+                if seed is not None:
+                    raise ValueError(f"Seed {seed} on level {level} is already in the results "
+                                     f"and would be counted twice")
+        for level, other_stats in other.levels.items():
+            stats = self._level(level)
+            stats['outcomes'].update(other_stats['outcomes'])
+            stats['death_causes'].update(other_stats['death_causes'])
+            stats['clear_frames'] += other_stats['clear_frames']
+            stats['death_frames'] += other_stats['death_frames']
+            stats['seeds'] = _union_ranges(stats['seeds'] + other_stats['seeds'])
+        self.next_seed = max(self.next_seed, other.next_seed)
+
+    def runs(self, level):
+        """Number of runs played on a level"""
+        return sum(self.levels[level]['outcomes'].values()) if level in self.levels else 0
+
+    def clear_rate(self, level):
+        """Fraction of a level's runs that cleared it"""
+        runs = self.runs(level)
+        return self.levels[level]['outcomes'][OUTCOME_COMPLETE] / runs if runs else 0.0
+
+    def clear_time(self, level, percentile=50):
+        """
+        Time to clear a level, read off its duration histogram.
+
+        Args:
+            level: Level number
+            percentile: Percentile of the cleared runs (0-100)
+
+        Returns:
+            Seconds by which that share of the clears had finished (to the
+            bin), or None if the level was never cleared
+        """
+        counts = self.levels[level]['clear_frames'] if level in self.levels else None
+        if counts is None or not counts.any():
+            return None
+        cumulative = np.cumsum(counts)
+        bin_index = int(np.searchsorted(cumulative, cumulative[-1] * percentile / 100))
+        return self.bin_edges[bin_index + 1] / SIM_HZ
+
+    def to_dict(self):
+        """Describe the results as JSON-compatible data"""
+        return {
+            'version': RESULTS_VERSION,
+            'player': self.player,
+            'max_frames': self.max_frames,
+            'bin_frames': self.bin_frames,
+            'next_seed': self.next_seed,
+            'levels': {
+                str(level): {
+                    'difficulty': stats['difficulty'],
+                    'outcomes': dict(stats['outcomes']),
+                    'death_causes': dict(stats['death_causes']),
+                    'clear_frames': stats['clear_frames'].tolist(),
+                    'death_frames': stats['death_frames'].tolist(),
+                    'seeds': [list(seed_range) for seed_range in stats['seeds']],
+                }
+                for level, stats in sorted(self.levels.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild results described by to_dict().
+
+        Args:
+            data: Dict returned by to_dict (e.g. read back from JSON)
+
+        Returns:
+            The DifficultyResults
+        """
+        if data.get('version') != RESULTS_VERSION:
+            raise ValueError(f"Results version {data.get('version')} is not supported (expected {RESULTS_VERSION})")
+        results = cls(data['player'], data['max_frames'], data['bin_frames'])
+        results.next_seed = data['next_seed']
+        for level, stats in data['levels'].items():
+            level_stats = results._level(int(level))
+            level_stats['outcomes'].update(stats['outcomes'])
+            level_stats['death_causes'].update(stats['death_causes'])
+            level_stats['clear_frames'] += np.array(stats['clear_frames'], dtype=np.int64)
+            level_stats['death_frames'] += np.array(stats['death_frames'], dtype=np.int64)
+            level_stats['seeds'] = _union_ranges(tuple(seed_range) for seed_range in stats['seeds'])
+        return results
+
+    def save(self, path):
+        """
+        Write the results to a JSON file.
+
+        Args:
+            path: Destination file path
+        """
+        # Write then rename, so an interrupted run never leaves half a file
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read results written by save().
+
+        Args:
+            path: Results file path
+
+        Returns:
+            The loaded DifficultyResults
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def estimate(seeds, levels=ALL_LEVELS, player='bot', workers=None, max_frames=ROLLOUT_MAX_FRAMES):
+    """
+    Play a batch of seeds on every level and collect difficulty statistics.
+
+    Args:
+        seeds: Level seeds to play
+        levels: Levels to play for each seed
+        player: Name of the PLAYERS entry to play the runs
+        workers: Worker processes (defaults to one per core; 0 plays in this process)
+        max_frames: Frames before a run counts as a timeout
+
+    Returns:
+        DifficultyResults for the batch
+    """
+    results = DifficultyResults(player, max_frames)
+    results.add(run_rollouts(seeds, levels, workers=workers, input_factory=PLAYERS[player],
+                             max_frames=max_frames))
+    return results
+
+
+def format_report(results):
+    """
+    Summarize results per level, easiest-generated levels first.
+
+    Args:
+        results: DifficultyResults to summarize
+
+    Returns:
+        List of report lines
+    """
+    lines = []
+    for level in sorted(results.levels, key=lambda level: (results.levels[level]['difficulty'], level)):
+        stats = results.levels[level]
+        line = (f"Level {level} (difficulty {stats['difficulty']}): {results.runs(level)} runs, "
+                f"{100 * results.clear_rate(level):.1f}% cleared")
+        median = results.clear_time(level)
+        if median is not None:
+            line += f", median clear {median:.0f}s (90% by {results.clear_time(level, 90):.0f}s)"
+        if stats['outcomes'][OUTCOME_TIMEOUT]:
+            line += f", {stats['outcomes'][OUTCOME_TIMEOUT]} timed out"
+        lines.append(line)
+        if stats['death_causes']:
+            causes = ', '.join(f"{cause} {count}" for cause, count in stats['death_causes'].most_common())
+            lines.append(f"    deaths: {causes}")
+    return lines
+
+
+def main(argv=None):
+    """Play a batch of seeds from the command line and merge it into the results file"""
+    parser = argparse.ArgumentParser(description="Estimate level difficulty by playing many seeds per level")
+    parser.add_argument('--seeds', type=int, default=100, help="Number of seeds to play")
+    parser.add_argument('--first-seed', type=int, default=None,
+                        help="First seed of the batch (default: after the seeds already in the results file)")
+    parser.add_argument('--levels', type=int, nargs='+', default=list(ALL_LEVELS), help="Levels to play")
+    parser.add_argument('--player', choices=sorted(PLAYERS), default='bot', help="Who plays the runs")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--max-frames', type=int, default=ROLLOUT_MAX_FRAMES, help="Frames before a run times out")
+    parser.add_argument('--results', default=DIFFICULTY_RESULTS_PATH, help="Results file to merge into")
+    args = parser.parse_args(argv)
+
+    previous = DifficultyResults.load(args.results) if os.path.exists(args.results) else None
+    first_seed = args.first_seed
+    if previous is not None:
+        try:
+            previous.check_compatible(args.player, args.max_frames, DIFFICULTY_BIN_FRAMES)
+        except ValueError as e:
+            print(f"[-] {e}")
+            return 1
+        if first_seed is None:
+            first_seed = previous.next_seed
+    first_seed = first_seed or 0
+    if previous is not None:
+        for level in args.levels:
+            seed = previous.first_played(level, first_seed, first_seed + args.seeds)
+            if seed is not None:
+                print(f"[-] Seed {seed} has already been played on level {level}; "
+                      f"choose a --first-seed of at least {previous.next_seed}")
+                return 1
+
+    start = time.perf_counter()
+    batch = estimate(range(first_seed, first_seed + args.seeds), args.levels, args.player, args.workers,
+                     args.max_frames)
+    elapsed = time.perf_counter() - start
+    print(f"[+] Played seeds {first_seed}-{first_seed + args.seeds - 1} on {len(args.levels)} levels "
+          f"in {elapsed:.1f}s")
+
+    # Read the file again just before writing it, in case another batch finished meanwhile
+    results = batch
+    if os.path.exists(args.results):
+        results = DifficultyResults.load(args.results)
+        try:
+            results.merge(batch)
+        except ValueError as e:
+            # Another batch played some of the same seeds while this one ran
+            print(f"[-] {e}; the batch was not saved")
+            return 1
+    results.save(args.results)
+    print(f"[+] Results saved to {args.results}")
+    for line in format_report(results):
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Dirty-rectangle tracking for the game renderer.
+While the camera is stationary only the regions covered by moving sprites
+and the HUD change between frames, so those regions are restored from a
+saved copy of the static scene and pushed to the display instead of
+redrawing and flipping the whole screen.
+"""
+
+import pygame
+from typing import List, Optional
+
+
+class DirtyRectTracker:
+    """Tracks which screen regions changed since the last frame"""
+
+    def __init__(self, screen_width, screen_height, max_rects=48):
+        """
+        Initialize the tracker.
+
+        Args:
+            screen_width: Width of the display surface
+            screen_height: Height of the display surface
+            max_rects: Above this many dirty rects a full flip is cheaper
+        """
+        self.screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.max_rects = max_rects
+        self.static_layer: Optional[pygame.Surface] = None
+        self._camera_pos = None
+        self._full_redraw = True
+        self._prev_rects: List[pygame.Rect] = []
+        self._rects: List[pygame.Rect] = []
+
+    def invalidate(self):
+        """Force the next frame to be fully redrawn (new level, screen change, etc.)"""
+        self._full_redraw = True
+
+    def begin_frame(self, camera_pos):
+        """
+        Start a new frame.
+
+        Args:
+            camera_pos: (x, y) camera position for this frame
+
+        Returns:
+            True if the static scene must be redrawn this frame
+        """
+        if camera_pos != self._camera_pos or self.static_layer is None:
+            self._full_redraw = True
+        self._camera_pos = camera_pos
+        self._rects = []
+        return self._full_redraw
+
+    def save_static_layer(self, surface):
+        """Remember the freshly drawn static scene so dirty regions can be restored from it"""
+        if self.static_layer is None or self.static_layer.get_size() != surface.get_size():
+            self.static_layer = surface.copy()
+        else:
+            self.static_layer.blit(surface, (0, 0))
+
+    def restore_static_layer(self, surface):
+        """Erase last frame's sprites by copying the static scene back over their regions"""
+        for rect in self._prev_rects:
+            surface.blit(self.static_layer, rect, rect)
+
+    def add(self, rect):
+        """Mark a screen region as changed this frame"""
+        rect = rect.clip(self.screen_rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def end_frame(self):
+        """
+        Finish the frame.
+
+        Returns:
+            List of rects to pass to pygame.display.update, or None if the
+            whole screen changed and should be flipped
+        """
+        full_redraw = self._full_redraw
+        changed = self._prev_rects + self._rects
+        self._prev_rects = self._rects
+        self._full_redraw = False
+        if full_redraw or len(changed) > self.max_rects:
+            return None
+        return changed
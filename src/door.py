@@ -41,6 +41,21 @@ class Door(pygame.sprite.Sprite):
             (2 * self.width // 3, self.height // 3)
         ])
 
+    def get_state(self):
+        """Return the door's mutable state as a tuple (see Game.snapshot)"""
+        return (self.unlocked, self.unlock_timer)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        unlocked, self.unlock_timer = state
+        # Only redraw when the lock state actually changes
+        if unlocked != self.unlocked:
+            self.unlocked = unlocked
+            if unlocked:
+                self._draw_unlocked_state()
+            else:
+                self._draw_locked_state()
+
     def unlock(self):
         """Unlock the door when all enemies are defeated"""
         self.unlocked = True
@@ -2,12 +2,20 @@ import pygame
 import math
 from settings import RED, ENEMY_SIZE, GRAVITY, WIDTH, HEIGHT, YELLOW, GREEN, BLACK
 from asset_loader import get_loader
+from physics import sweep_landing
+from collision import LAYER_PLAYER, LAYER_ATTACK, LAYER_ENEMY, LAYER_PROJECTILE
 
 class Projectile(pygame.sprite.Sprite):
+    collision_layer = LAYER_PROJECTILE
+    collision_mask = LAYER_PLAYER
+    _shared_image = None  # Every projectile looks the same, so they share one Surface
+    
     def __init__(self, x, y, vx, vy=0, dmg=10):
         super().__init__()
-        self.image = pygame.Surface((8, 8))
-        self.image.fill(YELLOW)
+        if Projectile._shared_image is None:
+            Projectile._shared_image = pygame.Surface((8, 8))
+            Projectile._shared_image.fill(YELLOW)
+        self.image = Projectile._shared_image
         self.rect = self.image.get_rect(center=(x, y))
         self.vx = vx
         self.vy = vy
@@ -21,19 +29,18 @@ class Projectile(pygame.sprite.Sprite):
 
 
 class Enemy(pygame.sprite.Sprite):
-    # Class variable to track how many enemies are currently attacking
-    currently_attacking = 0
-    max_attacking = 2  # Maximum 2 enemies can attack at a time
+    collision_layer = LAYER_ENEMY
+    collision_mask = LAYER_PLAYER | LAYER_ATTACK
     
     def __init__(self, x, y, pattern='patrol', bounds=None, speed=2, health=45, melee_damage=10, ranged=False, color=RED):
         super().__init__()
         
         # Try to load enemy sprite from assets
         loader = get_loader()
-        enemy_sprite = loader.get_enemy_sprite('forest_creature')
+        # Scaled once by the loader and shared between all enemies
+        enemy_sprite = loader.get_variant('enemies/forest_creature.png', (ENEMY_SIZE, ENEMY_SIZE))
         if enemy_sprite is not None:
-            # Scale sprite to match enemy dimensions
-            self.image = pygame.transform.scale(enemy_sprite, (ENEMY_SIZE, ENEMY_SIZE))
+            self.image = enemy_sprite
             print(f"✓ Enemy sprite loaded successfully ({ENEMY_SIZE}x{ENEMY_SIZE})")
         else:
             # Fallback: draw colored sprite
@@ -93,7 +100,21 @@ class Enemy(pygame.sprite.Sprite):
         if health_width > 0:
             pygame.draw.rect(surface, GREEN, (bar_x, bar_y, health_width, bar_height))
 
+    def get_state(self):
+        """Return the enemy's mutable state as a tuple (see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.health, self.vx, self.vy, self.fire_cooldown,
+                self.sine_offset, self.hop_cooldown, self.is_attacking)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        (self.rect.x, self.rect.y, self.health, self.vx, self.vy, self.fire_cooldown,
+         self.sine_offset, self.hop_cooldown, self.is_attacking) = state
+        self.hitbox = self.rect.copy()
+
     def update(self, player, platforms, projectiles_group=None):
+        # Where the step started, for the swept platform landing
+        prev_left = self.rect.left
+        
         # movement patterns
         if self.pattern == 'patrol':
             self.rect.x += self.vx
@@ -154,21 +175,18 @@ class Enemy(pygame.sprite.Sprite):
 
         # Apply gravity and platform collision for all enemies
         self.apply_gravity()
+        prev_bottom = self.rect.bottom
         self.rect.y += self.vy
         on_platform = False
         
-        for p in platforms:
-            # Use a slightly expanded platform rect for collision to avoid missing edge cases
-            check_rect = p.rect.inflate(0, 2)
-            
-            if self.rect.colliderect(check_rect):
-                if self.vy >= 0:  # Only collide when falling down or stationary
-                    # Land on platform
-                    self.rect.bottom = p.rect.top
-                    self.vy = 0
-                    on_platform = True
-                    self.current_platform = p
-                    break  # Don't check other platforms once landed
+        # Use a slightly expanded platform rect for collision to avoid missing edge cases
+        if self.vy >= 0:  # Only collide when falling down or stationary
+            p = sweep_landing(platforms, self.rect, prev_bottom, inflate=2, prev_left=prev_left)
+            if p is not None:
+                # Landed on platform
+                self.vy = 0
+                on_platform = True
+                self.current_platform = p
 
         # Prevent enemies from falling off screen
         if self.rect.bottom > HEIGHT:
@@ -194,8 +212,11 @@ class Enemy(pygame.sprite.Sprite):
             if self.fire_cooldown <= 0:
                 dx = player.rect.centerx - self.rect.centerx
                 dir = 1 if dx > 0 else -1
-                proj = Projectile(self.rect.centerx + dir * ENEMY_SIZE // 2, self.rect.centery, vx=dir * 6, dmg=8)
-                projectiles_group.add(proj)
+                if hasattr(projectiles_group, 'spawn'):
+                    projectiles_group.spawn(self.rect.centerx + dir * ENEMY_SIZE // 2, self.rect.centery, vx=dir * 6, dmg=8)
+                else:
+                    proj = Projectile(self.rect.centerx + dir * ENEMY_SIZE // 2, self.rect.centery, vx=dir * 6, dmg=8)
+                    projectiles_group.add(proj)
                 self.fire_cooldown = 60
             else:
                 self.fire_cooldown -= 1
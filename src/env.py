@@ -0,0 +1,239 @@
+"""
+Gym-style environment around the headless game.
+An agent resets the environment to a level and then steps it with one
+discrete action at a time, getting back an observation vector, a reward,
+a done flag and an info dict. Nothing is drawn: every step is a plain
+Game.update() with the action's buttons held, and resets restore a cached
+start-of-level snapshot instead of rebuilding the level.
+"""
+
+import contextlib
+import random
+from collections import OrderedDict
+import numpy as np
+from settings import (WIDTH, HEIGHT, GAME_STATE_PLAYING, GAME_STATE_LEVEL_COMPLETE,
+                      ENV_MAX_STEPS, ENV_FRAME_SKIP, ENV_START_CACHE_SIZE)
+from input_source import ActionInput, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_DOWN, INPUT_ATTACK
+from game import Game
+
+# Discrete actions, as the buttons held for the step
+ACTIONS = (
+    0,
+    INPUT_LEFT,
+    INPUT_RIGHT,
+    INPUT_JUMP,
+    INPUT_LEFT | INPUT_JUMP,
+    INPUT_RIGHT | INPUT_JUMP,
+    INPUT_ATTACK,
+    INPUT_LEFT | INPUT_ATTACK,
+    INPUT_RIGHT | INPUT_ATTACK,
+    INPUT_DOWN,
+)
+
+# Nearest enemies and projectiles included in an observation
+OBS_ENEMIES = 4
+OBS_PROJECTILES = 4
+
+# Observation layout: player, nearest enemies, nearest projectiles, door, enemies left
+OBS_PLAYER_SIZE = 8
+OBS_ENEMY_SIZE = 4
+OBS_PROJECTILE_SIZE = 4
+OBS_DOOR_SIZE = 3
+OBSERVATION_SIZE = (OBS_PLAYER_SIZE + OBS_ENEMIES * OBS_ENEMY_SIZE +
+                    OBS_PROJECTILES * OBS_PROJECTILE_SIZE + OBS_DOOR_SIZE + 1)
+
+# Rewards
+REWARD_ENEMY_DAMAGE = 0.01       # Per point of damage dealt to enemies
+REWARD_ENEMY_KILLED = 1.0
+REWARD_DAMAGE_TAKEN = -0.01      # Per point of damage taken
+REWARD_LEVEL_COMPLETE = 10.0
+REWARD_DEATH = -10.0
+
+_ZEROS = (0.0,) * OBSERVATION_SIZE
+
+
+class GameEnv:
+    """Steps a headless Game with discrete actions for learning agents"""
+
+    def __init__(self, max_steps=ENV_MAX_STEPS, frame_skip=ENV_FRAME_SKIP, quiet=True, seed=None,
+                 start_cache_size=ENV_START_CACHE_SIZE):
+        """
+        Initialize the environment. The game is created on the first reset().
+
+        Args:
+            max_steps: Steps before an episode is cut off (None for no limit)
+            frame_skip: Simulation steps each action is held for
+            quiet: If True, silence the game's console messages
+            seed: Seeds the level seeds reset() picks when given none
+            start_cache_size: Start-of-level snapshots kept for resets
+        """
+        self.max_steps = max_steps
+        self.frame_skip = frame_skip
+        self.quiet = quiet
+        self.n_actions = len(ACTIONS)
+        self.observation_size = OBSERVATION_SIZE
+        self.input = ActionInput()
+        self.game = None
+        self.steps = 0
+        self._seeds = random.Random(seed)
+        # Start-of-level snapshots keyed by (seed, level), least recently used first
+        self._starts = OrderedDict()
+        self.start_cache_size = start_cache_size
+        # Both contexts are reusable, so one is made up front rather than per step
+        self._silenced = contextlib.redirect_stdout(None)
+        self._unsilenced = contextlib.nullcontext()
+
+    def _output(self):
+        """Context in which the game's prints are silenced if quiet"""
+        return self._silenced if self.quiet else self._unsilenced
+
+    def reset(self, seed=None, level=1):
+        """
+        Start a new episode.
+
+        Args:
+            seed: Level seed (a random one if None)
+            level: Level to play
+
+        Returns:
+            The first observation
+        """
+        with self._output():
+            return np.array(self._reset(seed, level), dtype=np.float32)
+
+    def _reset(self, seed, level):
+        """reset() without silencing, returning the observation as a list"""
+        if seed is None:
+            seed = self._seeds.randrange(100000)
+        key = (seed, level)
+        start = self._starts.get(key)
+        if start is not None:
+            self._starts.move_to_end(key)
+            self.game.restore(start)
+        else:
+            # A level seen for the first time starts like a new game on it
+            if self.game is None:
+                self.game = Game(level=level, seed=seed, headless=True, input_source=self.input)
+            else:
+                self.game.reset(level=level, seed=seed)
+            self._starts[key] = self.game.snapshot()
+            if len(self._starts) > self.start_cache_size:
+                self._starts.popitem(last=False)
+        self.input.buttons = 0
+        self.steps = 0
+        self._enemy_health = self._total_enemy_health()
+        return self._observation()
+
+    def step(self, action):
+        """
+        Hold an action's buttons for frame_skip simulation steps.
+
+        Args:
+            action: Index into ACTIONS
+
+        Returns:
+            (observation, reward, done, info)
+        """
+        with self._output():
+            obs, reward, done, info = self._step(action)
+        return np.array(obs, dtype=np.float32), reward, done, info
+
+    def _step(self, action):
+        """step() without silencing, returning the observation as a list"""
+        game = self.game
+        player = game.player
+        self.input.buttons = ACTIONS[action]
+        health = player.health
+        enemies = len(game.enemies)
+        for _ in range(self.frame_skip):
+            game.update()
+            if game.game_state != GAME_STATE_PLAYING:
+                break
+        self.steps += 1
+
+        state = game.game_state
+        enemies_left = len(game.enemies)
+        enemy_health = self._total_enemy_health()
+        reward = (REWARD_ENEMY_DAMAGE * (self._enemy_health - enemy_health) +
+                  REWARD_ENEMY_KILLED * (enemies - enemies_left) +
+                  REWARD_DAMAGE_TAKEN * max(0, health - player.health))
+        self._enemy_health = enemy_health
+
+        # The boss level ends in the game-over state even when it was won
+        playing = state == GAME_STATE_PLAYING
+        won = state == GAME_STATE_LEVEL_COMPLETE or (not playing and player.health > 0)
+        if won:
+            reward += REWARD_LEVEL_COMPLETE
+        elif not playing:
+            reward += REWARD_DEATH
+        truncated = playing and self.max_steps is not None and self.steps >= self.max_steps
+        done = not playing or truncated
+        info = {
+            'level': game.level,
+            'health': player.health,
+            'enemies_left': enemies_left,
+            'steps': self.steps,
+            'success': won,
+            'truncated': truncated,
+        }
+        return self._observation(), reward, done, info
+
+    def _total_enemy_health(self):
+        """Sum of the living enemies' health"""
+        return sum([enemy.health for enemy in self.game.enemies.sprites()])
+
+    def _observation(self):
+        """
+        Build the observation vector. Positions are relative to the player and
+        scaled by the screen size; missing enemies or projectiles are zeros.
+
+        Returns:
+            List of OBSERVATION_SIZE floats
+        """
+        game = self.game
+        player = game.player
+        px, py = player.rect.center
+        # Built as a list and converted once (for a batch of environments,
+        # see vector_env); item assignment into a NumPy array costs more
+        obs = [px / WIDTH, py / HEIGHT, player.vel_x / 10, player.vel_y / 20,
+               player.health / player.max_health, float(player.on_ground),
+               1.0 if player.facing_right else -1.0, float(player.attack_cooldown <= 0)]
+
+        # Offsets are worked out once per enemy; the index breaks distance ties
+        nearest = []
+        for i, enemy in enumerate(game.enemies.sprites()):
+            ex, ey = enemy.rect.center
+            dx = ex - px
+            dy = ey - py
+            nearest.append((dx * dx + dy * dy, i, dx, dy, enemy))
+        nearest.sort()
+        enemies_left = len(nearest)
+        for _, _, dx, dy, enemy in nearest[:OBS_ENEMIES]:
+            obs += (dx / WIDTH, dy / HEIGHT, enemy.health / enemy.max_health, 1.0)
+        obs += _ZEROS[:(OBS_ENEMIES - min(enemies_left, OBS_ENEMIES)) * OBS_ENEMY_SIZE]
+
+        projectiles = game.projectiles
+        n = projectiles.count
+        shown = 0
+        if n:
+            # There are only ever a few projectiles, so the arithmetic is done
+            # on plain floats; NumPy's per-call overhead would dominate
+            half = projectiles.size / 2
+            cx = px - half
+            cy = py - half
+            dx = [(x - cx) / WIDTH for x in projectiles.x[:n].tolist()]
+            dy = [(y - cy) / HEIGHT for y in projectiles.y[:n].tolist()]
+            vx = projectiles.vx[:n].tolist()
+            nearest = sorted(range(n), key=lambda i: dx[i] * dx[i] + dy[i] * dy[i])[:OBS_PROJECTILES]
+            for i in nearest:
+                obs += (dx[i], dy[i], vx[i] / 10, 1.0)
+            shown = len(nearest)
+        obs += _ZEROS[:(OBS_PROJECTILES - shown) * OBS_PROJECTILE_SIZE]
+
+        for door in game.doors:
+            obs += ((door.rect.centerx - px) / WIDTH, (door.rect.centery - py) / HEIGHT, float(door.unlocked))
+            break
+        else:
+            obs += _ZEROS[:OBS_DOOR_SIZE]
+        obs.append(enemies_left)
+        return obs
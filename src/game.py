@@ -2,38 +2,118 @@ import pygame
 import sys
 import os
 import random
-from settings import (WIDTH, HEIGHT, LEVEL_HEIGHT, WHITE, BLACK, FPS, GAME_STATE_PLAYING, 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from settings import (WIDTH, HEIGHT, LEVEL_HEIGHT, WHITE, BLACK, FPS, SIM_DT_MS, MAX_SIM_STEPS_PER_FRAME, GAME_STATE_PLAYING, 
                       GAME_STATE_GAMEOVER, GAME_STATE_LEVEL_COMPLETE, GAME_STATE_BOSS_STAGE,
                       NUM_REGULAR_LEVELS, BOSS_LEVEL, ENEMY_COLORS, ENEMY_SIZE,
-                      CAMERA_SMOOTH_ENABLED, CAMERA_SMOOTH_FACTOR, CAMERA_PLAYER_OFFSET, CAMERA_DEADZONE)
+                      CAMERA_SMOOTH_ENABLED, CAMERA_SMOOTH_FACTOR, CAMERA_PLAYER_OFFSET, CAMERA_DEADZONE,
+                      DIRTY_RECT_RENDERING, MAX_ENEMIES_ATTACKING, TERRAIN_ATTEMPTS)
 from camera import Camera
+from hud import HUD, TextCache
+from parallax import ParallaxLayer, load_background_image
+from dirty_rects import DirtyRectTracker
+from collision import (CollisionPipeline, LAYER_PLAYER, LAYER_ATTACK, LAYER_ENEMY, LAYER_PROJECTILE,
+                       LAYER_OBSTACLE, LAYER_PICKUP, LAYER_POWERUP, LAYER_TREASURE)
+from platform_index import PlatformIndex
+from game_clock import RealTimeClock
+from input_source import KeyboardInput
 from player import Player
 from platform import Platform
-from enemies import Enemy, Projectile
+from enemies import Enemy
 from boss import Boss
 from obstacles import spike, fire, slow_trap, slippery, block, falling_rock, spike_row, poison_pool, electric, healing_plant, bouncy
 from door import Door
 from treasure import Treasure
 from health_pickup import HealthPickup
 from powerup import ArmorPowerUp, AttackPowerUp, SpeedPowerUp
-from utils import generate_terrain, generate_obstacles
+from utils import generate_terrain, generate_obstacles, level_difficulty
+from level_cache import get_level_cache, describe_level, rehydrate_level
+from level_state import LevelState
+
+# Bump whenever the snapshot layout changes, so stale snapshots are rejected
+SNAPSHOT_VERSION = 2
+
+# Level groups whose members can be killed, restored by membership in snapshots
+SNAPSHOT_GROUPS = ('enemies', 'obstacles', 'health_pickups', 'powerups', 'treasures', 'doors')
+
+# Damage sources recorded on the player (obstacles report their sprite type)
+DAMAGE_ENEMY = 'enemy'
+DAMAGE_PROJECTILE = 'projectile'
+DAMAGE_BOSS = 'boss phase {}'
+
+# SDL drivers pointed at 'dummy' while a headless game initializes pygame
+HEADLESS_DRIVERS = ('SDL_VIDEODRIVER', 'SDL_AUDIODRIVER')
 
 
 class Game:
-    def __init__(self, level=1, seed=None):
-        pygame.init()
-        pygame.mixer.init()  # Initialize sound system
+    def __init__(self, level=1, seed=None, headless=False, clock=None, input_source=None, level_cache=None):
+        """
+        Initialize the game.
+        
+        Args:
+            level: Level to start on
+            seed: Random seed for level generation (random if None)
+            headless: If True, run without a window, sound or drawing so the
+                      simulation can be stepped as fast as possible with step().
+                      Choose it before pygame is first initialized: the dummy
+                      video and audio drivers are only used by the game that
+                      initializes pygame's display, and whichever drivers that
+                      game picks stay in use for the rest of the process.
+            clock: Clock driving run() (see game_clock); defaults to a
+                   RealTimeClock. Use a time-warped or unthrottled clock to
+                   play faster than real time.
+            input_source: Where the player's buttons come from (see
+                          input_source); defaults to the keyboard
+            level_cache: LevelCache generated levels are kept in; defaults
+                         to the one shared by every game in the process
+        """
+        self.headless = headless
+        if headless and not pygame.display.get_init():
+            # Dummy drivers are only read when pygame first initializes the
+            # display, so they are set for this call and the process's own
+            # settings put back for anything started later
+            saved = {name: os.environ.get(name) for name in HEADLESS_DRIVERS}
+            os.environ.update(dict.fromkeys(HEADLESS_DRIVERS, 'dummy'))
+            try:
+                pygame.init()
+            finally:
+                for name, value in saved.items():
+                    if value is None:
+                        del os.environ[name]
+                    else:
+                        os.environ[name] = value
+        else:
+            pygame.init()
+        if not headless:
+            pygame.mixer.init()  # Initialize sound system
+        # A (dummy) display is still needed so surfaces can be converted
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Modular Pygame Game - Level Progression")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.clock = clock if clock is not None else RealTimeClock()
+        self.input_source = input_source if input_source is not None else KeyboardInput()
+        if headless:
+            # Nothing is drawn in headless mode, so skip font loading
+            self.font = None
+            self.small_font = None
+            self.large_font = None
+        else:
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 24)
+            self.large_font = pygame.font.Font(None, 80)
+        # Rendered text is cached by content; the HUD re-renders only on change
+        self.text_cache = TextCache()
+        self.hud = HUD(self.font, self.small_font, self.text_cache)
         
         self.level = level
         self.seed = seed if seed is not None else random.randint(0, 100000)
         self.game_state = GAME_STATE_PLAYING
         self.collected_stickers = set()  # Track collected treasure stickers
         
+        # Enemies hurting the player on contact this frame (at most max_enemies_attacking)
+        self.enemies_attacking = 0
+        self.max_enemies_attacking = MAX_ENEMIES_ATTACKING
+        
         # Initialize camera for vertical scrolling
         self.camera = Camera(
             level_width=WIDTH,
@@ -44,14 +124,43 @@ class Game:
             smooth_factor=CAMERA_SMOOTH_FACTOR
         )
         self.camera.set_player_tracking(CAMERA_PLAYER_OFFSET, CAMERA_DEADZONE)
+        self._camera_start = self.camera.get_state()
+        
+        # Render interpolation between fixed simulation steps (see run())
+        self.render_alpha = 1.0
+        self._prev_positions = {}
+        self._prev_camera = None
+        
+        # Optional dirty-rect rendering: repaint only changed regions while
+        # the camera is stationary (see draw_game)
+        self.dirty_rect_rendering = DIRTY_RECT_RENDERING
+        self.dirty_tracker = DirtyRectTracker(WIDTH, HEIGHT)
+        self._tracking_dirty = False
+        
+        # Collisions are resolved by one pipeline with a (layer, layer) handler table
+        self.collisions = CollisionPipeline()
+        self._register_collision_handlers()
+        
+        # Generated levels are shared through the (memory and disk) level cache
+        self.level_cache = level_cache if level_cache is not None else get_level_cache()
+        
+        # Underground layer is rendered once per level, on first use
+        self.underground_layer = None
+        self._underground_key = None
         
         # Music handling
         self.victory_music_playing = False
-        self.try_load_victory_music()
+        self.victory_music_path = None
+        if not headless:
+            self.try_load_victory_music()
         
-        # Load level background
+        # Level background is loaded by init_level
         self.background_image = None
-        self.load_background()
+        self.parallax_layers = []
+        
+        # The next level is built in the background during the level-complete screen
+        self._prefetch_executor = None
+        self._prefetch = None
         
         # Initialize the level after setting up music
         self.init_level()
@@ -82,16 +191,30 @@ class Game:
             return False
 
     def load_background(self):
-        """Load level-specific background image"""
+        """Load level-specific background image and build its parallax layers"""
+        self.background_image = self._load_background_image(self.level)
+        self.parallax_layers = self._build_parallax_layers(self.level, self.background_image)
+        return self.background_image is not None
+
+    def _load_background_image(self, level):
+        """
+        Load a level's background image.
+        
+        Args:
+            level: Level number
+        
+        Returns:
+            Background surface scaled to the screen, or None to use fallback colors
+        """
         try:
             # Determine which background to load based on level
-            if self.level == 1:
+            if level == 1:
                 bg_name = 'swamp.png'
-            elif self.level == 2:
+            elif level == 2:
                 bg_name = 'jungle.png'
-            elif self.level == 3:
+            elif level == 3:
                 bg_name = 'forest.png'
-            elif self.level == BOSS_LEVEL:
+            elif level == BOSS_LEVEL:
                 bg_name = 'cave.png'
             else:
                 bg_name = 'swamp.png'  # Default fallback
@@ -104,120 +227,194 @@ class Game:
             
             for path in possible_paths:
                 if os.path.exists(path):
-                    self.background_image = pygame.image.load(path).convert()
-                    # Scale to screen size
-                    self.background_image = pygame.transform.scale(self.background_image, (WIDTH, HEIGHT))
-                    print(f"[+] Background loaded for level {self.level}: {path}")
-                    return True
+                    # Loaded and scaled to screen size once, then shared
+                    background_image = load_background_image(path, WIDTH, HEIGHT)
+                    print(f"[+] Background loaded for level {level}: {path}")
+                    return background_image
             
-            print(f"[-] Background not found for level {self.level}, will use fallback colors")
-            self.background_image = None
-            return False
+            print(f"[-] Background not found for level {level}, will use fallback colors")
+            return None
         except Exception as e:
             print(f"[-] Error loading background: {e}")
-            self.background_image = None
-            return False
+            return None
 
     def init_level(self):
         """Initialize a new level with procedurally generated terrain and obstacles"""
+        self._start_level(self.build_level(self.level))
+    
+    def build_level(self, level):
+        """
+        Build a level without touching the one being played, so it can run
+        on a worker thread (see _prefetch_next_level).
+        
+        Args:
+            level: Level number to build
+        
+        Returns:
+            LevelState holding the new level
+        """
+        state = LevelState(level)
+        
         # Load background for the new level
-        self.load_background()
+        state.background_image = self._load_background_image(level)
+        state.parallax_layers = self._build_parallax_layers(level, state.background_image)
         
         # Player starts at the bottom of the level (in world coordinates), not screen coordinates
-        self.player = Player(WIDTH // 2, LEVEL_HEIGHT - 120)
-        self.platforms = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
-        self.obstacles = pygame.sprite.Group()
-        self.treasures = pygame.sprite.Group()
-        self.health_pickups = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.doors = pygame.sprite.Group()
-        self.boss = None
-        self.enemies_defeated = False
-        
-        is_boss = (self.level == BOSS_LEVEL)
+        state.player = Player(WIDTH // 2, LEVEL_HEIGHT - 120)
+        
+        # Levels are generated once per (seed, level) and rebuilt from the cache after that
+        description = self.level_cache.get(self.seed, level)
+        if description is not None:
+            rehydrate_level(state, description)
+            state.platform_index = PlatformIndex(state.platforms)
+        else:
+            self._generate_level(state)
+            self.level_cache.put(self.seed, level, describe_level(state))
+        
+        # Platforms never move, so compose them once into a single canvas
+        if not self.headless:
+            state.level_canvas = self._build_level_canvas(state.platforms)
+            state.underground_layer = self._build_underground_layer(level)
+        
+        state.all_sprites = pygame.sprite.Group(state.player, *state.platforms, *state.enemies, 
+                                                *state.obstacles, *state.treasures, *state.health_pickups, 
+                                                *state.powerups, *state.doors)
+        if state.boss:
+            state.all_sprites.add(state.boss)
+        return state
+    
+    def _start_level(self, state):
+        """Swap a built level in as the one being played"""
+        state.apply_to(self)
+        self.player.input_source = self.input_source
+        # Every sprite the level starts with, so snapshots can refer to (and revive) them by index
+        self._roster = {name: list(getattr(self, name)) for name in SNAPSHOT_GROUPS + ('platforms',)}
+        self._roster_ids = {name: {sprite: i for i, sprite in enumerate(sprites)}
+                            for name, sprites in self._roster.items()}
+        self._underground_key = (self.level, self.seed) if self.underground_layer is not None else None
+        # A boss victory countdown from an earlier game must not carry over
+        if hasattr(self, 'boss_defeated_timer'):
+            del self.boss_defeated_timer
+        # Positions from the previous level must not be interpolated from
+        self._prev_positions = {}
+        self._prev_camera = None
+        self.dirty_tracker.invalidate()
+    
+    def _generate_level(self, state):
+        """Procedurally generate a level's terrain, enemies and items"""
+        is_boss = (state.level == BOSS_LEVEL)
         
         # Generate terrain
-        difficulty = min(1 + (self.level - 1) // 3, 3)
-        platforms_list = generate_terrain(seed=self.seed + self.level, difficulty=difficulty, is_boss=is_boss)
+        difficulty = level_difficulty(state.level)
+        terrain_seed = self.seed + state.level
+        for attempt in range(TERRAIN_ATTEMPTS):
+            try:
+                platforms_list = generate_terrain(seed=terrain_seed, difficulty=difficulty, is_boss=is_boss,
+                                                  rng=state.rng)
+                break
+            except ValueError as e:
+                # A layout with a platform the player cannot get onto is rejected
+                if attempt == TERRAIN_ATTEMPTS - 1:
+                    raise
+                print(f"[-] Level {state.level} terrain rejected ({e}), trying seed {terrain_seed + 1}")
+                terrain_seed += 1
         for platform in platforms_list:
-            self.platforms.add(platform)
+            state.platforms.add(platform)
+        # Platforms are static, so index them once for ground queries
+        state.platform_index = PlatformIndex(state.platforms)
         
         if is_boss:
-            self.init_boss_level(difficulty)
+            self.init_boss_level(state, difficulty)
         else:
-            self.init_regular_level(difficulty)
+            self.init_regular_level(state, difficulty)
         
         # Generate obstacles for regular levels (4-6 obstacles instead of 10 to reduce clutter)
         if not is_boss:
-            obstacles_count = random.randint(4, 6)
-            obstacles_list = generate_obstacles(seed=self.seed + self.level * 100, count=obstacles_count, difficulty=difficulty)
+            obstacles_count = state.rng.randint(4, 6)
+            obstacles_list = generate_obstacles(seed=self.seed + state.level * 100, count=obstacles_count,
+                                                difficulty=difficulty, rng=state.rng)
             for obstacle in obstacles_list:
-                self.obstacles.add(obstacle)
+                state.obstacles.add(obstacle)
         
         # Add health pickups (1-3 per level, placed in challenging but accessible spots)
-        self._spawn_health_pickups(difficulty)
+        self._spawn_health_pickups(state, difficulty)
         
         # Add power-ups (1-2 per level)
-        self._spawn_powerups(difficulty)
+        self._spawn_powerups(state, difficulty)
         
         # Door spawn: at top of level on the highest platform
-        self._spawn_door()
+        self._spawn_door(state)
         
         # Treasure spawn: only one per level, spawns after enemies defeated (starts hidden)
-        self._spawn_treasure()
+        self._spawn_treasure(state)
+    
+    def _build_level_canvas(self, platforms):
+        """
+        Pre-render all static level geometry (platforms) into one
+        WIDTH x LEVEL_HEIGHT surface so drawing it costs a single blit.
         
-        self.all_sprites = pygame.sprite.Group(self.player, *self.platforms, *self.enemies, 
-                                               *self.obstacles, *self.treasures, *self.health_pickups, 
-                                               *self.powerups, *self.doors)
-        if self.boss:
-            self.all_sprites.add(self.boss)
+        Args:
+            platforms: Platforms of the level
+        
+        Returns:
+            The level canvas surface
+        """
+        # A colorkeyed RLE surface blits far faster than per-pixel alpha when
+        # most of the canvas is empty
+        canvas_key = (255, 0, 255)
+        canvas = pygame.Surface((WIDTH, LEVEL_HEIGHT))
+        canvas.fill(canvas_key)
+        for platform in platforms:
+            canvas.blit(platform.image, platform.rect)
+        canvas.set_colorkey(canvas_key, pygame.RLEACCEL)
+        return canvas
     
-    def _spawn_health_pickups(self, difficulty):
+    def _spawn_health_pickups(self, state, difficulty):
         """Spawn 1-3 health pickups at challenging but accessible locations"""
-        num_pickups = random.randint(1, 3)
+        rng = state.rng
+        num_pickups = rng.randint(1, 3)
         for _ in range(num_pickups):
             # Place pickups at various heights and x positions
-            x = random.randint(100, WIDTH - 100)
-            y = random.randint(150, HEIGHT - 200)
-            heal_amount = random.randint(10, 30)
+            x = rng.randint(100, WIDTH - 100)
+            y = rng.randint(150, HEIGHT - 200)
+            heal_amount = rng.randint(10, 30)
             pickup = HealthPickup(x, y, heal_amount=heal_amount)
-            self.health_pickups.add(pickup)
+            state.health_pickups.add(pickup)
     
-    def _spawn_powerups(self, difficulty):
+    def _spawn_powerups(self, state, difficulty):
         """Spawn 1-2 power-ups at random locations"""
-        num_powerups = random.randint(1, 2)
+        rng = state.rng
+        num_powerups = rng.randint(1, 2)
         powerup_types = [ArmorPowerUp, AttackPowerUp, SpeedPowerUp]
         
         for _ in range(num_powerups):
-            x = random.randint(100, WIDTH - 100)
-            y = random.randint(150, HEIGHT - 200)
-            powerup_class = random.choice(powerup_types)
+            x = rng.randint(100, WIDTH - 100)
+            y = rng.randint(150, HEIGHT - 200)
+            powerup_class = rng.choice(powerup_types)
             powerup = powerup_class(x, y, duration=300)  # 300 frames = 5 seconds at 60 FPS
-            self.powerups.add(powerup)
+            state.powerups.add(powerup)
     
-    def _spawn_door(self):
+    def _spawn_door(self, state):
         """Spawn door sitting ON the topmost platform"""
         # Find the topmost platform and place door on top of it
-        topmost_platform = min(self.platforms, key=lambda p: p.rect.y)
+        topmost_platform = state.platform_index.topmost()
         door_width = 50
         door_height = 80
         # Place door ON the platform (door's bottom sits on platform's top)
         door_x = topmost_platform.rect.centerx - door_width // 2
         door_y = topmost_platform.rect.top - door_height  # Door sits on top
         door = Door(door_x, door_y, width=door_width, height=door_height)
-        self.doors.add(door)
+        state.doors.add(door)
     
-    def _spawn_treasure(self):
+    def _spawn_treasure(self, state):
         """Spawn one treasure at the middle of the level, hidden until enemies defeated"""
         treasure_x = WIDTH // 2
         treasure_y = HEIGHT // 2
-        treasure = Treasure(treasure_x, treasure_y, sticker_id=self.level - 1)
+        treasure = Treasure(treasure_x, treasure_y, sticker_id=state.level - 1)
         treasure.hide()  # Hide until enemies are defeated
-        self.treasures.add(treasure)
+        state.treasures.add(treasure)
 
-    def init_regular_level(self, difficulty):
+    def init_regular_level(self, state, difficulty):
         """Initialize a regular level with multiple enemies"""
         # Spawn enemies with color variations (4-7 per level)
         enemy_count = 4 + difficulty
@@ -232,16 +429,185 @@ class Game:
             
             e = Enemy(x, y, pattern=pattern, bounds=(x - 100, x + 100), 
                      speed=speed, health=health, ranged=ranged, color=color)
-            self.enemies.add(e)
+            state.enemies.add(e)
 
-    def init_boss_level(self, difficulty):
+    def init_boss_level(self, state, difficulty):
         """Initialize the boss level"""
         # Spawn boss in center
         boss_x = WIDTH // 2 - ENEMY_SIZE
         boss_y = HEIGHT // 2
-        self.boss = Boss(boss_x, boss_y)
-        self.enemies.add(self.boss)
+        state.boss = Boss(boss_x, boss_y)
+        state.enemies.add(state.boss)
+
+    def reset(self, level=1, seed=None):
+        """
+        Start a new game on a level, keeping the window, fonts, HUD and run
+        settings. Only the level is built; pygame is not initialized again,
+        so this is cheap enough to call for every episode of a batch run.
+        
+        Args:
+            level: Level to start on
+            seed: Random seed for level generation (random if None)
+        """
+        self.seed = seed if seed is not None else random.randint(0, 100000)
+        self.game_state = GAME_STATE_PLAYING
+        self.collected_stickers = set()
+        self.enemies_attacking = 0
+        self.camera.set_state(self._camera_start)
+        self.render_alpha = 1.0
+        self.victory_music_playing = False
+        # A level prefetched for the previous game must not be swapped in
+        self._prefetch = None
+        self._start_level(self.build_level(level))
+    
+    def restart(self):
+        """Restart the game from level 1, keeping the same run settings"""
+        self.reset(level=1)
 
+    def set_input_source(self, input_source):
+        """
+        Change where the player's buttons come from, e.g. to start recording.
+        
+        Args:
+            input_source: Object whose read() returns a button bitmask (see input_source)
+        """
+        self.input_source = input_source
+        self.player.input_source = input_source
+    
+    def snapshot(self):
+        """
+        Capture the complete simulation state: level progress, every entity,
+        projectiles, the camera, the enemy attack counter and the level's
+        random generator.
+        
+        Returns:
+            Compact bytes blob that restore() accepts, on this or another
+            Game instance. The blob is a pickle, so keep it in memory or
+            trusted storage; files meant to be shared, such as replays,
+            should store the state as plain data instead.
+        """
+        player = self.player
+        enemy_ids = self._roster_ids['enemies']
+        platform_ids = self._roster_ids['platforms']
+        attacks = tuple((attack.get_state(), tuple(sorted(enemy_ids[enemy] for enemy in attack.hit_enemies)))
+                        for attack in player.attacks)
+        groups = tuple(tuple((self._roster_ids[name][sprite], sprite.get_state()) for sprite in getattr(self, name))
+                       for name in SNAPSHOT_GROUPS)
+        # Enemies keep a reference to the platform they stand on
+        enemy_platforms = tuple(platform_ids.get(getattr(enemy, 'current_platform', None), -1)
+                                for enemy in self.enemies)
+        state = (SNAPSHOT_VERSION, self.seed, self.level, self.game_state, self.enemies_defeated,
+                 getattr(self, 'boss_defeated_timer', None), tuple(sorted(self.collected_stickers)),
+                 self.enemies_attacking, self.rng.getstate(), self.camera.get_state(),
+                 player.get_state(), attacks, self.projectiles.get_state(), groups, enemy_platforms)
+        return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+    
+    def restore(self, blob):
+        """
+        Return to a state captured by snapshot(). Restoring within the same
+        level only resets existing objects, so it is cheap enough to call
+        every frame; a snapshot of another level rebuilds that level first.
+        
+        Only restore blobs this program produced (or ones from an equally
+        trusted source): the blob is unpickled, and unpickling untrusted
+        data can run arbitrary code.
+        
+        Args:
+            blob: Bytes returned by snapshot()
+        """
+        (version, seed, level, game_state, enemies_defeated, boss_defeated_timer, stickers,
+         enemies_attacking, random_state, camera_state, player_state, attacks, projectiles,
+         groups, enemy_platforms) = pickle.loads(blob)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot version {version} is not supported (expected {SNAPSHOT_VERSION})")
+        
+        if seed != self.seed or level != self.level:
+            self.seed = seed
+            self._start_level(self.build_level(level))
+        self.game_state = game_state
+        self.enemies_defeated = enemies_defeated
+        if boss_defeated_timer is not None:
+            self.boss_defeated_timer = boss_defeated_timer
+        elif hasattr(self, 'boss_defeated_timer'):
+            del self.boss_defeated_timer
+        self.collected_stickers = set(stickers)
+        self.enemies_attacking = enemies_attacking
+        self.rng.setstate(random_state)
+        self.camera.set_state(camera_state)
+        
+        # Revive or remove sprites so each group holds exactly the snapshot's members, in order
+        for name, members in zip(SNAPSHOT_GROUPS, groups):
+            group = getattr(self, name)
+            roster = self._roster[name]
+            group.empty()
+            for i, state in members:
+                sprite = roster[i]
+                sprite.set_state(state)
+                group.add(sprite)
+        platforms = self._roster['platforms']
+        for enemy, platform_id in zip(self.enemies, enemy_platforms):
+            if platform_id >= 0:
+                enemy.current_platform = platforms[platform_id]
+            elif hasattr(enemy, 'current_platform'):
+                enemy.current_platform = None
+        
+        player = self.player
+        player.set_state(player_state)
+        for attack in list(player.attacks):
+            attack.kill()
+            player.attack_pool.release(attack)
+        enemies = self._roster['enemies']
+        for state, hit_ids in attacks:
+            attack = player.attack_pool.acquire(*state[:4], direction=state[4], damage=state[5])
+            attack.set_state(state)
+            attack.hit_enemies.update(enemies[i] for i in hit_ids)
+            player.attacks.add(attack)
+        self.projectiles.set_state(projectiles)
+        
+        self.all_sprites = pygame.sprite.Group(player, *self.platforms, *self.enemies, 
+                                               *self.obstacles, *self.treasures, *self.health_pickups, 
+                                               *self.powerups, *self.doors)
+        # Nothing to interpolate from, and the whole scene may have changed
+        self._prev_positions = {}
+        self._prev_camera = None
+        self.dirty_tracker.invalidate()
+    
+    def _next_level(self):
+        """Level that follows the current one (None after the boss)"""
+        if self.level == BOSS_LEVEL:
+            return None
+        if self.level >= NUM_REGULAR_LEVELS:
+            return BOSS_LEVEL
+        return self.level + 1
+    
+    def _prefetch_next_level(self):
+        """Start building the next level on a worker thread while the level-complete screen is shown"""
+        next_level = self._next_level()
+        if next_level is None or self._prefetch is not None:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-prefetch')
+        # The build draws only from the new level's own random generator
+        self._prefetch = (next_level, self._prefetch_executor.submit(self.build_level, next_level))
+    
+    def _advance_level(self):
+        """Move on to the next level, swapping in the prefetched one if there is one"""
+        next_level = self._next_level()
+        state = None
+        if self._prefetch is not None:
+            level, future = self._prefetch
+            self._prefetch = None
+            if level == next_level:
+                try:
+                    # Only waits if the player continued before the worker finished
+                    state = future.result()
+                except Exception as e:
+                    print(f"[-] Prefetching level {level} failed, building it now: {e}")
+        if state is None:
+            state = self.build_level(next_level)
+        self._start_level(state)
+        self.game_state = GAME_STATE_PLAYING
+    
     def handle_events(self):
         """Handle game events"""
         for event in pygame.event.get():
@@ -250,7 +616,7 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if self.game_state == GAME_STATE_GAMEOVER:
                     if event.key == pygame.K_r:
-                        self.__init__(level=1)
+                        self.restart()
                     elif event.key == pygame.K_q:
                         return False
                 elif self.game_state == GAME_STATE_LEVEL_COMPLETE:
@@ -258,17 +624,9 @@ class Game:
                         # Check if we just beat the boss (end game) or advance to next level
                         if self.level == BOSS_LEVEL:
                             # Boss defeated, restart the game from level 1
-                            self.__init__(level=1)
-                        elif self.level >= NUM_REGULAR_LEVELS:
-                            # Move to boss level
-                            self.level = BOSS_LEVEL
-                            self.init_level()
-                            self.game_state = GAME_STATE_PLAYING
+                            self.restart()
                         else:
-                            # Move to next regular level
-                            self.level += 1
-                            self.init_level()
-                            self.game_state = GAME_STATE_PLAYING
+                            self._advance_level()
         return True
 
     def update(self):
@@ -277,97 +635,32 @@ class Game:
             return
         
         # Update player
-        self.player.update(self.platforms)
+        self.player.update(self.platform_index)
         
         # Update doors
         for door in self.doors:
             door.update()
         
         # Update enemies and projectiles
-        for enemy in list(self.enemies):
-            if isinstance(enemy, Boss):
-                enemy.update(self.player, self.platforms, self.projectiles)
-            else:
-                enemy.update(self.player, self.platforms, self.projectiles)
+        for enemy in self.enemies.sprites():
+            enemy.update(self.player, self.platform_index, self.projectiles)
         
         self.projectiles.update()
         
-        # Player attacks hitting enemies (prevent multiple hits from one swipe)
-        for attack in self.player.attacks:
-            hits = pygame.sprite.spritecollide(attack, self.enemies, False)
-            for enemy in hits:
-                # Only damage enemy once per attack swipe
-                if enemy not in attack.hit_enemies:
-                    enemy.take_damage(attack.damage)
-                    attack.hit_enemies.add(enemy)
-        
-        # Player attacks hitting obstacles
-        for attack in self.player.attacks:
-            hits = pygame.sprite.spritecollide(attack, self.obstacles, False)
-            for obstacle in hits:
-                if obstacle.take_damage(attack.damage):
-                    pass  # Obstacle was destroyed
-        
         # Reset attacking counter for this frame
-        Enemy.currently_attacking = 0
-        
-        # Enemy melee contact with player (limit to max 2 attacking)
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
-        for enemy in hits:
-            # Check if we can attack (max 2 enemies attacking at once)
-            if Enemy.currently_attacking < Enemy.max_attacking:
-                self.player.take_damage(enemy.melee_damage)
-                Enemy.currently_attacking += 1
-                enemy.is_attacking = True
-            else:
-                enemy.is_attacking = False
-        
-        # Projectiles hitting player
-        proj_hits = pygame.sprite.spritecollide(self.player, self.projectiles, True)
-        for p in proj_hits:
-            self.player.take_damage(getattr(p, 'damage', 8))
-        
-        # Obstacles effects on player
-        obs_hits = pygame.sprite.spritecollide(self.player, self.obstacles, False)
-        for obstacle in obs_hits:
-            if obstacle.damage != 0:
-                self.player.take_damage(obstacle.damage)
-                if obstacle.single_use:
-                    obstacle.kill()
-            if obstacle.speed_mod != 1.0:
-                self.player.speed_mod = obstacle.speed_mod
-                self.player.speed_mod_timer = 120
-            if obstacle.blocking:
-                if self.player.rect.bottom > obstacle.rect.top and self.player.vel_y > 0:
-                    self.player.rect.bottom = obstacle.rect.top
-                    self.player.vel_y = 0
-        
-        # Health pickup collection
-        pickup_hits = pygame.sprite.spritecollide(self.player, self.health_pickups, False)
-        for pickup in pickup_hits:
-            self.player.heal(pickup.heal_amount)
-            pickup.collect()
+        self.enemies_attacking = 0
         
-        # Power-up collection
-        powerup_hits = pygame.sprite.spritecollide(self.player, self.powerups, False)
-        for powerup in powerup_hits:
-            if powerup.powerup_type == "armor":
-                self.player.activate_armor(powerup.duration_remaining)
-            elif powerup.powerup_type == "attack":
-                self.player.activate_attack(powerup.duration_remaining)
-            elif powerup.powerup_type == "speed":
-                self.player.activate_speed(powerup.duration_remaining)
-            powerup.collect()
+        # Resolve all collisions against this frame's sprite positions
+        self.collisions.build(self.enemies, self.projectiles,
+                              static=(self.obstacles, self.health_pickups, self.powerups, self.treasures))
+        # Attacks go first, so an enemy killed this frame can't still hurt the player
+        self.collisions.run([*self.player.attacks, self.player])
         
-        # Treasure collection
-        treasure_hits = pygame.sprite.spritecollide(self.player, self.treasures, False)
-        for treasure in treasure_hits:
-            if not treasure.hidden:  # Only collectible if not hidden
-                self.collected_stickers.add(treasure.sticker_id)
-                treasure.collect()
+        # Enemies only die in the collision handlers, so count them once
+        enemies_left = len(self.enemies)
         
         # Check if all enemies are defeated
-        if len(self.enemies) == 0 and not self.enemies_defeated:
+        if enemies_left == 0 and not self.enemies_defeated:
             self.enemies_defeated = True
             # Reveal all treasures
             for treasure in self.treasures:
@@ -387,163 +680,339 @@ class Game:
             self.game_state = GAME_STATE_GAMEOVER
         
         # Check if we beat the final boss
-        if self.level == BOSS_LEVEL and len(self.enemies) == 0 and not self.enemies_defeated:
+        if self.level == BOSS_LEVEL and enemies_left == 0 and not self.enemies_defeated:
             # Player won! Mark as enemies defeated to trigger victory sequence
             self.enemies_defeated = True
             self.boss_defeated_timer = 120  # Show victory for 2 seconds before triggering gameover
         
         # Auto-transition to game over screen after boss is defeated
-        if self.level == BOSS_LEVEL and self.enemies_defeated and len(self.enemies) == 0:
+        if self.level == BOSS_LEVEL and self.enemies_defeated and enemies_left == 0:
             if not hasattr(self, 'boss_defeated_timer'):
                 self.boss_defeated_timer = 120
             self.boss_defeated_timer -= 1
             if self.boss_defeated_timer <= 0:
                 self.game_state = GAME_STATE_GAMEOVER
-
-    def draw_game(self):
-        """Draw the game scene with camera offset applied"""
-        # Fill background with a gradient effect (parallax-like)
-        self.screen.fill((120, 70, 140))  # Base background color
         
-        # Update camera based on player position
+        # The camera follows the player once per step, so its smoothing
+        # doesn't depend on the render rate (draw_game interpolates it)
         self.camera.update(self.player.rect)
+
+    def _register_collision_handlers(self):
+        """Fill the collision handler table; each mover's handlers run in this order"""
+        register = self.collisions.register
+        register(LAYER_ATTACK, LAYER_ENEMY, self._on_attack_enemy)
+        register(LAYER_ATTACK, LAYER_OBSTACLE, self._on_attack_obstacle)
+        register(LAYER_PLAYER, LAYER_ENEMY, self._on_enemy_contact)
+        register(LAYER_PLAYER, LAYER_PROJECTILE, self._on_projectile_hit)
+        register(LAYER_PLAYER, LAYER_OBSTACLE, self._on_obstacle_contact)
+        register(LAYER_PLAYER, LAYER_PICKUP, self._on_pickup)
+        register(LAYER_PLAYER, LAYER_POWERUP, self._on_powerup)
+        register(LAYER_PLAYER, LAYER_TREASURE, self._on_treasure)
+
+    def _on_attack_enemy(self, attack, enemies):
+        """Player attacks hitting enemies (prevent multiple hits from one swipe)"""
+        for enemy in enemies:
+            # Only damage enemy once per attack swipe
+            if enemy not in attack.hit_enemies:
+                enemy.take_damage(attack.damage)
+                attack.hit_enemies.add(enemy)
+
+    def _on_attack_obstacle(self, attack, obstacles):
+        """Player attacks hitting obstacles"""
+        for obstacle in obstacles:
+            obstacle.take_damage(attack.damage)
+
+    def _on_enemy_contact(self, player, enemies):
+        """Enemy melee contact with player (limit to max 2 attacking)"""
+        for enemy in enemies:
+            # Check if we can attack (max 2 enemies attacking at once)
+            if self.enemies_attacking < self.max_enemies_attacking:
+                player.take_damage(enemy.melee_damage,
+                                   DAMAGE_BOSS.format(enemy.phase) if enemy is self.boss else DAMAGE_ENEMY)
+                self.enemies_attacking += 1
+                enemy.is_attacking = True
+            else:
+                enemy.is_attacking = False
+
+    def _on_projectile_hit(self, player, hits):
+        """Projectiles hitting player"""
+        damages = self.projectiles.damage[hits].tolist()
+        self.projectiles.kill(hits)
+        # Only the boss shoots on the boss level
+        source = DAMAGE_BOSS.format(self.boss.phase) if self.boss is not None else DAMAGE_PROJECTILE
+        for damage in damages:
+            player.take_damage(damage, source)
+
+    def _on_obstacle_contact(self, player, obstacles):
+        """Obstacles effects on player"""
+        for obstacle in obstacles:
+            obstacle.apply_to(player)
+
+    def _on_pickup(self, player, pickups):
+        """Health pickup collection"""
+        for pickup in pickups:
+            pickup.apply_to(player)
+            pickup.collect()
+
+    def _on_powerup(self, player, powerups):
+        """Power-up collection"""
+        for powerup in powerups:
+            powerup.apply_to(player)
+            powerup.collect()
+
+    def _on_treasure(self, player, treasures):
+        """Treasure collection"""
+        for treasure in treasures:
+            if not treasure.hidden:  # Only collectible if not hidden
+                self.collected_stickers.add(treasure.sticker_id)
+                treasure.collect()
+
+    def draw_game(self):
+        """
+        Draw the game scene with camera offset applied.
         
-        # Draw parallax background (creates depth effect)
-        # The background scrolls slower than foreground elements
-        self._draw_parallax_background()
-        
-        # Draw underground/ground area (below level)
-        self._draw_underground()
+        Returns:
+            List of changed screen rects when dirty-rect rendering could
+            skip repainting the static scene, or None if the whole screen
+            was redrawn and should be flipped
+        """
+        # Draw from between the camera's positions before and after the last
+        # step, like the sprites, then put back the simulated position
+        camera_pos = (self.camera.x, self.camera.y)
+        if self._prev_camera is not None and self.render_alpha < 1.0:
+            prev_x, prev_y = self._prev_camera
+            self.camera.x = prev_x + (camera_pos[0] - prev_x) * self.render_alpha
+            self.camera.y = prev_y + (camera_pos[1] - prev_y) * self.render_alpha
+        try:
+            return self._draw_scene()
+        finally:
+            self.camera.x, self.camera.y = camera_pos
+    
+    def _draw_scene(self):
+        """Draw the scene from the camera's current position (see draw_game)"""
+        player_rect = self._render_rect(self.player)
+        
+        self._tracking_dirty = self.dirty_rect_rendering
+        if self._tracking_dirty:
+            # Parallax layers scroll by fractions of the camera position, so
+            # compare exact positions rather than whole pixels
+            camera_pos = (self.camera.x, self.camera.y)
+            redraw_static = self.dirty_tracker.begin_frame(camera_pos)
+        else:
+            redraw_static = True
         
-        # Draw game objects with camera offset applied
-        # Platforms
-        for platform in self.platforms:
-            if self.camera.is_visible(platform.rect):
-                offset_rect = self.camera.apply_offset(platform.rect)
-                self.screen.blit(platform.image, offset_rect)
+        if redraw_static:
+            self._draw_static_scene()
+            if self._tracking_dirty:
+                self.dirty_tracker.save_static_layer(self.screen)
+        else:
+            # Camera hasn't moved: only erase where sprites were last frame
+            self.dirty_tracker.restore_static_layer(self.screen)
         
         # Obstacles
         for obstacle in self.obstacles:
             if self.camera.is_visible(obstacle.rect):
                 offset_rect = self.camera.apply_offset(obstacle.rect)
-                self.screen.blit(obstacle.image, offset_rect)
+                self._blit(obstacle.image, offset_rect)
         
         # Health pickups
         for pickup in self.health_pickups:
             if self.camera.is_visible(pickup.rect):
                 offset_rect = self.camera.apply_offset(pickup.rect)
-                self.screen.blit(pickup.image, offset_rect)
+                self._blit(pickup.image, offset_rect)
         
         # Power-ups
         for powerup in self.powerups:
             if self.camera.is_visible(powerup.rect):
                 offset_rect = self.camera.apply_offset(powerup.rect)
-                self.screen.blit(powerup.image, offset_rect)
+                self._blit(powerup.image, offset_rect)
         
         # Treasures
         for treasure in self.treasures:
             if self.camera.is_visible(treasure.rect):
                 offset_rect = self.camera.apply_offset(treasure.rect)
-                self.screen.blit(treasure.image, offset_rect)
+                self._blit(treasure.image, offset_rect)
         
         # Enemies
         for enemy in self.enemies:
             if self.camera.is_visible(enemy.rect):
-                offset_rect = self.camera.apply_offset(enemy.rect)
-                self.screen.blit(enemy.image, offset_rect)
+                offset_rect = self.camera.apply_offset(self._render_rect(enemy))
+                self._blit(enemy.image, offset_rect)
         
         # Doors
         for door in self.doors:
             if self.camera.is_visible(door.rect):
                 offset_rect = self.camera.apply_offset(door.rect)
-                self.screen.blit(door.image, offset_rect)
+                self._blit(door.image, offset_rect)
         
         # Player
-        player_offset_rect = self.camera.apply_offset(self.player.rect)
-        self.screen.blit(self.player.image, player_offset_rect)
+        player_offset_rect = self.camera.apply_offset(player_rect)
+        self._blit(self.player.image, player_offset_rect)
         
         # Player attacks
         for attack in self.player.attacks:
             if self.camera.is_visible(attack.rect):
                 offset_rect = self.camera.apply_offset(attack.rect)
-                self.screen.blit(attack.image, offset_rect)
+                self._blit(attack.image, offset_rect)
         
-        # Projectiles
-        for projectile in self.projectiles:
-            if self.camera.is_visible(projectile.rect):
-                offset_rect = self.camera.apply_offset(projectile.rect)
-                self.screen.blit(projectile.image, offset_rect)
+        # Projectiles (all drawn from one shared image)
+        projectile_rects = self.projectiles.draw(self.screen, self.camera, self.render_alpha)
+        if self._tracking_dirty:
+            for rect in projectile_rects:
+                self.dirty_tracker.add(rect)
         
         # Draw enemy health bars (offset applied)
         for enemy in self.enemies:
             if self.camera.is_visible(enemy.rect):
                 enemy.draw_health_bar(self.screen, self.camera)
+                if self._tracking_dirty:
+                    # Health bars are drawn up to 15px above the sprite
+                    bar_rect = self.camera.apply_offset(enemy.rect)
+                    self.dirty_tracker.add(bar_rect.inflate(0, 32))
         
         # Draw UI (not affected by camera, stays on screen)
         self._draw_ui()
+        
+        if self._tracking_dirty:
+            return self.dirty_tracker.end_frame()
+        return None
+    
+    def _draw_static_scene(self):
+        """Draw everything that only changes when the camera moves"""
+        # Base background color, only needed if no opaque layer covers the screen
+        if not any(layer.opaque for layer in self.parallax_layers):
+            self.screen.fill((120, 70, 140))
+        
+        # Draw parallax background (creates depth effect)
+        # The background scrolls slower than foreground elements
+        self._draw_parallax_background()
+        
+        # Draw underground/ground area (below level)
+        self._draw_underground()
+        
+        # Platforms (pre-rendered into one canvas, blit just the visible part)
+        if self.level_canvas is None:
+            self.level_canvas = self._build_level_canvas(self.platforms)
+        view_rect = pygame.Rect(int(self.camera.x), int(self.camera.y), WIDTH, HEIGHT)
+        self.screen.blit(self.level_canvas, (0, 0), view_rect)
+    
+    def _blit(self, image, dest):
+        """Blit to the screen, recording the changed region for dirty-rect rendering"""
+        rect = self.screen.blit(image, dest)
+        if self._tracking_dirty:
+            self.dirty_tracker.add(rect)
+        return rect
+    
+    def _capture_render_state(self):
+        """Remember where moving sprites were before a simulation step, for interpolation"""
+        positions = {self.player: self.player.rect.topleft}
+        for enemy in self.enemies:
+            positions[enemy] = enemy.rect.topleft
+        self._prev_positions = positions
+        self._prev_camera = (self.camera.x, self.camera.y)
+        self.projectiles.capture_positions()
+
+    def _render_rect(self, sprite):
+        """
+        Get the rect to draw a moving sprite at, interpolated between its
+        position before and after the last simulation step.
+        
+        Args:
+            sprite: Sprite to draw
+        
+        Returns:
+            pygame.Rect in world coordinates
+        """
+        prev = self._prev_positions.get(sprite)
+        if prev is None or self.render_alpha >= 1.0:
+            return sprite.rect
+        rect = sprite.rect.copy()
+        rect.x = round(prev[0] + (rect.x - prev[0]) * self.render_alpha)
+        rect.y = round(prev[1] + (rect.y - prev[1]) * self.render_alpha)
+        return rect
     
     def _draw_underground(self):
         """
         Draw underground area below the playable level.
-        This includes colored ground and dinosaur skeletons.
+        This includes colored ground and dinosaur skeletons, pre-rendered
+        once per level (see _build_underground_layer).
+        """
+        # Draw ground/underground area
+        screen_ground_y = int(LEVEL_HEIGHT - self.camera.y)
+        if screen_ground_y < HEIGHT:  # Only draw if visible
+            key = (self.level, self.seed)
+            if self._underground_key != key:
+                self.underground_layer = self._build_underground_layer(self.level)
+                self._underground_key = key
+            self.screen.blit(self.underground_layer, (0, max(0, screen_ground_y)),
+                             (0, max(0, -screen_ground_y), WIDTH, HEIGHT))
+    
+    def _build_underground_layer(self, level):
         """
-        camera_y = self.camera.y
-        ground_y = LEVEL_HEIGHT
+        Render the underground for a level into a screen-sized surface.
+        It only depends on the level and seed, so it is drawn once and then
+        blitted at the camera offset.
+        
+        Args:
+            level: Level number
         
+        Returns:
+            pygame.Surface with the ground at its top edge
+        """
         # Define ground color based on level
-        if self.level == 1:
+        if level == 1:
             ground_color = (139, 69, 19)       # Brown
             skeleton_color = (200, 200, 200)   # Light gray for bones
-        elif self.level == 2:
+        elif level == 2:
             ground_color = (100, 50, 150)      # Purple
             skeleton_color = (180, 150, 200)   # Light purple
-        elif self.level == 3:
+        elif level == 3:
             ground_color = (150, 50, 50)       # Dark red
             skeleton_color = (220, 200, 150)   # Beige for bones
-        elif self.level == BOSS_LEVEL:
+        elif level == BOSS_LEVEL:
             ground_color = (20, 20, 40)        # Dark blue/black
             skeleton_color = (150, 150, 150)   # Gray for bones
         else:
             ground_color = (100, 80, 60)       # Default brown
             skeleton_color = (200, 200, 200)   # Default light gray
         
-        # Draw ground/underground area
-        screen_ground_y = (ground_y - camera_y)
-        if screen_ground_y < HEIGHT:  # Only draw if visible
-            # Draw colored underground rectangle
-            pygame.draw.rect(self.screen, ground_color, 
-                           (0, max(0, screen_ground_y), WIDTH, HEIGHT - max(0, screen_ground_y)))
-            
-            # Draw some dinosaur skeletons in the underground
-            num_skeletons = 5
-            for i in range(num_skeletons):
-                # Calculate skeleton positions based on level
-                skeleton_x = (100 + i * 150 + (self.seed * i) % 100) % WIDTH
-                skeleton_y = screen_ground_y + 30 + (i % 3) * 80
-                if skeleton_y < HEIGHT:
-                    self._draw_dinosaur_skeleton(skeleton_x, skeleton_y, skeleton_color)
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        layer.fill(ground_color)
+        
+        # Draw some dinosaur skeletons in the underground
+        num_skeletons = 5
+        for i in range(num_skeletons):
+            # Calculate skeleton positions based on level
+            skeleton_x = (100 + i * 150 + (self.seed * i) % 100) % WIDTH
+            skeleton_y = 30 + (i % 3) * 80
+            self._draw_dinosaur_skeleton(skeleton_x, skeleton_y, skeleton_color, surface=layer)
+        return layer
     
-    def _draw_dinosaur_skeleton(self, x, y, color):
+    def _draw_dinosaur_skeleton(self, x, y, color, surface=None):
         """
         Draw a simple ASCII-style dinosaur skeleton in the game world.
         Uses simple geometric shapes to represent bones.
+        Draws on the screen unless another surface is given.
         """
+        if surface is None:
+            surface = self.screen
+        
         # T-Rex style skeleton - simplified
         bone_width = 3
         
         # Skull (circle)
-        pygame.draw.circle(self.screen, color, (int(x), int(y)), 15)
+        pygame.draw.circle(surface, color, (int(x), int(y)), 15)
         # Jaw line
-        pygame.draw.line(self.screen, color, (int(x - 10), int(y + 5)), (int(x + 10), int(y + 5)), bone_width)
+        pygame.draw.line(surface, color, (int(x - 10), int(y + 5)), (int(x + 10), int(y + 5)), bone_width)
         
         # Spine/Vertebrae (vertical line with dots)
         spine_start_y = y + 15
         spine_end_y = y + 80
-        pygame.draw.line(self.screen, color, (int(x), int(spine_start_y)), (int(x), int(spine_end_y)), bone_width)
+        pygame.draw.line(surface, color, (int(x), int(spine_start_y)), (int(x), int(spine_end_y)), bone_width)
         
         # Draw vertebrae as small circles
         for vert_y in range(int(spine_start_y), int(spine_end_y), 15):
-            pygame.draw.circle(self.screen, color, (int(x), vert_y), 4)
+            pygame.draw.circle(surface, color, (int(x), vert_y), 4)
         
         # Ribcage (curved lines)
         for rib_i in range(4):
@@ -551,9 +1020,9 @@ class Game:
             rib_left = x - 20
             rib_right = x + 20
             # Left ribs
-            pygame.draw.line(self.screen, color, (int(x), int(rib_y)), (int(rib_left), int(rib_y)), bone_width)
+            pygame.draw.line(surface, color, (int(x), int(rib_y)), (int(rib_left), int(rib_y)), bone_width)
             # Right ribs
-            pygame.draw.line(self.screen, color, (int(x), int(rib_y)), (int(rib_right), int(rib_y)), bone_width)
+            pygame.draw.line(surface, color, (int(x), int(rib_y)), (int(rib_right), int(rib_y)), bone_width)
         
         # Tail (curved line going back and down)
         tail_start = spine_end_y
@@ -563,162 +1032,96 @@ class Game:
         for seg in range(tail_segments):
             next_tail_x = tail_x + 15 * (1 if seg % 2 == 0 else -1)
             next_tail_y = tail_y + 20
-            pygame.draw.line(self.screen, color, (int(tail_x), int(tail_y)), (int(next_tail_x), int(next_tail_y)), bone_width)
+            pygame.draw.line(surface, color, (int(tail_x), int(tail_y)), (int(next_tail_x), int(next_tail_y)), bone_width)
             tail_x = next_tail_x
             tail_y = next_tail_y
         
         # Front legs (two pairs)
         # Front left leg
-        pygame.draw.line(self.screen, color, (int(x - 15), int(y + 50)), (int(x - 25), int(y + 100)), bone_width)
+        pygame.draw.line(surface, color, (int(x - 15), int(y + 50)), (int(x - 25), int(y + 100)), bone_width)
         # Front right leg
-        pygame.draw.line(self.screen, color, (int(x + 15), int(y + 50)), (int(x + 25), int(y + 100)), bone_width)
+        pygame.draw.line(surface, color, (int(x + 15), int(y + 50)), (int(x + 25), int(y + 100)), bone_width)
         
         # Back legs (larger)
         # Back left leg
-        pygame.draw.line(self.screen, color, (int(x - 20), int(y + 70)), (int(x - 30), int(y + 120)), bone_width)
+        pygame.draw.line(surface, color, (int(x - 20), int(y + 70)), (int(x - 30), int(y + 120)), bone_width)
         # Back right leg
-        pygame.draw.line(self.screen, color, (int(x + 20), int(y + 70)), (int(x + 30), int(y + 120)), bone_width)
+        pygame.draw.line(surface, color, (int(x + 20), int(y + 70)), (int(x + 30), int(y + 120)), bone_width)
         
         # Foot bones (small circles at leg ends)
         foot_positions = [(x - 25, y + 100), (x + 25, y + 100), (x - 30, y + 120), (x + 30, y + 120)]
         for foot_x, foot_y in foot_positions:
-            pygame.draw.circle(self.screen, color, (int(foot_x), int(foot_y)), 5)
+            pygame.draw.circle(surface, color, (int(foot_x), int(foot_y)), 5)
     
-    def _draw_parallax_background(self):
+    def _build_parallax_layers(self, level, background_image):
         """
-        Draw parallax background layers to create depth perception.
+        Build the parallax background layers for a level.
         Background elements move slower than the foreground.
         Different backgrounds for each level.
-        """
-        camera_y = self.camera.y
         
+        Args:
+            level: Level number
+            background_image: Level background from _load_background_image, or None
+        
+        Returns:
+            List of ParallaxLayer objects ordered from farthest to nearest
+        """
         # If we have a background image, display it with parallax effect
-        if self.background_image:
-            # Draw background with parallax scrolling (moves slower than foreground)
-            # Calculate parallax offset (slower movement than camera)
-            parallax_offset = int(camera_y * 0.3)  # Background moves at 30% of camera speed
-            
-            # Draw the background image in tiles to cover the full visible area
-            bg_y = -parallax_offset % HEIGHT
-            
-            # Draw the background image, tiling vertically for parallax effect
-            self.screen.blit(self.background_image, (0, bg_y - HEIGHT))
-            self.screen.blit(self.background_image, (0, bg_y))
-            if bg_y < 0:
-                self.screen.blit(self.background_image, (0, bg_y + HEIGHT))
+        if background_image:
+            # Background moves at 30% of camera speed
+            return [ParallaxLayer(0.3, image=background_image)]
+        
+        # Fallback to color-based background if image not loaded
+        # Define level-specific color schemes
+        if level == 1:
+            # Level 1: Forest/Green theme
+            far_color = (20, 40, 20)      # Dark green
+            mid_color = (40, 80, 40)      # Forest green
+            near_color = (60, 120, 60)    # Light green
+        elif level == 2:
+            # Level 2: Sky/Blue theme
+            far_color = (30, 50, 100)     # Deep blue
+            mid_color = (50, 100, 150)    # Sky blue
+            near_color = (100, 150, 200)  # Light blue
+        elif level == 3:
+            # Level 3: Lava/Orange theme
+            far_color = (60, 20, 10)      # Dark red
+            mid_color = (120, 40, 20)     # Lava orange
+            near_color = (180, 80, 40)    # Light orange
+        elif level == BOSS_LEVEL:
+            # Boss level: Dark/Purple theme
+            far_color = (40, 10, 60)      # Dark purple
+            mid_color = (80, 20, 120)     # Purple
+            near_color = (140, 50, 180)   # Light purple
         else:
-            # Fallback to color-based background if image not loaded
-            # Define level-specific color schemes
-            if self.level == 1:
-                # Level 1: Forest/Green theme
-                far_color = (20, 40, 20)      # Dark green
-                mid_color = (40, 80, 40)      # Forest green
-                near_color = (60, 120, 60)    # Light green
-            elif self.level == 2:
-                # Level 2: Sky/Blue theme
-                far_color = (30, 50, 100)     # Deep blue
-                mid_color = (50, 100, 150)    # Sky blue
-                near_color = (100, 150, 200)  # Light blue
-            elif self.level == 3:
-                # Level 3: Lava/Orange theme
-                far_color = (60, 20, 10)      # Dark red
-                mid_color = (120, 40, 20)     # Lava orange
-                near_color = (180, 80, 40)    # Light orange
-            elif self.level == BOSS_LEVEL:
-                # Boss level: Dark/Purple theme
-                far_color = (40, 10, 60)      # Dark purple
-                mid_color = (80, 20, 120)     # Purple
-                near_color = (140, 50, 180)   # Light purple
-            else:
-                # Default fallback
-                far_color = (80, 40, 100)
-                mid_color = (100, 50, 120)
-                near_color = (120, 70, 140)
-            
-            # Far background (moves slowly)
-            far_offset = int(camera_y * 0.2)
-            far_rect = pygame.Rect(0, -far_offset % HEIGHT, WIDTH, HEIGHT)
-            pygame.draw.rect(self.screen, far_color, (0, 0, WIDTH, HEIGHT))
-            
-            # Mid background (moves at medium speed)
-            mid_offset = int(camera_y * 0.5)
-            mid_y = (-mid_offset % HEIGHT)
-            pygame.draw.rect(self.screen, mid_color, (0, mid_y, WIDTH, HEIGHT))
-            if mid_y > 0:
-                pygame.draw.rect(self.screen, mid_color, (0, mid_y - HEIGHT, WIDTH, HEIGHT))
-            
-            # Near background (moves with most parallax effect)
-            near_offset = int(camera_y * 0.7)
-            near_y = (-near_offset % HEIGHT)
-            pygame.draw.rect(self.screen, near_color, (0, near_y, WIDTH, HEIGHT))
-            if near_y > 0:
-                pygame.draw.rect(self.screen, near_color, (0, near_y - HEIGHT, WIDTH, HEIGHT))
+            # Default fallback
+            far_color = (80, 40, 100)
+            mid_color = (100, 50, 120)
+            near_color = (120, 70, 140)
+        
+        return [
+            ParallaxLayer(0.2, color=far_color),   # Far background (moves slowly)
+            ParallaxLayer(0.5, color=mid_color),   # Mid background (moves at medium speed)
+            ParallaxLayer(0.7, color=near_color),  # Near background (moves with most parallax effect)
+        ]
+    
+    def _draw_parallax_background(self):
+        """
+        Draw parallax background layers to create depth perception.
+        Each layer is pre-tiled, so this is at most one blit per visible layer.
+        """
+        self.camera.draw_parallax_background(self.screen, self.parallax_layers)
     
     def _draw_ui(self):
         """
         Draw UI elements that should stay fixed on screen (not scroll with camera).
         Includes health, level, stickers, power-ups, and controls.
+        The HUD is cached and only re-rendered when a displayed value changes.
         """
-        # Draw player health
-        health_color = (0, 255, 0) if self.player.health > 50 else (255, 165, 0) if self.player.health > 25 else (255, 0, 0)
-        # Add damage feedback effect
-        if self.player.damage_taken_timer > 0:
-            health_color = (255, 0, 0)
-        health_text = self.small_font.render(f"Health: {self.player.health}/{self.player.max_health}", True, health_color)
-        self.screen.blit(health_text, (10, 10))
-        
-        # Draw level
-        level_text = self.small_font.render(f"Level: {self.level}", True, (0, 0, 0))
-        self.screen.blit(level_text, (WIDTH - 200, 10))
-        
-        # Draw collected stickers
-        sticker_text = self.small_font.render(f"Stickers: {len(self.collected_stickers)}", True, (255, 165, 0))
-        self.screen.blit(sticker_text, (WIDTH // 2 - 60, 10))
-        
-        # Draw sticker indicators
-        sticker_x = 50
-        for i in range(10):
-            if i in self.collected_stickers:
-                pygame.draw.circle(self.screen, (255, 215, 0), (sticker_x + i * 20, 40), 5)
-            else:
-                pygame.draw.circle(self.screen, (200, 200, 200), (sticker_x + i * 20, 40), 5)
-        
-        # Draw active power-ups with duration
-        powerup_y = 70
-        if self.player.armor_active:
-            armor_text = self.small_font.render(f"ARMOR: {self.player.armor_timer // 60}s", True, (150, 150, 150))
-            self.screen.blit(armor_text, (10, powerup_y))
-            powerup_y += 25
-        
-        if self.player.attack_mod > 1.0:
-            attack_text = self.small_font.render(f"ATTACK+: {self.player.attack_mod_timer // 60}s", True, (255, 100, 100))
-            self.screen.blit(attack_text, (10, powerup_y))
-            powerup_y += 25
-        
-        if self.player.speed_mod > 1.0:
-            speed_text = self.small_font.render(f"SPEED+: {self.player.speed_mod_timer // 60}s", True, (200, 0, 200))
-            self.screen.blit(speed_text, (10, powerup_y))
-            powerup_y += 25
-        
-        # Draw pickup collected feedback
-        if self.player.pickup_collected_timer > 0:
-            pickup_text = self.small_font.render("HEALTH +", True, (0, 255, 0))
-            self.screen.blit(pickup_text, (WIDTH - 150, 50))
-        
-        # Draw controls hint
-        controls_text = self.small_font.render("Arrow Keys: Move | Space: Jump | A: Attack | Down+Space: Jump Down", True, (100, 100, 100))
-        self.screen.blit(controls_text, (10, HEIGHT - 30))
-        
-        # Draw door unlock message if applicable
-        for door in self.doors:
-            if door.should_show_unlock_message():
-                unlock_text = self.font.render("DOOR UNLOCKED!", True, (0, 255, 0))
-                text_rect = unlock_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-                # Draw semi-transparent background for text
-                bg_rect = text_rect.inflate(40, 20)
-                pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)
-                pygame.draw.rect(self.screen, (0, 255, 0), bg_rect, 3)
-                self.screen.blit(unlock_text, text_rect)
+        hud_rects = self.hud.draw(self.screen, self)
+        if self._tracking_dirty:
+            for rect in hud_rects:
+                self.dirty_tracker.add(rect)
         
         # Optional: Draw camera debug info (can be toggled)
         # camera_info = self.camera.get_info()
@@ -744,10 +1147,10 @@ class Game:
             
             self.screen.fill((50, 100, 50))  # Dark green background
             
-            victory_text = pygame.font.Font(None, 80).render("YOU WON!!", True, (0, 255, 0))
-            subtitle_text = self.font.render("You defeated the Boss and collected the treasure!", True, (255, 255, 0))
-            final_text = self.small_font.render(f"Final Stickers Collected: {len(self.collected_stickers)}/10", True, (255, 255, 255))
-            restart_text = self.small_font.render("Press R to Play Again or Q to Quit", True, (200, 200, 200))
+            victory_text = self.text_cache.render(self.large_font, "YOU WON!!", (0, 255, 0))
+            subtitle_text = self.text_cache.render(self.font, "You defeated the Boss and collected the treasure!", (255, 255, 0))
+            final_text = self.text_cache.render(self.small_font, f"Final Stickers Collected: {len(self.collected_stickers)}/10", (255, 255, 255))
+            restart_text = self.text_cache.render(self.small_font, "Press R to Play Again or Q to Quit", (200, 200, 200))
             
             self.screen.blit(victory_text, (WIDTH // 2 - 200, HEIGHT // 2 - 150))
             self.screen.blit(subtitle_text, (WIDTH // 2 - 230, HEIGHT // 2 - 50))
@@ -755,9 +1158,9 @@ class Game:
             self.screen.blit(restart_text, (WIDTH // 2 - 150, HEIGHT // 2 + 100))
         else:
             # Defeat screen
-            gameover_text = self.font.render("GAME OVER", True, (255, 0, 0))
-            level_text = self.font.render(f"Level Reached: {self.level}", True, BLACK)
-            restart_text = self.small_font.render("Press R to Restart or Q to Quit", True, BLACK)
+            gameover_text = self.text_cache.render(self.font, "GAME OVER", (255, 0, 0))
+            level_text = self.text_cache.render(self.font, f"Level Reached: {self.level}", BLACK)
+            restart_text = self.text_cache.render(self.small_font, "Press R to Restart or Q to Quit", BLACK)
             
             self.screen.blit(gameover_text, (WIDTH // 2 - 150, HEIGHT // 2 - 100))
             self.screen.blit(level_text, (WIDTH // 2 - 150, HEIGHT // 2 - 20))
@@ -767,31 +1170,86 @@ class Game:
         """Draw the level complete screen"""
         self.screen.fill(WHITE)
         
-        complete_text = self.font.render("LEVEL COMPLETE", True, (0, 150, 0))
-        next_text = self.small_font.render(f"Level {self.level + 1} Ready", True, BLACK)
-        continue_text = self.small_font.render("Press SPACE to Continue", True, BLACK)
+        complete_text = self.text_cache.render(self.font, "LEVEL COMPLETE", (0, 150, 0))
+        next_text = self.text_cache.render(self.small_font, f"Level {self.level + 1} Ready", BLACK)
+        continue_text = self.text_cache.render(self.small_font, "Press SPACE to Continue", BLACK)
         
         self.screen.blit(complete_text, (WIDTH // 2 - 150, HEIGHT // 2 - 100))
         self.screen.blit(next_text, (WIDTH // 2 - 100, HEIGHT // 2 - 20))
         self.screen.blit(continue_text, (WIDTH // 2 - 140, HEIGHT // 2 + 60))
 
+    def step(self, n_frames=1):
+        """
+        Advance the simulation by a number of frames without drawing or
+        frame limiting. Stops early if the game leaves the playing state.
+        
+        Args:
+            n_frames: Number of frames to simulate
+        
+        Returns:
+            The current game state after stepping
+        """
+        for _ in range(n_frames):
+            if self.game_state != GAME_STATE_PLAYING:
+                break
+            if not self.headless:
+                # Keep keyboard state fresh for Player.handle_input
+                pygame.event.pump()
+            self.update()
+        return self.game_state
+
     def run(self):
         """Main game loop"""
+        if self.headless:
+            self.run_headless()
+            return
+        
+        # Fixed-timestep loop: the simulation always advances in SIM_DT_MS
+        # steps, running several per rendered frame when rendering falls
+        # behind, and drawing interpolates between the last two steps.
         running = True
+        accumulator = 0.0
         while running:
-            self.clock.tick(FPS)
+            accumulator += self.clock.tick(FPS)
             running = self.handle_events()
-            self.update()
             
+            max_steps = getattr(self.clock, 'max_steps_per_frame', MAX_SIM_STEPS_PER_FRAME)
+            steps = 0
+            # Small tolerance so float rounding doesn't drop a whole step
+            while accumulator + 1e-6 >= SIM_DT_MS and steps < max_steps:
+                self._capture_render_state()
+                self.update()
+                accumulator -= SIM_DT_MS
+                steps += 1
+            if steps == max_steps:
+                # Too far behind to catch up; drop the backlog instead of spiraling
+                accumulator = min(accumulator, SIM_DT_MS)
+            self.render_alpha = max(0.0, accumulator / SIM_DT_MS)
+            
+            dirty_rects = None
             if self.game_state == GAME_STATE_PLAYING:
-                self.draw_game()
-            elif self.game_state == GAME_STATE_LEVEL_COMPLETE:
-                self.draw_level_complete()
-            else:  # GAME_STATE_GAMEOVER
-                self.draw_gameover()
+                dirty_rects = self.draw_game()
+            else:
+                # Menu screens cover the scene; repaint it fully when play resumes
+                self.dirty_tracker.invalidate()
+                if self.game_state == GAME_STATE_LEVEL_COMPLETE:
+                    self._prefetch_next_level()
+                    self.draw_level_complete()
+                else:  # GAME_STATE_GAMEOVER
+                    self.draw_gameover()
             
-            pygame.display.flip()
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
         
         pygame.quit()
         sys.exit()
 
+    def run_headless(self):
+        """Simulate uncapped until the level ends, the player dies or the game is quit"""
+        running = True
+        while running and self.game_state == GAME_STATE_PLAYING:
+            running = self.handle_events()
+            self.update()
+
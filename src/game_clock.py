@@ -0,0 +1,94 @@
+"""
+Clocks that drive the game loop.
+All clocks share pygame.time.Clock's tick(framerate) interface and return the
+milliseconds of game time that passed, so Game.run can use any of them.
+Gameplay timers count simulation steps, so a clock that reports more game
+time per frame makes the whole game run faster than real time.
+"""
+
+import math
+import pygame
+from settings import SIM_DT_MS, MAX_SIM_STEPS_PER_FRAME
+
+
+class RealTimeClock:
+    """Real-time clock that sleeps to cap the frame rate, with optional time warp"""
+
+    def __init__(self, time_scale=1.0):
+        """
+        Initialize the clock.
+
+        Args:
+            time_scale: Game time per real time (2.0 = play at double speed)
+        """
+        self._clock = pygame.time.Clock()
+        self.time_scale = time_scale
+        # Allow enough catch-up steps for the warped time to be simulated
+        self.max_steps_per_frame = max(1, math.ceil(MAX_SIM_STEPS_PER_FRAME * time_scale))
+
+    def tick(self, framerate=0):
+        """Wait for the next frame and return the elapsed game time in ms"""
+        return self._clock.tick(framerate) * self.time_scale
+
+    def get_fps(self):
+        """Get the real frame rate"""
+        return self._clock.get_fps()
+
+
+class FixedStepClock:
+    """
+    Deterministic clock that reports exactly one simulation step per tick,
+    regardless of how long the frame really took.
+    """
+
+    def __init__(self, step_ms=SIM_DT_MS, throttle=True):
+        """
+        Initialize the clock.
+
+        Args:
+            step_ms: Game time reported per tick
+            throttle: If True, still sleep to cap the real frame rate
+        """
+        self._clock = pygame.time.Clock()
+        self.step_ms = step_ms
+        self.throttle = throttle
+        self.max_steps_per_frame = MAX_SIM_STEPS_PER_FRAME
+
+    def tick(self, framerate=0):
+        """Return one step of game time, sleeping first if throttled"""
+        self._clock.tick(framerate if self.throttle else 0)
+        return self.step_ms
+
+    def get_fps(self):
+        """Get the real frame rate"""
+        return self._clock.get_fps()
+
+
+class UnthrottledClock:
+    """
+    Clock that never sleeps and reports a fixed number of simulation steps
+    per tick, so the game runs as fast as the CPU allows and only renders
+    once every steps_per_frame steps.
+    """
+
+    def __init__(self, steps_per_frame=1, step_ms=SIM_DT_MS):
+        """
+        Initialize the clock.
+
+        Args:
+            steps_per_frame: Simulation steps to run between rendered frames
+            step_ms: Game time per simulation step
+        """
+        self._clock = pygame.time.Clock()
+        self.steps_per_frame = steps_per_frame
+        self.step_ms = step_ms
+        self.max_steps_per_frame = steps_per_frame
+
+    def tick(self, framerate=0):
+        """Return steps_per_frame steps of game time without sleeping"""
+        self._clock.tick()
+        return self.step_ms * self.steps_per_frame
+
+    def get_fps(self):
+        """Get the real frame rate"""
+        return self._clock.get_fps()
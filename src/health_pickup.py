@@ -1,8 +1,12 @@
 import pygame
 from settings import GREEN, WIDTH, HEIGHT
+from collision import LAYER_PLAYER, LAYER_PICKUP
 
 class HealthPickup(pygame.sprite.Sprite):
     """Collectible health pickup that restores player health"""
+    collision_layer = LAYER_PICKUP
+    collision_mask = LAYER_PLAYER
+    
     def __init__(self, x, y, heal_amount=20):
         super().__init__()
         self.heal_amount = heal_amount
@@ -18,6 +22,18 @@ class HealthPickup(pygame.sprite.Sprite):
         self.bob_offset = 0
         self.bob_speed = 0.1
 
+    def get_state(self):
+        """Return the pickup's mutable state as a tuple (see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.bob_offset, self.collected)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        self.rect.x, self.rect.y, self.bob_offset, self.collected = state
+
+    def apply_to(self, player):
+        """Heal the player that picked this up"""
+        player.heal(self.heal_amount)
+
     def collect(self):
         """Mark pickup as collected and remove from game"""
         self.collected = True
@@ -0,0 +1,168 @@
+"""
+Heads-up display rendering with caching.
+Rendered text is cached by content, and the whole HUD is composed into one
+cached surface that is only re-rendered when a displayed value changes, so
+a typical frame costs a handful of blits and no font rasterization.
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+from settings import WIDTH, HEIGHT
+
+CONTROLS_HINT = "Arrow Keys: Move | Space: Jump | A: Attack | Down+Space: Jump Down"
+
+
+class TextCache:
+    """Caches rendered text surfaces keyed by font, text and color"""
+
+    def __init__(self, max_entries=256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Cache is cleared when it grows past this many surfaces
+        """
+        self.max_entries = max_entries
+        self._cache: Dict[Tuple, pygame.Surface] = {}
+
+    def render(self, font, text, color):
+        """
+        Get the rendered surface for a piece of text, rendering it only once.
+
+        Args:
+            font: pygame Font to render with
+            text: String to render
+            color: RGB text color
+
+        Returns:
+            Antialiased pygame Surface (shared, do not modify)
+        """
+        key = (font, text, color)
+        surface = self._cache.get(key)
+        if surface is None:
+            if len(self._cache) >= self.max_entries:
+                self._cache.clear()
+            surface = font.render(text, True, color)
+            self._cache[key] = surface
+        return surface
+
+
+class HUD:
+    """In-game HUD composed into one cached surface"""
+
+    def __init__(self, font, small_font, text_cache=None, width=WIDTH, height=HEIGHT):
+        """
+        Initialize the HUD.
+
+        Args:
+            font: Font for large messages
+            small_font: Font for HUD text
+            text_cache: Optional TextCache to share with other screens
+            width: Screen width
+            height: Screen height
+        """
+        self.font = font
+        self.small_font = small_font
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.width = width
+        self.height = height
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.regions: List[pygame.Rect] = []
+        self._state = None
+
+    def _collect_state(self, game):
+        """Gather every value the HUD displays, so changes can be detected cheaply"""
+        player = game.player
+        health_color = (0, 255, 0) if player.health > 50 else (255, 165, 0) if player.health > 25 else (255, 0, 0)
+        # Add damage feedback effect
+        if player.damage_taken_timer > 0:
+            health_color = (255, 0, 0)
+        return (
+            player.health, player.max_health, health_color,
+            game.level,
+            frozenset(game.collected_stickers),
+            player.armor_timer // 60 if player.armor_active else None,
+            player.attack_mod_timer // 60 if player.attack_mod > 1.0 else None,
+            player.speed_mod_timer // 60 if player.speed_mod > 1.0 else None,
+            player.pickup_collected_timer > 0,
+            any(door.should_show_unlock_message() for door in game.doors),
+        )
+
+    def _add_text(self, text, color, pos, font=None):
+        """Copy rendered text onto the HUD surface and record its region"""
+        text_surface = self.text_cache.render(font or self.small_font, text, color)
+        # HUD elements never overlap, so copying onto the transparent surface
+        # (RGBA max against zero) keeps the text's exact colors and alpha
+        rect = self.surface.blit(text_surface, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        self.regions.append(rect)
+
+    def _compose(self, state):
+        """Re-render the HUD surface for new values"""
+        (health, max_health, health_color, level, stickers,
+         armor_secs, attack_secs, speed_secs, show_pickup, show_unlock) = state
+
+        self.surface.fill((0, 0, 0, 0))
+        self.regions = []
+
+        # Draw player health
+        self._add_text(f"Health: {health}/{max_health}", health_color, (10, 10))
+
+        # Draw level
+        self._add_text(f"Level: {level}", (0, 0, 0), (self.width - 200, 10))
+
+        # Draw collected stickers
+        self._add_text(f"Stickers: {len(stickers)}", (255, 165, 0), (self.width // 2 - 60, 10))
+
+        # Draw sticker indicators
+        sticker_x = 50
+        for i in range(10):
+            color = (255, 215, 0) if i in stickers else (200, 200, 200)
+            pygame.draw.circle(self.surface, color, (sticker_x + i * 20, 40), 5)
+        self.regions.append(pygame.Rect(sticker_x - 5, 35, 10 * 20, 10))
+
+        # Draw active power-ups with duration
+        powerup_y = 70
+        if armor_secs is not None:
+            self._add_text(f"ARMOR: {armor_secs}s", (150, 150, 150), (10, powerup_y))
+            powerup_y += 25
+        if attack_secs is not None:
+            self._add_text(f"ATTACK+: {attack_secs}s", (255, 100, 100), (10, powerup_y))
+            powerup_y += 25
+        if speed_secs is not None:
+            self._add_text(f"SPEED+: {speed_secs}s", (200, 0, 200), (10, powerup_y))
+            powerup_y += 25
+
+        # Draw pickup collected feedback
+        if show_pickup:
+            self._add_text("HEALTH +", (0, 255, 0), (self.width - 150, 50))
+
+        # Draw controls hint
+        self._add_text(CONTROLS_HINT, (100, 100, 100), (10, self.height - 30))
+
+        # Draw door unlock message if applicable
+        if show_unlock:
+            unlock_text = self.text_cache.render(self.font, "DOOR UNLOCKED!", (0, 255, 0))
+            text_rect = unlock_text.get_rect(center=(self.width // 2, self.height // 2))
+            # Draw background box for text
+            bg_rect = text_rect.inflate(40, 20)
+            pygame.draw.rect(self.surface, (0, 0, 0), bg_rect)
+            pygame.draw.rect(self.surface, (0, 255, 0), bg_rect, 3)
+            self.surface.blit(unlock_text, text_rect)
+            self.regions.append(bg_rect)
+
+    def draw(self, screen, game):
+        """
+        Draw the HUD, re-rendering it only if a displayed value changed.
+
+        Args:
+            screen: Surface to draw on
+            game: Game whose state is displayed
+
+        Returns:
+            List of screen rects the HUD was drawn to
+        """
+        state = self._collect_state(game)
+        if state != self._state:
+            self._compose(state)
+            self._state = state
+        return [screen.blit(self.surface, rect.topleft, rect) for rect in self.regions]
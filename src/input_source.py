@@ -0,0 +1,349 @@
+"""
+Pluggable player input with recording and replay.
+The player reads one bitmask of held buttons per simulation step from an
+input source instead of polling the keyboard itself. Recording those masks
+(one byte per step) together with periodic Game snapshots as keyframes
+gives a compact replay that plays back deterministically, can seek to any
+step, and runs headless as fast as the simulation allows.
+
+Replay files hold the keyframes as compressed JSON of the snapshot's plain
+tuples rather than as snapshot blobs, so loading a shared replay never
+unpickles anything from the file.
+"""
+
+import base64
+import json
+import pickle
+import random
+import struct
+import zlib
+from typing import List, Optional, Tuple
+import pygame
+from settings import REPLAY_KEYFRAME_INTERVAL, GAME_STATE_PLAYING
+
+# Buttons (one bit each)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_DOWN = 8
+INPUT_ATTACK = 16
+
+# Keyboard keys for each button
+KEY_BINDINGS = (
+    (pygame.K_LEFT, INPUT_LEFT),
+    (pygame.K_RIGHT, INPUT_RIGHT),
+    (pygame.K_SPACE, INPUT_JUMP),
+    (pygame.K_DOWN, INPUT_DOWN),
+    (pygame.K_a, INPUT_ATTACK),
+)
+
+REPLAY_MAGIC = b'PGRP'
+REPLAY_VERSION = 2
+
+
+def _to_plain(value):
+    """Turn snapshot state (nested tuples of numbers, strings and bytes) into JSON values"""
+    if isinstance(value, (tuple, list)):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, bytes):
+        return {'bytes': base64.b64encode(value).decode('ascii')}
+    return value
+
+
+def _from_plain(value):
+    """Turn JSON values written by _to_plain back into snapshot state"""
+    if isinstance(value, list):
+        return tuple(_from_plain(item) for item in value)
+    if isinstance(value, dict):
+        return base64.b64decode(value['bytes'])
+    return value
+
+
+def _encode_keyframe(blob):
+    """
+    Convert a snapshot blob to the plain form stored in replay files.
+
+    Args:
+        blob: Bytes returned by Game.snapshot() in this process
+
+    Returns:
+        Compressed JSON bytes
+    """
+    state = pickle.loads(blob)
+    return zlib.compress(json.dumps(_to_plain(state), separators=(',', ':')).encode('utf-8'))
+
+
+def _decode_keyframe(data):
+    """
+    Convert a keyframe read from a replay file back into a snapshot blob.
+
+    Args:
+        data: Compressed JSON bytes written by _encode_keyframe
+
+    Returns:
+        Bytes that Game.restore() accepts, pickled here from plain data only
+    """
+    state = _from_plain(json.loads(zlib.decompress(data).decode('utf-8')))
+    return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+
+class KeyboardInput:
+    """Reads the buttons currently held on the keyboard"""
+
+    def read(self):
+        """Return the bitmask of held buttons for this step"""
+        keys = pygame.key.get_pressed()
+        mask = 0
+        for key, button in KEY_BINDINGS:
+            if keys[key]:
+                mask |= button
+        return mask
+
+
+class ActionInput:
+    """Holds whatever buttons a program (an agent or a bot) sets each step"""
+
+    def __init__(self, buttons=0):
+        """
+        Initialize with a set of held buttons.
+
+        Args:
+            buttons: Bitmask of held buttons
+        """
+        self.buttons = buttons
+
+    def read(self):
+        """Return the bitmask of held buttons for this step"""
+        return self.buttons
+
+
+class RandomInput:
+    """Holds random buttons, picking new ones every few steps (a reproducible stand-in player)"""
+
+    def __init__(self, seed=0, hold=10):
+        """
+        Initialize the random player.
+
+        Args:
+            seed: Seed for the button choices
+            hold: Steps each random choice is held for
+        """
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.step = 0
+        self.buttons = 0
+
+    def read(self):
+        """Return the bitmask of held buttons for this step"""
+        if self.step % self.hold == 0:
+            self.buttons = self.rng.randrange(INPUT_ATTACK * 2)
+        self.step += 1
+        return self.buttons
+
+
+class Replay:
+    """Recorded per-step input masks plus state keyframes"""
+
+    def __init__(self, seed=0, level=1):
+        """
+        Initialize an empty replay.
+
+        Args:
+            seed: Seed of the recorded game
+            level: Level the recording started on
+        """
+        self.seed = seed
+        self.level = level
+        self.masks = bytearray()
+        # (step, seed, level, Game.snapshot() taken before that step), in step order
+        self.keyframes: List[Tuple[int, int, int, bytes]] = []
+
+    def __len__(self):
+        """Number of recorded steps"""
+        return len(self.masks)
+
+    def keyframe_before(self, step):
+        """Return the latest keyframe at or before a step"""
+        best = None
+        for keyframe in self.keyframes:
+            if keyframe[0] > step:
+                break
+            best = keyframe
+        return best
+
+    def save(self, path):
+        """
+        Write the replay to a file.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, 'wb') as f:
+            f.write(REPLAY_MAGIC)
+            f.write(struct.pack('<HiiII', REPLAY_VERSION, self.seed, self.level,
+                                len(self.masks), len(self.keyframes)))
+            f.write(self.masks)
+            for step, seed, level, blob in self.keyframes:
+                data = _encode_keyframe(blob)
+                f.write(struct.pack('<IiiI', step, seed, level, len(data)))
+                f.write(data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay written by save(). Keyframes are stored as plain
+        data, so replays from anyone can be loaded and played.
+
+        Args:
+            path: Replay file path
+
+        Returns:
+            The loaded Replay
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != REPLAY_MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        header = struct.Struct('<HiiII')
+        version, seed, level, n_steps, n_keyframes = header.unpack_from(data, 4)
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Replay version {version} is not supported (expected {REPLAY_VERSION})")
+        replay = cls(seed, level)
+        offset = 4 + header.size
+        replay.masks = bytearray(data[offset:offset + n_steps])
+        offset += n_steps
+        for _ in range(n_keyframes):
+            step, seed, level, size = struct.unpack_from('<IiiI', data, offset)
+            offset += 16
+            try:
+                blob = _decode_keyframe(data[offset:offset + size])
+            except (ValueError, KeyError, TypeError, zlib.error) as e:
+                raise ValueError(f"{path} has a corrupt keyframe at step {step}: {e}")
+            replay.keyframes.append((step, seed, level, blob))
+            offset += size
+        return replay
+
+
+class RecordingInput:
+    """Passes another source's input through while recording it into a Replay"""
+
+    def __init__(self, game, source=None, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """
+        Initialize the recorder.
+
+        Args:
+            game: Game being recorded (snapshotted for keyframes)
+            source: Input source to record (defaults to the keyboard)
+            keyframe_interval: Steps between keyframes
+        """
+        self.game = game
+        self.source = source if source is not None else KeyboardInput()
+        self.keyframe_interval = keyframe_interval
+        self.replay = Replay(game.seed, game.level)
+        self._recorded_level = None
+
+    def read(self):
+        """Return (and record) the source's bitmask for this step"""
+        game = self.game
+        step = len(self.replay.masks)
+        level = (game.seed, game.level)
+        # A new level (or a restart) always gets a keyframe, so playback can follow it
+        if step % self.keyframe_interval == 0 or level != self._recorded_level:
+            self._recorded_level = level
+            # Nothing has changed yet this step, so this is the state before it
+            self.replay.keyframes.append((step, game.seed, game.level, game.snapshot()))
+        mask = self.source.read()
+        self.replay.masks.append(mask)
+        return mask
+
+
+class ReplayInput:
+    """Plays back the input masks of a Replay"""
+
+    def __init__(self, replay: Replay):
+        """
+        Initialize playback from the first step.
+
+        Args:
+            replay: Replay to play
+        """
+        self.replay = replay
+        self.step = 0
+        self._keyframes_at = {keyframe[0]: keyframe for keyframe in replay.keyframes}
+
+    @property
+    def finished(self):
+        """True once every recorded step has been played"""
+        return self.step >= len(self.replay.masks)
+
+    def read(self):
+        """Return the recorded bitmask for this step (no buttons after the end)"""
+        if self.finished:
+            return 0
+        mask = self.replay.masks[self.step]
+        self.step += 1
+        return mask
+
+    def advance(self, game):
+        """
+        Play the next recorded step.
+
+        Args:
+            game: Game playing this replay (its input source should be self)
+
+        Returns:
+            False if there was nothing left to play
+        """
+        keyframe = self._keyframes_at.get(self.step)
+        if keyframe is not None and keyframe[1:3] != (game.seed, game.level):
+            # The recording went on to another level here
+            game.restore(keyframe[3])
+        elif game.game_state != GAME_STATE_PLAYING:
+            # The level ended; continue from the recording's next keyframe, if any
+            keyframe = next((k for k in self.replay.keyframes if k[0] >= self.step), None)
+            if keyframe is None:
+                return False
+            self.step = keyframe[0]
+            game.restore(keyframe[3])
+        if self.finished:
+            return False
+        game.update()
+        return True
+
+    def seek(self, game, step):
+        """
+        Move a game to the state it had before a recorded step, by restoring
+        the nearest earlier keyframe and simulating forward from there.
+
+        Args:
+            game: Game playing this replay (its input source should be self)
+            step: Step to seek to
+        """
+        keyframe = self.replay.keyframe_before(step)
+        if keyframe is None:
+            raise ValueError(f"No keyframe at or before step {step}")
+        self.step = keyframe[0]
+        game.restore(keyframe[3])
+        while self.step < step and self.advance(game):
+            pass
+
+
+def play_replay(replay: Replay, steps: Optional[int] = None):
+    """
+    Play a replay headless at full speed.
+
+    Args:
+        replay: Replay to play
+        steps: Number of steps to play (defaults to all of them)
+
+    Returns:
+        The Game after playback
+    """
+    from game import Game
+    playback = ReplayInput(replay)
+    game = Game(level=replay.level, seed=replay.seed, headless=True, input_source=playback)
+    playback.seek(game, 0)
+    end = len(replay) if steps is None else min(steps, len(replay))
+    while playback.step < end and playback.advance(game):
+        pass
+    return game
@@ -0,0 +1,253 @@
+"""
+Cache of generated levels.
+A generated level is described with plain tuples (platform rects, obstacle
+types, enemy parameters, pickups, door and treasure) that rebuild its
+sprites directly, without running the terrain and obstacle generators
+again. Descriptions are kept in a small in-memory tier for restarts and,
+if a cache directory is set, in an on-disk tier of compressed JSON files
+keyed by (seed, level, generator version). Cached files are plain data, so
+reading one never runs code, and the directory is pruned to a fixed number
+of files.
+"""
+
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Optional
+from settings import LEVEL_CACHE_DIR, LEVEL_CACHE_MEMORY_SIZE, LEVEL_CACHE_MAX_FILES
+from platform import Platform
+from enemies import Enemy
+from boss import Boss
+from obstacles import OBSTACLE_FACTORIES
+from health_pickup import HealthPickup
+from powerup import ArmorPowerUp, AttackPowerUp, SpeedPowerUp
+from door import Door
+from treasure import Treasure
+
+# Bump whenever level generation changes, so stale cached levels are ignored
+LEVEL_GENERATOR_VERSION = 2
+
+POWERUP_TYPES = {cls.__name__: cls for cls in (ArmorPowerUp, AttackPowerUp, SpeedPowerUp)}
+
+
+def describe_level(state):
+    """
+    Describe a freshly generated level.
+
+    Args:
+        state: LevelState (or Game) whose level was just generated
+
+    Returns:
+        Dict of plain tuples that rehydrate_level can rebuild the level from,
+        including where generation left the level's random generator
+    """
+    enemies = [(e.spawn_x, e.spawn_y, e.pattern, e.bounds, e.speed, e.max_health,
+                e.melee_damage, e.ranged, e.color)
+               for e in state.enemies if e is not state.boss]
+    return {
+        'version': LEVEL_GENERATOR_VERSION,
+        'platforms': [tuple(p.rect) for p in state.platforms],
+        'enemies': enemies,
+        'boss': state.boss.rect.topleft if state.boss else None,
+        'obstacles': [(o.sprite_type, o.rect.x, o.rect.y) for o in state.obstacles],
+        'health_pickups': [(p.rect.centerx, p.rect.centery, p.heal_amount) for p in state.health_pickups],
+        'powerups': [(type(p).__name__, p.x, p.y, p.duration) for p in state.powerups],
+        'doors': [tuple(d.rect) for d in state.doors],
+        'treasures': [(t.rect.centerx, t.rect.centery, t.sticker_id) for t in state.treasures],
+        'random_state': state.rng.getstate(),
+    }
+
+
+def rehydrate_level(state, description):
+    """
+    Rebuild a described level into empty level groups.
+
+    Args:
+        state: LevelState (or Game) to populate
+        description: Dict returned by describe_level
+    """
+    for x, y, w, h in description['platforms']:
+        state.platforms.add(Platform(x, y, w, h))
+    if description['boss'] is not None:
+        state.boss = Boss(*description['boss'])
+        state.enemies.add(state.boss)
+    for x, y, pattern, bounds, speed, health, melee_damage, ranged, color in description['enemies']:
+        state.enemies.add(Enemy(x, y, pattern=pattern, bounds=bounds, speed=speed, health=health,
+                               melee_damage=melee_damage, ranged=ranged, color=color))
+    for sprite_type, x, y in description['obstacles']:
+        state.obstacles.add(OBSTACLE_FACTORIES[sprite_type](x, y))
+    for x, y, heal_amount in description['health_pickups']:
+        state.health_pickups.add(HealthPickup(x, y, heal_amount=heal_amount))
+    for name, x, y, duration in description['powerups']:
+        state.powerups.add(POWERUP_TYPES[name](x, y, duration=duration))
+    for x, y, w, h in description['doors']:
+        state.doors.add(Door(x, y, width=w, height=h))
+    for x, y, sticker_id in description['treasures']:
+        treasure = Treasure(x, y, sticker_id=sticker_id)
+        treasure.hide()
+        state.treasures.add(treasure)
+    # Leave the level's random generator exactly where generating the level would have
+    state.rng.setstate(description['random_state'])
+
+
+def _tuples(value):
+    """Turn the lists JSON gives back into the tuples a description was made of"""
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    return value
+
+
+def _decode(data):
+    """
+    Read a description written by _encode.
+
+    Args:
+        data: Compressed JSON bytes
+
+    Returns:
+        Level description, with the same lists and tuples describe_level makes
+    """
+    description = json.loads(zlib.decompress(data).decode('utf-8'))
+    for key, value in description.items():
+        if key == 'random_state' or not isinstance(value, list):
+            description[key] = _tuples(value)
+        else:
+            description[key] = [_tuples(item) for item in value]
+    return description
+
+
+def _encode(description):
+    """Write a level description as compressed JSON"""
+    return zlib.compress(json.dumps(description, separators=(',', ':')).encode('utf-8'))
+
+
+class LevelCache:
+    """Two-tier (memory, then disk) cache of level descriptions"""
+
+    def __init__(self, cache_dir: Optional[str] = LEVEL_CACHE_DIR, memory_size=LEVEL_CACHE_MEMORY_SIZE,
+                 max_files=LEVEL_CACHE_MAX_FILES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached level files (None keeps levels in memory only)
+            memory_size: Number of levels kept in memory, least recently used dropped first
+            max_files: Number of level files kept in the directory, least recently used removed first
+        """
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self.max_files = max_files
+        self.memory: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, seed, level):
+        return os.path.join(self.cache_dir, f'level_{seed}_{level}_v{LEVEL_GENERATOR_VERSION}.lvl')
+
+    def _remember(self, key, description):
+        self.memory[key] = description
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def get(self, seed, level):
+        """
+        Look up a generated level.
+
+        Args:
+            seed: Game seed
+            level: Level number
+
+        Returns:
+            Level description, or None if the level has not been cached
+        """
+        key = (seed, level, LEVEL_GENERATOR_VERSION)
+        description = self.memory.get(key)
+        if description is None and self.cache_dir is not None:
+            path = self._path(seed, level)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as f:
+                        description = _decode(f.read())
+                    if description.get('version') != LEVEL_GENERATOR_VERSION:
+                        description = None
+                    else:
+                        # Mark it as recently used, so pruning keeps it
+                        os.utime(path)
+                except Exception as e:
+                    print(f"[-] Ignoring unreadable cached level {path}: {e}")
+                    description = None
+        if description is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, description)
+        return description
+
+    def put(self, seed, level, description):
+        """
+        Store a generated level in memory and on disk.
+
+        Args:
+            seed: Game seed
+            level: Level number
+            description: Dict returned by describe_level
+        """
+        self._remember((seed, level, LEVEL_GENERATOR_VERSION), description)
+        if self.cache_dir is None:
+            return
+        path = self._path(seed, level)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees half a file
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_encode(description))
+            os.replace(tmp_path, path)
+            self._prune()
+        except OSError as e:
+            print(f"[-] Could not write cached level {path}: {e}")
+
+    def _level_files(self):
+        """Paths of the cached level files on disk"""
+        return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith('.lvl')]
+
+    def _prune(self):
+        """Remove the least recently used level files past max_files"""
+        paths = self._level_files()
+        if len(paths) <= self.max_files:
+            return
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                # Removed by another process meanwhile
+                pass
+        for path in sorted(mtimes, key=mtimes.get)[:len(mtimes) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Forget every cached level, in memory and on disk"""
+        self.memory.clear()
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return
+        for path in self._level_files():
+            os.remove(path)
+
+
+# Global level cache instance
+_level_cache: Optional[LevelCache] = None
+
+
+def get_level_cache() -> LevelCache:
+    """Get or create the global level cache"""
+    global _level_cache
+    if _level_cache is None:
+        _level_cache = LevelCache()
+    return _level_cache
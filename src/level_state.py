@@ -0,0 +1,59 @@
+"""
+Per-level game state.
+Everything that belongs to one level (player, sprite groups, platform
+index, background and pre-rendered layers) lives in a LevelState, so a
+level can be built off to the side, e.g. on a worker thread while the
+level-complete screen is shown, and then swapped into the Game at once.
+"""
+
+import random
+import pygame
+from projectiles import ProjectileSystem
+
+
+class LevelState:
+    """Container for the objects of one level"""
+
+    # Attributes swapped into the Game when the level starts
+    ATTRIBUTES = ('level', 'rng', 'player', 'platforms', 'enemies', 'projectiles', 'obstacles', 'treasures',
+                  'health_pickups', 'powerups', 'doors', 'boss', 'enemies_defeated', 'platform_index',
+                  'background_image', 'parallax_layers', 'level_canvas', 'underground_layer', 'all_sprites')
+
+    def __init__(self, level):
+        """
+        Initialize an empty level.
+
+        Args:
+            level: Level number
+        """
+        self.level = level
+        # Generation draws from its own generator, so levels can be built
+        # concurrently (and many games can run side by side)
+        self.rng = random.Random()
+        self.player = None
+        self.platforms = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.projectiles = ProjectileSystem()
+        self.obstacles = pygame.sprite.Group()
+        self.treasures = pygame.sprite.Group()
+        self.health_pickups = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.doors = pygame.sprite.Group()
+        self.boss = None
+        self.enemies_defeated = False
+        self.platform_index = None
+        self.background_image = None
+        self.parallax_layers = []
+        self.level_canvas = None
+        self.underground_layer = None
+        self.all_sprites = None
+
+    def apply_to(self, game):
+        """
+        Make this the game's current level.
+
+        Args:
+            game: Game to swap the level into
+        """
+        for name in self.ATTRIBUTES:
+            setattr(game, name, getattr(self, name))
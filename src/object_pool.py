@@ -0,0 +1,66 @@
+"""
+Generic object pool for short-lived game objects.
+Objects are preallocated and recycled through reset() instead of being
+constructed for every use, which avoids allocation churn (and the garbage
+collection pauses that come with it) during busy fights.
+"""
+
+from typing import Callable, List
+
+
+class ObjectPool:
+    """Recycles objects that implement reset(*args, **kwargs)"""
+
+    def __init__(self, factory: Callable, capacity=0):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Called with no arguments to create a new object
+            capacity: Number of objects to preallocate
+        """
+        self.factory = factory
+        self._free: List = [factory() for _ in range(capacity)]
+        self.hits = 0    # Acquires served by a recycled object
+        self.misses = 0  # Acquires that had to create a new object
+
+    def __len__(self):
+        """Number of objects currently available for reuse"""
+        return len(self._free)
+
+    @property
+    def hit_rate(self):
+        """Fraction of acquires served without allocating"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 1.0
+
+    def acquire(self, *args, **kwargs):
+        """
+        Get an object, reusing a released one if possible.
+
+        Args:
+            args, kwargs: Passed to the object's reset()
+
+        Returns:
+            Reset object; it gets a pool attribute so it can release itself
+        """
+        if self._free:
+            obj = self._free.pop()
+            self.hits += 1
+        else:
+            obj = self.factory()
+            self.misses += 1
+        obj.reset(*args, **kwargs)
+        obj.pool = self
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool once it is no longer used.
+
+        Args:
+            obj: Object previously returned by acquire()
+        """
+        if obj.pool is self:
+            obj.pool = None
+            self._free.append(obj)
@@ -1,18 +1,23 @@
 import pygame
 from settings import OBSTACLE_SIZE, GRAY, RED, YELLOW, GREEN, BLUE, BLACK
 from asset_loader import get_loader
+from collision import LAYER_PLAYER, LAYER_ATTACK, LAYER_OBSTACLE
 
 
 class Obstacle(pygame.sprite.Sprite):
+    collision_layer = LAYER_OBSTACLE
+    collision_mask = LAYER_PLAYER | LAYER_ATTACK
+    
     def __init__(self, x, y, width=OBSTACLE_SIZE, height=OBSTACLE_SIZE, damage=0, blocking=False, speed_mod=1.0, color=GRAY, single_use=False, health=None, sprite_type=None):
         super().__init__()
         
         # Try to load obstacle sprite from assets
         if sprite_type:
             loader = get_loader()
-            obstacle_sprite = loader.get_obstacle_sprite(sprite_type)
+            # Scaled once by the loader and shared between obstacles of the same size
+            obstacle_sprite = loader.get_variant(f'obstacles/{sprite_type}.png', (width, height))
             if obstacle_sprite is not None:
-                self.image = pygame.transform.scale(obstacle_sprite, (width, height))
+                self.image = obstacle_sprite
             else:
                 # Fallback: draw colored sprite
                 self.image = pygame.Surface((width, height))
@@ -32,8 +37,17 @@ class Obstacle(pygame.sprite.Sprite):
         self.color = color
         self.width = width
         self.height = height
+        self.sprite_type = sprite_type
         self.hitbox = self.rect.copy()
 
+    def get_state(self):
+        """Return the obstacle's mutable state as a tuple (see Game.snapshot)"""
+        return (self.health,)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        (self.health,) = state
+
     def take_damage(self, amount):
         """Obstacle takes damage and is destroyed when health reaches zero"""
         if self.health is not None:
@@ -43,6 +57,20 @@ class Obstacle(pygame.sprite.Sprite):
                 return True
         return False
 
+    def apply_to(self, player):
+        """Apply this obstacle's effects to a player touching it"""
+        if self.damage != 0:
+            player.take_damage(self.damage, self.sprite_type)
+            if self.single_use:
+                self.kill()
+        if self.speed_mod != 1.0:
+            player.speed_mod = self.speed_mod
+            player.speed_mod_timer = 120
+        if self.blocking:
+            if player.rect.bottom > self.rect.top and player.vel_y > 0:
+                player.rect.bottom = self.rect.top
+                player.vel_y = 0
+
     def draw_health_bar(self, surface):
         """Draw a health bar above the obstacle if it has health"""
         if self.health is not None and self.max_health is not None:
@@ -103,3 +131,17 @@ def healing_plant(x, y):
 def bouncy(x, y):
     return Obstacle(x, y, damage=0, blocking=False, color=(255, 150, 255), speed_mod=1.0, health=2, sprite_type='bouncy')
 
+
+# Obstacle factories by sprite_type, used to rebuild cached levels
+OBSTACLE_FACTORIES = {
+    'spike': spike,
+    'fire': fire,
+    'slow_trap': slow_trap,
+    'slippery': slippery,
+    'block': block,
+    'falling_rock': falling_rock,
+    'poison_pool': poison_pool,
+    'electric': electric,
+    'healing_plant': healing_plant,
+    'bouncy': bouncy,
+}
@@ -0,0 +1,126 @@
+"""
+Parallax background layers.
+Each image layer is tiled vertically once into a cached surface tall enough
+that any scroll position is covered by a single clipped blit, and layers
+hidden behind an opaque layer in front of them are skipped entirely.
+"""
+
+import math
+import pygame
+from typing import Dict, List, Optional, Tuple
+from settings import WIDTH, HEIGHT
+
+# Loaded background images, keyed by (path, width, height)
+_image_cache: Dict[Tuple[str, int, int], pygame.Surface] = {}
+
+# Pre-tiled surfaces shared between layers built from the same image
+_tiled_cache: Dict[Tuple[pygame.Surface, int], pygame.Surface] = {}
+
+
+class ParallaxLayer:
+    """One background layer that scrolls at a fraction of the camera speed"""
+
+    def __init__(self, depth, image=None, color=None, screen_height=HEIGHT):
+        """
+        Initialize the layer.
+
+        Args:
+            depth: Scroll speed relative to the camera (0.0-1.0), lower = further away
+            image: Optional pygame Surface tiled vertically to fill the screen
+            color: RGB fill used when no image is given
+            screen_height: Height of the viewport the layer is drawn into
+        """
+        self.depth = depth
+        self.color = color
+        self.image = image
+        if image is not None:
+            self.tile_height = image.get_height()
+            self.surface = _get_tiled_surface(image, screen_height)
+            # Converted images without per-pixel alpha or a colorkey hide everything behind them
+            self.opaque = image.get_alpha() is None and image.get_colorkey() is None
+        else:
+            self.tile_height = screen_height
+            self.surface = None
+            self.opaque = True
+        self._screen_height = screen_height
+
+    def draw(self, surface, camera_y):
+        """
+        Draw the layer for the given camera position.
+
+        Args:
+            surface: Pygame surface to draw on
+            camera_y: Camera y position in world coordinates
+        """
+        if self.surface is None:
+            surface.fill(self.color)
+            return
+        offset = int(camera_y * self.depth) % self.tile_height
+        surface.blit(self.surface, (0, 0), (0, offset, self.surface.get_width(), self._screen_height))
+
+
+def _get_tiled_surface(image, screen_height):
+    """
+    Stack copies of an image vertically so a screen-height window starting
+    anywhere in the first copy lies entirely within the surface.
+
+    Args:
+        image: Tile image
+        screen_height: Height of the viewport
+
+    Returns:
+        Cached pre-tiled pygame Surface
+    """
+    key = (image, screen_height)
+    tiled = _tiled_cache.get(key)
+    if tiled is None:
+        tile_height = image.get_height()
+        copies = math.ceil(screen_height / tile_height) + 1
+        tiled = pygame.Surface((image.get_width(), tile_height * copies), 0, image)
+        for i in range(copies):
+            tiled.blit(image, (0, i * tile_height))
+        _tiled_cache[key] = tiled
+    return tiled
+
+
+def draw_layers(surface, layers: List[ParallaxLayer], camera_y) -> bool:
+    """
+    Draw parallax layers back to front, skipping any layer fully covered by
+    an opaque layer in front of it.
+
+    Args:
+        surface: Pygame surface to draw on
+        layers: Layers ordered from farthest to nearest
+        camera_y: Camera y position in world coordinates
+
+    Returns:
+        True if the layers covered the whole surface
+    """
+    first_visible = 0
+    for i in range(len(layers) - 1, -1, -1):
+        if layers[i].opaque:
+            first_visible = i
+            break
+    for layer in layers[first_visible:]:
+        layer.draw(surface, camera_y)
+    return any(layer.opaque for layer in layers)
+
+
+def load_background_image(path, width=WIDTH, height=HEIGHT) -> Optional[pygame.Surface]:
+    """
+    Load and scale a background image once, sharing it between levels and restarts.
+
+    Args:
+        path: Image file path
+        width: Target width in pixels
+        height: Target height in pixels
+
+    Returns:
+        Scaled pygame Surface
+    """
+    key = (path, width, height)
+    image = _image_cache.get(key)
+    if image is None:
+        image = pygame.transform.scale(pygame.image.load(path).convert(), (width, height))
+        _image_cache[key] = image
+    return image
@@ -0,0 +1,43 @@
+"""
+Shared character physics for the player, enemies and boss.
+Landing is resolved with a swept test along the vertical motion of a step,
+so an entity falling faster than a platform is thick lands on it instead of
+tunneling through.
+"""
+
+from platform_index import as_platform_index
+
+
+def sweep_landing(platforms, rect, prev_bottom, inflate=0, prev_left=None):
+    """
+    Land a rect that just moved on the platform it hit, if any.
+
+    If its bottom edge swept past platform top edges during the step, the
+    rect lands on the first one it crossed, following its path from where
+    it started the step. Failing that, it lands on any platform it overlaps
+    at its new position (the original overlap rule, including the inflated
+    edge), which also keeps entities resting on the platform they stand on.
+
+    Args:
+        platforms: PlatformIndex (or group of platforms)
+        rect: Entity rect after the move; its bottom is snapped onto the platform
+        prev_bottom: rect.bottom before the step
+        inflate: Extra height added around platform rects for the overlap test
+        prev_left: rect.left before the step (defaults to a straight drop)
+
+    Returns:
+        The platform landed on, or None
+    """
+    index = as_platform_index(platforms)
+    platform = None
+    if rect.bottom > prev_bottom:
+        # Time of impact: the first top edge the feet crossed this step
+        if prev_left is None:
+            prev_left = rect.left
+        platform = index.first_crossed(prev_left, prev_left + rect.width, prev_bottom, rect.bottom,
+                                       rect.left - prev_left)
+    if platform is None:
+        platform = index.first_colliding(rect, inflate)
+    if platform is not None:
+        rect.bottom = platform.rect.top
+    return platform
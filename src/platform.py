@@ -2,6 +2,11 @@ import pygame
 from settings import GREEN
 from asset_loader import get_loader
 
+# Tiled platform images by (width, height); platforms never draw on their
+# image, so every platform of the same size can share one
+_tiled_images = {}
+
+
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height):
         super().__init__()
@@ -10,20 +15,23 @@ class Platform(pygame.sprite.Sprite):
         loader = get_loader()
         grass_sprite = loader.get_tile_sprite('grass')
         
-        if grass_sprite is not None:
+        if (width, height) in _tiled_images:
+            self.image = _tiled_images[(width, height)]
+        elif grass_sprite is not None:
             # Create a tiled surface using the grass texture
             self.image = pygame.Surface((width, height))
             tile_size = 64
             for tx in range(0, width, tile_size):
                 for ty in range(0, height, tile_size):
                     # Draw grass tile
-                    scaled_tile = pygame.transform.scale(grass_sprite, 
-                                                        (min(tile_size, width - tx), 
-                                                         min(tile_size, height - ty)))
+                    scaled_tile = loader.get_variant('tiles/grass.png',
+                                                     (min(tile_size, width - tx),
+                                                      min(tile_size, height - ty)))
                     self.image.blit(scaled_tile, (tx, ty))
         else:
             # Fallback: use solid green color
             self.image = pygame.Surface((width, height))
             self.image.fill(GREEN)
+        _tiled_images[(width, height)] = self.image
         
         self.rect = self.image.get_rect(topleft=(x, y))
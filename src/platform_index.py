@@ -0,0 +1,166 @@
+"""
+Immutable spatial index over a level's static platforms.
+Platforms are bucketed by x into columns and sorted by top edge within each
+column, so "which platform is under this rect" only bisects the columns the
+rect overlaps instead of testing (and inflating) every platform.
+"""
+
+import bisect
+from typing import List, Optional
+
+
+class PlatformIndex:
+    """Answers ground and topmost-platform queries for static platforms"""
+
+    def __init__(self, platforms, bucket_width=128):
+        """
+        Build the index. Platforms must not move afterwards.
+
+        Args:
+            platforms: Iterable of Platform sprites (e.g. a pygame Group)
+            bucket_width: Width of each x column in pixels
+        """
+        self.platforms: List = list(platforms)
+        self.bucket_width = bucket_width
+        self.max_height = max((p.rect.height for p in self.platforms), default=0)
+
+        # Every column holds (top, order, platform, left, right, bottom) sorted
+        # by top edge; the order is the platform's position in the original
+        # group, which is what the callers' first-match semantics depend on.
+        # The edges are copied out so queries compare plain ints.
+        self._columns = {}
+        for order, platform in enumerate(self.platforms):
+            rect = platform.rect
+            entry = (rect.top, order, platform, rect.left, rect.right, rect.bottom)
+            for column in range(rect.left // bucket_width, (rect.right - 1) // bucket_width + 1):
+                self._columns.setdefault(column, []).append(entry)
+        self._tops = {}
+        for column, entries in self._columns.items():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            self._tops[column] = [entry[0] for entry in entries]
+        # Every top edge, so a step that crosses none can skip the columns
+        self._all_tops = sorted(platform.rect.top for platform in self.platforms)
+
+        ordered = sorted(enumerate(self.platforms), key=lambda item: (item[1].rect.top, item[0]))
+        self._topmost = ordered[0][1] if ordered else None
+
+    def __iter__(self):
+        return iter(self.platforms)
+
+    def __len__(self):
+        return len(self.platforms)
+
+    def first_colliding(self, rect, inflate=0):
+        """
+        Find the platform a rect collides with, as if scanning the platforms
+        in their original order and testing rect.colliderect(platform.rect.inflate(0, inflate)).
+
+        Args:
+            rect: pygame Rect to test (e.g. an entity that just moved)
+            inflate: Extra height added around each platform rect
+
+        Returns:
+            First colliding platform in original order, or None
+        """
+        width = self.bucket_width
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if left == right or top == bottom:
+            # colliderect never reports an empty rect as colliding
+            return None
+        # Any platform whose (inflated) rect reaches the query rect has its
+        # top edge inside this range
+        low = top - self.max_height - inflate
+        high = bottom + inflate
+        # Rect.inflate(0, inflate) moves the top up by half (rounded toward
+        # zero) and the bottom down by the rest
+        grow_up = int(inflate / 2)
+        grow_down = inflate - grow_up
+        best_order = None
+        best = None
+        for column in range(left // width, (right - 1) // width + 1):
+            entries = self._columns.get(column)
+            if entries is None:
+                continue
+            tops = self._tops[column]
+            for i in range(bisect.bisect_left(tops, low), bisect.bisect_left(tops, high)):
+                platform_top, order, platform, platform_left, platform_right, platform_bottom = entries[i]
+                if best_order is not None and order >= best_order:
+                    continue
+                # rect.colliderect(platform.rect.inflate(0, inflate)), on ints
+                if (left < platform_right and right > platform_left and
+                        top < platform_bottom + grow_down and bottom > platform_top - grow_up):
+                    best_order = order
+                    best = platform
+        return best
+
+    def first_crossed(self, left, right, from_y, to_y, dx=0):
+        """
+        Find the first platform top edge crossed by a horizontal edge moving
+        down from from_y to to_y (e.g. an entity's feet during one step),
+        optionally sliding sideways by dx on the way.
+
+        An edge that starts level with a top is resting on it rather than
+        crossing it, so only tops in (from_y, to_y] count. The edge is
+        tested where it is when it reaches each top, moving in a straight
+        line from [left, right) to [left + dx, right + dx).
+
+        Args:
+            left: Left x of the moving edge before the move
+            right: Right x of the moving edge before the move (exclusive)
+            from_y: Edge y before the move
+            to_y: Edge y after the move
+            dx: Horizontal distance the edge moves during the step
+
+        Returns:
+            Platform with the highest top in (from_y, to_y] overlapping the
+            edge horizontally (first in original order on ties), or None
+        """
+        all_tops = self._all_tops
+        if bisect.bisect_right(all_tops, from_y) == bisect.bisect_right(all_tops, to_y):
+            # Most steps (e.g. standing still) cross no top edge at all
+            return None
+        width = self.bucket_width
+        best_key = None
+        best = None
+        fall = to_y - from_y
+        # Columns over the whole span the edge sweeps through
+        for column in range(min(left, left + dx) // width, (max(right, right + dx) - 1) // width + 1):
+            entries = self._columns.get(column)
+            if entries is None:
+                continue
+            tops = self._tops[column]
+            for i in range(bisect.bisect_right(tops, from_y), bisect.bisect_right(tops, to_y)):
+                top, order, platform, platform_left, platform_right, _ = entries[i]
+                if best_key is not None and (top, order) >= best_key:
+                    # Entries are sorted, nothing later in this column is earlier
+                    break
+                # Where the edge is when it reaches this top
+                shift = dx * (top - from_y) / fall if dx else 0
+                if left + shift < platform_right and right + shift > platform_left:
+                    best_key = (top, order)
+                    best = platform
+        return best
+
+    def topmost(self) -> Optional[object]:
+        """
+        Get the platform with the highest top edge (smallest y).
+
+        Returns:
+            Topmost platform (first in original order on ties), or None if empty
+        """
+        return self._topmost
+
+
+def as_platform_index(platforms) -> PlatformIndex:
+    """
+    Get an index for platforms, building one if given a plain group or list.
+
+    Args:
+        platforms: PlatformIndex or iterable of Platform sprites
+
+    Returns:
+        PlatformIndex over the platforms
+    """
+    if isinstance(platforms, PlatformIndex):
+        return platforms
+    return PlatformIndex(platforms)
@@ -1,50 +1,92 @@
 import pygame
-from settings import BLUE, PLAYER_WIDTH, PLAYER_HEIGHT, GRAVITY, WIDTH, HEIGHT
+from settings import BLUE, PLAYER_WIDTH, PLAYER_HEIGHT, GRAVITY, WIDTH, HEIGHT, ATTACK_POOL_SIZE
 from asset_loader import get_loader
+from physics import sweep_landing
+from object_pool import ObjectPool
+from input_source import KeyboardInput, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_DOWN, INPUT_ATTACK
+from collision import (LAYER_PLAYER, LAYER_ATTACK, LAYER_ENEMY, LAYER_PROJECTILE, LAYER_OBSTACLE,
+                       LAYER_PICKUP, LAYER_POWERUP, LAYER_TREASURE)
+
+# Fallback sword images (used when assets are missing), keyed by (width, height, direction)
+_fallback_sword_images = {}
+
+
+def _get_fallback_sword_image(width, height, direction):
+    """Draw the fallback sword shape once per size and direction"""
+    key = (width, height, direction)
+    image = _fallback_sword_images.get(key)
+    if image is None:
+        # Fallback: draw a sword-like shape
+        image = pygame.Surface((width, height))
+        image.fill((100, 100, 100))
+        pygame.draw.polygon(image, (200, 200, 100), [
+            (width // 2 - 5, 5), (width // 2 + 5, 5), 
+            (width // 2 + 3, height - 5), (width // 2 - 3, height - 5)
+        ])
+        print("⚠ Sword animation not found, using fallback")
+        
+        # Rotate sword hilt based on direction
+        if direction == -1:
+            image = pygame.transform.flip(image, True, False)
+        
+        image.set_alpha(180)  # Semi-transparent
+        _fallback_sword_images[key] = image
+    return image
+
 
 class Attack(pygame.sprite.Sprite):
-    """Represents the player's attack hitbox"""
-    def __init__(self, x, y, width=70, height=50, direction=1, damage=15):
+    """Represents the player's attack hitbox (recycled through an ObjectPool)"""
+    collision_layer = LAYER_ATTACK
+    collision_mask = LAYER_ENEMY | LAYER_OBSTACLE
+    
+    def __init__(self, x=0, y=0, width=70, height=50, direction=1, damage=15):
         super().__init__()
-        
+        self.pool = None  # Set while the attack is checked out of a pool
+        self.hit_enemies = set()  # Track enemies already hit by this attack to prevent multiple hits
+        self.reset(x, y, width, height, direction, damage)
+    
+    def reset(self, x, y, width=70, height=50, direction=1, damage=15):
+        """Re-initialize the attack for a new swing"""
         # Try to load sword attack sprite from assets
         loader = get_loader()
         
-        # Load appropriate sword animation based on direction
-        if direction == 1:  # Right swing
-            sword_sprite = loader.get_sword_swing()
-        else:  # Left swing
-            sword_sprite = loader.get_sword_swing_left()
+        # Load appropriate sword animation based on direction. Frames are scaled,
+        # mirrored for a left swing and made semi-transparent once by the loader
+        # and shared between attacks.
+        sword_path = 'animations/sword_swing' if direction == 1 else 'animations/sword_swing_left'
+        sword_frames = loader.get_animation_variant(sword_path, 4, (width, height),
+                                                    flip_x=(direction == -1), alpha=180)
         
-        if sword_sprite is not None and len(sword_sprite) > 0:
+        if sword_frames is not None and len(sword_frames) > 0:
             # Use the first frame of sword animation
-            self.image = pygame.transform.scale(sword_sprite[0], (width, height))
-            self.animation_frames = [pygame.transform.scale(frame, (width, height)) for frame in sword_sprite]
-            self.animation_frame = 0
-            self.animation_counter = 0
-            sword_type = "right" if direction == 1 else "left"
-            print(f"✓ Sword attack animation loaded ({sword_type} swing, {len(self.animation_frames)} frames)")
+            self.image = sword_frames[0]
+            self.animation_frames = sword_frames
         else:
-            # Fallback: draw a sword-like shape
-            self.image = pygame.Surface((width, height))
-            self.image.fill((100, 100, 100))
-            pygame.draw.polygon(self.image, (200, 200, 100), [
-                (width // 2 - 5, 5), (width // 2 + 5, 5), 
-                (width // 2 + 3, height - 5), (width // 2 - 3, height - 5)
-            ])
+            self.image = _get_fallback_sword_image(width, height, direction)
             self.animation_frames = None
-            print("⚠ Sword animation not found, using fallback")
-        
-        # Rotate sword hilt based on direction
-        if direction == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.animation_frame = 0
+        self.animation_counter = 0
         
-        self.image.set_alpha(180)  # Semi-transparent
         self.rect = self.image.get_rect(topleft=(x, y))
         self.damage = damage
         self.direction = direction
         self.lifetime = 10  # frames
-        self.hit_enemies = set()  # Track enemies already hit by this attack to prevent multiple hits
+        self.hit_enemies.clear()
+
+    def get_state(self):
+        """Return the swing's mutable state as a tuple (see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.rect.width, self.rect.height, self.direction,
+                self.damage, self.lifetime, self.animation_frame, self.animation_counter)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        x, y, width, height, direction, damage, lifetime, frame, counter = state
+        self.reset(x, y, width, height, direction, damage)
+        self.lifetime = lifetime
+        self.animation_frame = frame
+        self.animation_counter = counter
+        if self.animation_frames is not None:
+            self.image = self.animation_frames[frame]
 
     def update(self, *args):
         self.lifetime -= 1
@@ -55,16 +97,20 @@ class Attack(pygame.sprite.Sprite):
             if self.animation_counter >= 3:  # Change frame every 3 updates
                 self.animation_counter = 0
                 self.animation_frame = (self.animation_frame + 1) % len(self.animation_frames)
+                # Frames are already mirrored and translucent
                 self.image = self.animation_frames[self.animation_frame]
-                # Rotate sword hilt if swinging left
-                if self.direction == -1:
-                    self.image = pygame.transform.flip(self.image, True, False)
-                self.image.set_alpha(180)
         
         if self.lifetime <= 0:
             self.kill()
+            # Hand the hitbox back for the next swing
+            if self.pool is not None:
+                self.pool.release(self)
 
 class Player(pygame.sprite.Sprite):
+    collision_layer = LAYER_PLAYER
+    collision_mask = (LAYER_ENEMY | LAYER_PROJECTILE | LAYER_OBSTACLE |
+                      LAYER_PICKUP | LAYER_POWERUP | LAYER_TREASURE)
+    
     def __init__(self, x, y):
         super().__init__()
         self.width = PLAYER_WIDTH
@@ -72,10 +118,11 @@ class Player(pygame.sprite.Sprite):
         
         # Try to load player sprite from assets
         loader = get_loader()
-        player_sprite = loader.get_player_idle()
-        if player_sprite is not None:
-            # Scale sprite to match player dimensions
-            self.image = pygame.transform.scale(player_sprite, (self.width, self.height))
+        # Idle sprites scaled to the player dimensions for both facings, shared via the loader
+        self.idle_image = loader.get_variant('player/player_idle.png', (self.width, self.height))
+        self.idle_image_left = loader.get_variant('player/player_idle.png', (self.width, self.height), flip_x=True)
+        if self.idle_image is not None:
+            self.image = self.idle_image
             print(f"✓ Player sprite loaded successfully ({self.width}x{self.height})")
         else:
             # Fallback: draw a character sprite
@@ -97,9 +144,12 @@ class Player(pygame.sprite.Sprite):
         self.speed_mod = 1.0
         self.speed_mod_timer = 0
         self.invuln_timer = 0
+        # What last hurt the player (e.g. 'enemy' or an obstacle type), so a death can be explained
+        self.last_damage_source = None
         self.attack_cooldown = 0
         self.facing_right = True
         self.attacks = pygame.sprite.Group()
+        self.attack_pool = ObjectPool(Attack, ATTACK_POOL_SIZE)
         self.falling_through = False
         self.fall_through_timer = 0
         
@@ -116,29 +166,57 @@ class Player(pygame.sprite.Sprite):
         # Animation attributes
         self.walking_animation = loader.get_player_walking()
         self.running_animation = loader.get_player_running()
+        self.running_animation_left = loader.get_animation_variant('animations/player_run', 4, flip_x=True)
         self.animation_frame = 0
         self.animation_counter = 0
         self.is_running = False
+        
+        # Buttons are read from a pluggable source (keyboard, recording or replay)
+        self.input_source = KeyboardInput()
+
+    def get_state(self):
+        """Return the player's mutable state as a tuple (attacks excluded, see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.vel_x, self.vel_y, self.on_ground, self.health,
+                self.max_health, self.speed_mod, self.speed_mod_timer, self.invuln_timer,
+                self.attack_cooldown, self.facing_right, self.falling_through, self.fall_through_timer,
+                self.armor_active, self.armor_timer, self.attack_mod, self.attack_mod_timer,
+                self.damage_taken_timer, self.pickup_collected_timer, self.animation_frame,
+                self.animation_counter, self.is_running, self.last_damage_source)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        (self.rect.x, self.rect.y, self.vel_x, self.vel_y, self.on_ground, self.health,
+         self.max_health, self.speed_mod, self.speed_mod_timer, self.invuln_timer,
+         self.attack_cooldown, self.facing_right, self.falling_through, self.fall_through_timer,
+         self.armor_active, self.armor_timer, self.attack_mod, self.attack_mod_timer,
+         self.damage_taken_timer, self.pickup_collected_timer, self.animation_frame,
+         self.animation_counter, self.is_running, self.last_damage_source) = state
+        # Pick the sprite the same way update() does
+        if self.is_running and self.running_animation is not None:
+            frames = self.running_animation if self.facing_right else self.running_animation_left
+            self.image = frames[self.animation_frame]
+        elif self.idle_image is not None:
+            self.image = self.idle_image if self.facing_right else self.idle_image_left
 
     def handle_input(self):
-        keys = pygame.key.get_pressed()
+        buttons = self.input_source.read()
         self.vel_x = 0
         base_speed = 5 * self.speed_mod
-        if keys[pygame.K_LEFT]:
+        if buttons & INPUT_LEFT:
             self.vel_x = -base_speed
             self.facing_right = False
-        if keys[pygame.K_RIGHT]:
+        if buttons & INPUT_RIGHT:
             self.vel_x = base_speed
             self.facing_right = True
-        if keys[pygame.K_SPACE]:
+        if buttons & INPUT_JUMP:
             if self.on_ground:
                 self.vel_y = -15
-            elif keys[pygame.K_DOWN] and not self.falling_through:
+            elif buttons & INPUT_DOWN and not self.falling_through:
                 # Allow jumping down from non-ground platforms
                 self.falling_through = True
                 self.fall_through_timer = 10
                 self.vel_y = 5  # Start falling
-        if keys[pygame.K_a]:
+        if buttons & INPUT_ATTACK:
             self.attack()
 
     def attack(self):
@@ -154,9 +232,9 @@ class Player(pygame.sprite.Sprite):
             else:
                 attack_x = self.rect.left - attack_width + 20  # Brought closer to player
             
-            attack = Attack(attack_x, self.rect.centery - attack_height // 2, 
-                          attack_width, attack_height, 
-                          direction=1 if self.facing_right else -1, damage=final_damage)
+            attack = self.attack_pool.acquire(attack_x, self.rect.centery - attack_height // 2, 
+                                              attack_width, attack_height, 
+                                              direction=1 if self.facing_right else -1, damage=final_damage)
             self.attacks.add(attack)
             self.attack_cooldown = 15  # 15 frame cooldown
 
@@ -177,17 +255,14 @@ class Player(pygame.sprite.Sprite):
             if self.animation_counter >= 5:  # Change frame every 5 updates
                 self.animation_counter = 0
                 self.animation_frame = (self.animation_frame + 1) % len(self.running_animation)
-            self.image = self.running_animation[self.animation_frame]
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
+            if self.facing_right:
+                self.image = self.running_animation[self.animation_frame]
+            else:
+                self.image = self.running_animation_left[self.animation_frame]
         else:
             # Show idle sprite when not moving
-            loader = get_loader()
-            idle_sprite = loader.get_player_idle()
-            if idle_sprite is not None:
-                self.image = pygame.transform.scale(idle_sprite, (self.width, self.height))
-                if not self.facing_right:
-                    self.image = pygame.transform.flip(self.image, True, False)
+            if self.idle_image is not None:
+                self.image = self.idle_image if self.facing_right else self.idle_image_left
             self.animation_frame = 0
             self.animation_counter = 0
         
@@ -220,28 +295,25 @@ class Player(pygame.sprite.Sprite):
                 self.falling_through = False
 
         # Apply horizontal movement
+        prev_left = self.rect.left
         self.rect.x += self.vel_x
         
         # Apply vertical movement and check collision
+        prev_bottom = self.rect.bottom
         self.rect.y += self.vel_y
         self.on_ground = False
         
         # Check collision with platforms
-        for platform in platforms:
-            # Use a slightly expanded platform rect for collision to avoid missing edge cases
-            # This prevents the player from falling through when exactly on the platform surface
-            check_rect = platform.rect.inflate(0, 2)
-            
-            if self.rect.colliderect(check_rect):
-                if self.vel_y >= 0:  # Only collide when moving down or stationary
-                    # Player is landing on this platform
-                    if not self.falling_through:
-                        # Place player on top of platform
-                        self.rect.bottom = platform.rect.top
-                        self.vel_y = 0
-                        self.on_ground = True
-                        self.falling_through = False
-                        break  # Don't check other platforms once landed
+        # Use a slightly expanded platform rect for collision to avoid missing edge cases
+        # This prevents the player from falling through when exactly on the platform surface
+        if self.vel_y >= 0 and not self.falling_through:  # Only collide when moving down or stationary
+            # Swept test, so fast falls can't pass through thin platforms
+            platform = sweep_landing(platforms, self.rect, prev_bottom, inflate=2, prev_left=prev_left)
+            if platform is not None:
+                # Player is landing on this platform (already placed on top of it)
+                self.vel_y = 0
+                self.on_ground = True
+                self.falling_through = False
 
         # Enforce strict horizontal bounds
         if self.rect.left < 0:
@@ -267,7 +339,14 @@ class Player(pygame.sprite.Sprite):
         # Update attacks
         self.attacks.update()
 
-    def take_damage(self, amount):
+    def take_damage(self, amount, source=None):
+        """
+        Take damage unless still invulnerable from the last hit.
+
+        Args:
+            amount: Damage before armor
+            source: What dealt the damage (kept as last_damage_source)
+        """
         if self.invuln_timer > 0:
             return
         
@@ -277,6 +356,7 @@ class Player(pygame.sprite.Sprite):
             actual_damage = int(amount * 0.5)  # 50% damage reduction
         
         self.health -= actual_damage
+        self.last_damage_source = source
         print(f"Player took {actual_damage} damage (armor: {self.armor_active}); health={self.health}")
         self.invuln_timer = 60  # Increased from 30 to 60 frames for better protection
         self.damage_taken_timer = 60  # Show damage feedback for 60 frames
@@ -1,8 +1,13 @@
 import pygame
+from abc import ABC, abstractmethod
 from settings import ORANGE, RED, PURPLE, WIDTH, HEIGHT
+from collision import LAYER_PLAYER, LAYER_POWERUP
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(pygame.sprite.Sprite, ABC):
     """Base class for power-ups"""
+    collision_layer = LAYER_POWERUP
+    collision_mask = LAYER_PLAYER
+    
     def __init__(self, x, y, duration=300):
         super().__init__()
         self.x = x
@@ -14,6 +19,18 @@ class PowerUp(pygame.sprite.Sprite):
         self.bob_offset = 0
         self.bob_speed = 0.1
     
+    def get_state(self):
+        """Return the power-up's mutable state as a tuple (see Game.snapshot)"""
+        return (self.rect.x, self.rect.y, self.bob_offset, self.duration_remaining, self.collected)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        self.rect.x, self.rect.y, self.bob_offset, self.duration_remaining, self.collected = state
+
+    @abstractmethod
+    def apply_to(self, player):
+        """Give the collecting player this power-up's effect"""
+    
     def collect(self):
         """Mark power-up as collected and remove from game"""
         self.collected = True
@@ -40,6 +57,9 @@ class ArmorPowerUp(PowerUp):
         self.rect = self.image.get_rect(center=(x, y))
         self.powerup_type = "armor"
         self.damage_reduction = 0.5  # Reduce damage by 50%
+    
+    def apply_to(self, player):
+        player.activate_armor(self.duration_remaining)
 
 
 class AttackPowerUp(PowerUp):
@@ -55,6 +75,9 @@ class AttackPowerUp(PowerUp):
         self.rect = self.image.get_rect(center=(x, y))
         self.powerup_type = "attack"
         self.damage_multiplier = 1.5  # Increase damage by 50%
+    
+    def apply_to(self, player):
+        player.activate_attack(self.duration_remaining)
 
 
 class SpeedPowerUp(PowerUp):
@@ -70,3 +93,6 @@ class SpeedPowerUp(PowerUp):
         self.rect = self.image.get_rect(center=(x, y))
         self.powerup_type = "speed"
         self.speed_multiplier = 1.5  # Increase speed by 50%
+    
+    def apply_to(self, player):
+        player.activate_speed(self.duration_remaining)
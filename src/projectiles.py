@@ -0,0 +1,259 @@
+"""
+Struct-of-arrays projectile system backed by NumPy.
+Positions, velocities, damage and alive flags live in parallel arrays, so a
+frame's projectiles are integrated, culled and tested against the player in
+a few vectorized operations and drawn from one shared image. The arrays are
+preallocated and act as a pool: spawning fills a free slot instead of
+allocating an object.
+"""
+
+import numpy as np
+import pygame
+from settings import WIDTH, HEIGHT, YELLOW, PROJECTILE_POOL_SIZE
+from collision import LAYER_PLAYER, LAYER_PROJECTILE
+
+PROJECTILE_SIZE = 8
+
+# Result of collide_rect when there is nothing to hit
+_NO_HITS = np.empty(0, dtype=np.intp)
+
+# Up to this many projectiles, moving and hit-testing them one by one in
+# Python beats the fixed overhead of a handful of NumPy calls
+SCALAR_MAX = 16
+
+
+def _round_half_away(values):
+    """Round to whole pixels the way pygame.Rect does when a float is assigned"""
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+class ProjectileSystem:
+    """All live projectiles of a level, stored as parallel NumPy arrays"""
+    collision_layer = LAYER_PROJECTILE
+    collision_mask = LAYER_PLAYER
+
+    # Per-projectile arrays, kept in spawn order
+    _FIELDS = ('x', 'y', 'vx', 'vy', 'damage', 'alive', 'prev_x', 'prev_y', 'has_prev')
+    # Arrays that make up the simulation state (live projectiles are always alive)
+    _STATE_FIELDS = ('x', 'y', 'vx', 'vy', 'damage')
+
+    def __init__(self, capacity=PROJECTILE_POOL_SIZE, size=PROJECTILE_SIZE, color=YELLOW, bounds=(WIDTH, HEIGHT)):
+        """
+        Initialize an empty system.
+
+        Args:
+            capacity: Initial number of projectile slots (grows as needed)
+            size: Width and height of every projectile in pixels
+            color: Fill color of the shared projectile image
+            bounds: (width, height) of the area projectiles are culled against
+        """
+        self.size = size
+        self.bounds = bounds
+        self.count = 0
+        self.capacity = 0
+        self._allocate(capacity)
+        self.image = pygame.Surface((size, size))
+        self.image.fill(color)
+        # Whether every live velocity is a whole number of pixels; positions
+        # then stay whole and need no rounding after a move
+        self._whole_steps = True
+        self.hits = 0    # Spawns that fit in the preallocated slots
+        self.misses = 0  # Spawns that had to grow the arrays
+
+    def _allocate(self, capacity):
+        """Resize every array to capacity, keeping the live projectiles"""
+        n = self.count
+        for name, dtype in (('x', np.float64), ('y', np.float64), ('vx', np.float64), ('vy', np.float64),
+                            ('damage', np.int32), ('alive', np.bool_),
+                            ('prev_x', np.float64), ('prev_y', np.float64), ('has_prev', np.bool_)):
+            array = np.zeros(capacity, dtype=dtype)
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def hit_rate(self):
+        """Fraction of spawns served without growing the arrays"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 1.0
+
+    def spawn(self, x, y, vx, vy=0, dmg=10):
+        """
+        Add a projectile.
+
+        Args:
+            x, y: Center of the projectile in world coordinates
+            vx, vy: Velocity in pixels per step
+            dmg: Damage dealt to the player on hit
+        """
+        if self.count == self.capacity:
+            self._allocate(max(1, self.capacity * 2))
+            self.misses += 1
+        else:
+            self.hits += 1
+        i = self.count
+        half = self.size // 2
+        self.x[i] = int(x) - half
+        self.y[i] = int(y) - half
+        self.vx[i] = vx
+        self.vy[i] = vy
+        if vx != int(vx) or vy != int(vy):
+            self._whole_steps = False
+        self.damage[i] = dmg
+        self.alive[i] = True
+        self.has_prev[i] = False
+        self.count += 1
+
+    def update(self, *args):
+        """Move every projectile one step and cull those that left the level"""
+        n = self.count
+        if n == 0:
+            return
+        width, height = self.bounds
+        x = self.x[:n]
+        y = self.y[:n]
+        if self._whole_steps and n <= SCALAR_MAX:
+            xs = [px + vx for px, vx in zip(x.tolist(), self.vx[:n].tolist())]
+            ys = [py + vy for py, vy in zip(y.tolist(), self.vy[:n].tolist())]
+            x[:] = xs
+            y[:] = ys
+            low = -self.size
+            gone = [i for i in range(n) if not (low <= xs[i] <= width and ys[i] <= height)]
+            if gone:
+                self.alive[gone] = False
+                self._compact()
+            return
+        # The cost is in the number of NumPy calls: moves are done in place
+        # and whole steps are not rounded
+        x += self.vx[:n]
+        y += self.vy[:n]
+        if not self._whole_steps:
+            x[:] = _round_half_away(x)
+            y[:] = _round_half_away(y)
+        self.alive[:n] &= (x >= -self.size) & (x <= width) & (y <= height)
+        self._compact()
+
+    def _compact(self):
+        """Drop dead projectiles, keeping the survivors in spawn order"""
+        n = self.count
+        keep = self.alive[:n]
+        survivors = int(np.count_nonzero(keep))
+        if survivors == n:
+            return
+        keep = keep.copy()
+        for name in self._FIELDS:
+            array = getattr(self, name)
+            array[:survivors] = array[:n][keep]
+        self.count = survivors
+
+    def collide_rect(self, rect):
+        """
+        Find the projectiles overlapping a rect (like Rect.colliderect).
+
+        Args:
+            rect: pygame Rect to test, e.g. the player's
+
+        Returns:
+            NumPy array of projectile indices in spawn order
+        """
+        n = self.count
+        if n == 0:
+            return _NO_HITS
+        x = self.x[:n]
+        y = self.y[:n]
+        size = self.size
+        left, top, width, height = rect
+        right = left + width
+        bottom = top + height
+        left -= size
+        top -= size
+        # Live projectiles are always alive (dead ones are compacted away at once)
+        if n <= SCALAR_MAX:
+            hits = [i for i, (px, py) in enumerate(zip(x.tolist(), y.tolist()))
+                    if left < px < right and top < py < bottom]
+            return np.array(hits, dtype=np.intp) if hits else _NO_HITS
+        hit = (x < right) & (x > left) & (y < bottom) & (y > top)
+        return np.flatnonzero(hit)
+
+    def kill(self, indices):
+        """
+        Remove projectiles.
+
+        Args:
+            indices: Indices returned by collide_rect
+        """
+        self.alive[indices] = False
+        self._compact()
+
+    def clear(self):
+        """Remove every projectile"""
+        self.count = 0
+        self._whole_steps = True
+
+    def get_state(self):
+        """
+        Return the live projectiles as a tuple of raw array bytes (see Game.snapshot).
+        Interpolation positions are not included.
+        """
+        n = self.count
+        return (n,) + tuple(getattr(self, name)[:n].tobytes() for name in self._STATE_FIELDS)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        n = state[0]
+        if n > self.capacity:
+            self._allocate(n)
+        for name, data in zip(self._STATE_FIELDS, state[1:]):
+            array = getattr(self, name)
+            array[:n] = np.frombuffer(data, dtype=array.dtype)
+        self.alive[:n] = True
+        self.has_prev[:n] = False
+        self.count = n
+        self._whole_steps = not (np.any(self.vx[:n] % 1) or np.any(self.vy[:n] % 1))
+
+    def capture_positions(self):
+        """Remember positions before a simulation step, for render interpolation"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.has_prev[:n] = True
+
+    def draw(self, surface, camera, alpha=1.0):
+        """
+        Draw the visible projectiles.
+
+        Args:
+            surface: Pygame surface to draw on
+            camera: Camera providing the view offset
+            alpha: Interpolation factor between the previous and current step
+
+        Returns:
+            List of screen rects drawn to
+        """
+        n = self.count
+        if n == 0:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        size = self.size
+        cam_x = int(camera.x)
+        cam_y = int(camera.y)
+
+        # Same culling as Camera.is_visible: the viewport plus a 100px margin
+        margin = 100
+        visible = ((x + size > cam_x - margin) & (x < cam_x + camera.screen_width + margin) &
+                   (y + size > cam_y - margin) & (y < cam_y + camera.screen_height + margin))
+
+        if alpha < 1.0:
+            has_prev = self.has_prev[:n]
+            x = np.where(has_prev, np.round(self.prev_x[:n] + (x - self.prev_x[:n]) * alpha), x)
+            y = np.where(has_prev, np.round(self.prev_y[:n] + (y - self.prev_y[:n]) * alpha), y)
+
+        screen_x = (x[visible] - cam_x).astype(np.int64).tolist()
+        screen_y = (y[visible] - cam_y).astype(np.int64).tolist()
+        image = self.image
+        return surface.blits([(image, pos) for pos in zip(screen_x, screen_y)])
@@ -0,0 +1,249 @@
+"""
+Reachability of generated terrain.
+Works out which platforms the player can get onto from which, without
+playing the level. The player's jump is a fixed arc (launch speed, gravity
+and the fall speed cap are constants), so the arc is traced once, moving a
+rect exactly as Player.update does, and kept as the heights the player's
+feet pass through while coming down. A move between two platforms is then
+a binary search for the last frame the player can still come down onto
+the higher (or lower) one, plus a check that running at full speed covers
+the sideways distance by that frame. Platforms are one-way and a falling player that
+overlaps a platform lands on top of it, so a platform is in reach while the
+player's head gets up to its underside.
+
+A reachability graph over a level's platforms takes a few microseconds per
+platform pair, cheap enough for generate_terrain to check every platform it
+places and move the ones the player could not get onto.
+
+Usage:
+    python src/reachability.py --seeds 10000
+"""
+
+import argparse
+import bisect
+import sys
+import time
+from collections import deque
+import pygame
+from settings import GRAVITY, PLAYER_WIDTH, PLAYER_HEIGHT, WIDTH, HEIGHT
+
+JUMP_SPEED = 15                  # Upward speed of a jump (see Player.handle_input)
+RUN_SPEED = 5                    # Horizontal speed without power-ups (see Player.handle_input)
+MAX_FALL_SPEED = 10              # Fall speed cap (see Player.apply_gravity)
+LANDING_SLACK = 1                # Platforms are grown by 1px above and below for landing (see Player.update)
+REPAIR_STEP = 10                 # Pixels an unreachable platform is moved per repair step
+
+
+class _Arc:
+    """Where the player's feet are on each frame of a jump or fall"""
+
+    def __init__(self, vel_y):
+        """
+        Trace the arc.
+
+        Args:
+            vel_y: Vertical speed on the first frame (negative for a jump, 0 for walking off an edge)
+        """
+        # A rect moves the way the player's does, rounding included
+        rect = pygame.Rect(0, HEIGHT, PLAYER_WIDTH, PLAYER_HEIGHT)
+        start = rect.bottom
+        frame = 0
+        # Feet heights (relative to the start, down is positive) from the
+        # first frame the player can land, which only go down from there
+        self.feet = []
+        while not self.feet or self.feet[-1] < HEIGHT:
+            frame += 1
+            rect.y += vel_y
+            if vel_y >= 0:
+                if not self.feet:
+                    self.first_frame = frame
+                self.feet.append(rect.bottom - start)
+            vel_y = min(vel_y + GRAVITY, MAX_FALL_SPEED)
+
+    def landing_frame(self, top, height, floor):
+        """
+        Last frame on which the player coming down can land on a platform.
+
+        A falling player lands on the first frame it overlaps the platform,
+        anywhere from when its feet reach the top until its head drops past
+        the underside (or it hits the floor), so it has until then to get
+        over the platform.
+
+        Args:
+            top: Platform top relative to the feet at the start (negative is above)
+            height: Platform height
+            floor: Bottom of the screen relative to the feet at the start
+
+        Returns:
+            Frame number counted from the start, or None if the arc misses it
+        """
+        # Frames whose feet are at or below the (grown) top, and whose head
+        # is above the (grown) underside
+        first = bisect.bisect_left(self.feet, top + 1 - LANDING_SLACK)
+        last = bisect.bisect_right(self.feet, top + height + PLAYER_HEIGHT + LANDING_SLACK - 1) - 1
+        # Platforms are tested before the player is stopped at the floor, so
+        # the first frame that goes past it is the last one
+        last = min(last, bisect.bisect_right(self.feet, floor))
+        if last < first:
+            return None
+        return self.first_frame + last
+
+
+_JUMP = _Arc(-JUMP_SPEED)
+_FALL = _Arc(0)
+
+
+def _standing(rect):
+    """Range of rect.left over which the player stands on a platform rect"""
+    return (max(rect.left - PLAYER_WIDTH + 1, 0),
+            min(rect.right - 1, WIDTH - PLAYER_WIDTH))
+
+
+def can_reach(here, there):
+    """
+    Whether the player can get from one platform onto another in one jump or drop.
+
+    Higher platforms (and ones at the same height) are jumped to from anywhere
+    on this one, lower ones are dropped to by walking off the nearer edge.
+
+    Args:
+        here: Rect of the platform the player stands on
+        there: Rect of the platform to get onto
+
+    Returns:
+        True if some jump or drop at running speed lands on it
+    """
+    top = there.top - here.top
+    floor = HEIGHT - here.top
+    to_left, to_right = _standing(there)
+    if top <= 0:
+        frames = _JUMP.landing_frame(top, there.height, floor)
+        if frames is None:
+            return False
+        from_left, from_right = _standing(here)
+        gap = max(to_left - from_right, from_left - to_right, 0)
+        return gap <= RUN_SPEED * frames
+
+    frames = _FALL.landing_frame(top, there.height, floor)
+    if frames is None:
+        return False
+    # Walking off only ever gets farther from the platform until the
+    # player is clear of it, so steer outwards from the edge
+    reach = RUN_SPEED * (frames - 1)
+    right_edge = here.right
+    if right_edge <= WIDTH - PLAYER_WIDTH and to_left <= right_edge + reach and to_right >= right_edge:
+        return True
+    left_edge = here.left - PLAYER_WIDTH
+    return left_edge >= 0 and to_right >= left_edge - reach and to_left <= left_edge
+
+
+def reachability_graph(rects):
+    """
+    Work out the moves between platforms.
+
+    Args:
+        rects: Platform rects
+
+    Returns:
+        List with, for each rect, the indices of the rects reachable from it in one move
+    """
+    return [[j for j, there in enumerate(rects) if j != i and can_reach(here, there)]
+            for i, here in enumerate(rects)]
+
+
+def unreachable_platforms(rects, start=0):
+    """
+    Find the platforms the player can never get onto.
+
+    Args:
+        rects: Platform rects
+        start: Index of the platform the player starts on (the ground)
+
+    Returns:
+        Sorted indices of the rects that no sequence of moves from the start reaches
+    """
+    graph = reachability_graph(rects)
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for j in graph[queue.popleft()]:
+            if j not in seen:
+                seen.add(j)
+                queue.append(j)
+    return [i for i in range(len(rects)) if i not in seen]
+
+
+def repair_platform(placed, rect):
+    """
+    Move a new platform until the player can get onto it from one placed before it.
+
+    Platforms already placed are assumed reachable, so one move from any of
+    them is enough. An unreachable platform is slid sideways until it is over
+    or under the last placed one, then lowered towards it.
+
+    Args:
+        placed: Rects of the platforms placed so far (the last one is the one below)
+        rect: Rect of the new platform
+
+    Returns:
+        The rect, moved if it had to be (a new Rect; the argument is not changed)
+
+    Raises:
+        ValueError: If the platform is not in reach even level with the last placed one
+            (generate_terrain rejects the layout, see Game._generate_level)
+    """
+    rect = rect.copy()
+    below = placed[-1]
+    while not any(can_reach(here, rect) for here in placed):
+        if rect.left >= below.right:
+            rect.x -= min(REPAIR_STEP, rect.left - below.right + 1)
+        elif rect.right <= below.left:
+            rect.x += min(REPAIR_STEP, below.left - rect.right + 1)
+        elif rect.top < below.top:
+            rect.y = min(rect.y + REPAIR_STEP, below.top)
+        else:
+            raise ValueError(f"Platform at {tuple(rect)} cannot be moved into reach")
+    return rect
+
+
+def _seed_list(seeds):
+    """The first few seeds of a list, for printing"""
+    return ', '.join(map(str, seeds[:10])) + (', ...' if len(seeds) > 10 else '')
+
+
+def main(argv=None):
+    """Check freshly generated terrain for unreachable platforms from the command line"""
+    from utils import generate_terrain
+
+    parser = argparse.ArgumentParser(description="Count generated levels with platforms the player cannot reach")
+    parser.add_argument('--seeds', type=int, default=1000, help="Number of seeds to check")
+    parser.add_argument('--first-seed', type=int, default=0, help="First seed of the range")
+    parser.add_argument('--difficulties', type=int, nargs='+', default=[1, 2, 3], help="Terrain difficulties")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    for difficulty in args.difficulties:
+        bad = []
+        rejected = []
+        elapsed = 0.0
+        for seed in range(args.first_seed, args.first_seed + args.seeds):
+            rects = [p.rect for p in generate_terrain(seed, difficulty, repair=False)]
+            start = time.perf_counter()
+            unreachable = unreachable_platforms(rects)
+            elapsed += time.perf_counter() - start
+            if unreachable:
+                bad.append(seed)
+                try:
+                    generate_terrain(seed, difficulty)
+                except ValueError:
+                    rejected.append(seed)
+        print(f"Difficulty {difficulty}: {len(bad)}/{args.seeds} levels unreachable without repair"
+              f"{f' (seeds {_seed_list(bad)})' if bad else ''}, {1e6 * elapsed / args.seeds:.0f}us per level")
+        if rejected:
+            print(f"[-] {len(rejected)} of them could not be repaired and would be regenerated "
+                  f"(seeds {_seed_list(rejected)})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
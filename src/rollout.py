@@ -0,0 +1,195 @@
+"""
+Batch rollouts over seeds and levels on a process pool.
+Every (seed, level) pair is played headless from the start of the level
+until it is completed, lost or runs out of frames. Runs are fanned out over
+worker processes that each start once: the initializer loads every level's
+assets and keeps one Game that is reset for each run (see Game.reset), so a
+run costs only level generation and simulation. Results come back as small
+RolloutResult tuples, streamed in job order while later runs are still
+being played.
+
+Usage:
+    python src/rollout.py --seeds 100 --workers 8
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, NamedTuple
+from settings import (NUM_REGULAR_LEVELS, BOSS_LEVEL, ROLLOUT_MAX_FRAMES,
+                      GAME_STATE_PLAYING, GAME_STATE_LEVEL_COMPLETE)
+from input_source import RandomInput
+from obstacles import OBSTACLE_FACTORIES
+from level_cache import LevelCache
+from game import Game
+
+# Every level of a run through the game
+ALL_LEVELS = tuple(range(1, NUM_REGULAR_LEVELS + 1)) + (BOSS_LEVEL,)
+
+# Rollout outcomes
+OUTCOME_COMPLETE = 'complete'
+OUTCOME_DEATH = 'death'
+OUTCOME_TIMEOUT = 'timeout'
+
+
+class RolloutResult(NamedTuple):
+    """What happened in one rollout"""
+    seed: int
+    level: int
+    outcome: str
+    frames: int
+    damage_taken: int
+    health: int
+    enemies_left: int
+    death_cause: str = ''  # What dealt the killing blow (see Player.last_damage_source)
+
+
+def random_input(seed, level):
+    """Default input factory: reproducible random buttons for each (seed, level)"""
+    return RandomInput(seed * 100 + level)
+
+
+def run_rollout(game, seed, level, input_source, max_frames=ROLLOUT_MAX_FRAMES):
+    """
+    Play one level from its start.
+
+    Args:
+        game: Headless Game to reset for the run (reused between runs)
+        seed: Level seed
+        level: Level to play
+        input_source: Input source driving the player
+        max_frames: Frames before the run counts as a timeout
+
+    Returns:
+        RolloutResult
+    """
+    game.set_input_source(input_source)
+    game.reset(level=level, seed=seed)
+    if hasattr(input_source, 'attach'):
+        # Input sources that look at the game (e.g. the playtest bot)
+        input_source.attach(game)
+    player = game.player
+    frames = 0
+    damage_taken = 0
+    while frames < max_frames and game.game_state == GAME_STATE_PLAYING:
+        health = player.health
+        game.update()
+        frames += 1
+        if player.health < health:
+            damage_taken += health - player.health
+
+    death_cause = ''
+    if game.game_state == GAME_STATE_PLAYING:
+        outcome = OUTCOME_TIMEOUT
+    elif game.game_state == GAME_STATE_LEVEL_COMPLETE or player.health > 0:
+        # The boss level ends in the game-over state even when it was won
+        outcome = OUTCOME_COMPLETE
+    else:
+        outcome = OUTCOME_DEATH
+        death_cause = player.last_damage_source or 'unknown'
+    return RolloutResult(seed, level, outcome, frames, damage_taken, player.health, len(game.enemies),
+                         death_cause)
+
+
+# Per-process worker state, set up once by _init_worker
+_worker_game = None
+_worker_input_factory = None
+_worker_max_frames = ROLLOUT_MAX_FRAMES
+
+
+def _init_worker(input_factory, max_frames):
+    """Start a worker: load every level's assets once and keep a Game to reuse"""
+    global _worker_game, _worker_input_factory, _worker_max_frames
+    _worker_input_factory = input_factory
+    _worker_max_frames = max_frames
+    with contextlib.redirect_stdout(None):
+        # Every (seed, level) is played once, so levels are kept in memory
+        # only, and never written where other workers would read them
+        _worker_game = Game(level=ALL_LEVELS[0], seed=0, headless=True, level_cache=LevelCache(cache_dir=None))
+        # Building each level once loads its background, sprites and boss art
+        for level in ALL_LEVELS[1:]:
+            _worker_game.build_level(level)
+        # Obstacles and sword swings that the levels above may not have used
+        for factory in OBSTACLE_FACTORIES.values():
+            factory(0, 0)
+        player = _worker_game.player
+        for facing_right in (True, False):
+            player.facing_right = facing_right
+            player.attack_cooldown = 0
+            player.attack()
+
+
+def _run_job(job):
+    """Play one (seed, level) job in a worker"""
+    seed, level = job
+    with contextlib.redirect_stdout(None):
+        return run_rollout(_worker_game, seed, level, _worker_input_factory(seed, level), _worker_max_frames)
+
+
+def run_rollouts(seeds, levels=ALL_LEVELS, workers=None, input_factory=random_input,
+                 max_frames=ROLLOUT_MAX_FRAMES, chunksize=None) -> Iterator[RolloutResult]:
+    """
+    Play every (seed, level) pair and stream back the results.
+
+    Args:
+        seeds: Level seeds to play
+        levels: Levels to play for each seed
+        workers: Worker processes (defaults to one per core; 0 plays in this process)
+        input_factory: Picklable callable (seed, level) -> input source for a run
+        max_frames: Frames before a run counts as a timeout
+        chunksize: Jobs handed to a worker at a time (defaults to a few chunks per worker)
+
+    Yields:
+        RolloutResult for each job, in (seed, level) order
+    """
+    jobs = [(seed, level) for seed in seeds for level in levels]
+    if workers == 0:
+        _init_worker(input_factory, max_frames)
+        for job in jobs:
+            yield _run_job(job)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # Big enough to keep pickling overhead low, small enough to balance load
+        chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(input_factory, max_frames)) as executor:
+        yield from executor.map(_run_job, jobs, chunksize=chunksize)
+
+
+def main(argv=None):
+    """Run a seed sweep from the command line and print per-level statistics"""
+    parser = argparse.ArgumentParser(description="Play every level for a range of seeds on a process pool")
+    parser.add_argument('--seeds', type=int, default=20, help="Number of seeds to play")
+    parser.add_argument('--first-seed', type=int, default=0, help="First seed of the range")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--max-frames', type=int, default=ROLLOUT_MAX_FRAMES, help="Frames before a run times out")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    stats = defaultdict(lambda: defaultdict(int))
+    start = time.perf_counter()
+    frames = 0
+    for result in run_rollouts(seeds, workers=args.workers, max_frames=args.max_frames):
+        stats[result.level][result.outcome] += 1
+        stats[result.level]['damage_taken'] += result.damage_taken
+        frames += result.frames
+    elapsed = time.perf_counter() - start
+
+    for level in ALL_LEVELS:
+        level_stats = stats[level]
+        print(f"Level {level}: {level_stats[OUTCOME_COMPLETE]} complete, {level_stats[OUTCOME_DEATH]} deaths, "
+              f"{level_stats[OUTCOME_TIMEOUT]} timeouts, "
+              f"{level_stats['damage_taken'] / args.seeds:.1f} average damage taken")
+    runs = args.seeds * len(ALL_LEVELS)
+    print(f"[+] {runs} runs, {frames} frames in {elapsed:.1f}s ({frames / elapsed:.0f} frames/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,25 @@
 WIDTH, HEIGHT = 800, 600  # Taller for vertical exploration
 LEVEL_HEIGHT = 2400  # Total level height for vertical scrolling
 FPS = 60
+SIM_HZ = 60                      # Fixed simulation steps per second
+SIM_DT_MS = 1000.0 / SIM_HZ      # Milliseconds of game time per simulation step
+MAX_SIM_STEPS_PER_FRAME = 5      # Catch-up limit so a long stall can't spiral
+DIRTY_RECT_RENDERING = False     # Repaint only changed regions while the camera is still
+COLLISION_CELL_SIZE = 128        # Spatial hash cell size for the collision broad-phase
+ATTACK_POOL_SIZE = 4             # Preallocated player attack hitboxes
+PROJECTILE_POOL_SIZE = 256       # Preallocated projectile slots per level
+LEVEL_CACHE_DIR = None           # Directory to also cache generated levels on disk in (None keeps them in memory only)
+LEVEL_CACHE_MEMORY_SIZE = 8      # Generated levels kept in memory for instant restarts
+LEVEL_CACHE_MAX_FILES = 256      # Cached level files kept on disk, least recently used removed first
+TERRAIN_ATTEMPTS = 10            # Seeds tried in turn when generated terrain cannot be made reachable
+REPLAY_KEYFRAME_INTERVAL = 300   # Simulation steps between state keyframes in recorded replays
+ENV_MAX_STEPS = 3600             # Environment steps before an episode is cut off (one minute of play)
+ENV_FRAME_SKIP = 1               # Simulation steps each environment action is held for
+ENV_START_CACHE_SIZE = 64        # Start-of-level snapshots an environment keeps for resets
+MAX_ENEMIES_ATTACKING = 2        # Enemies that can hurt the player on contact in one frame
+ROLLOUT_MAX_FRAMES = 3600        # Frames before a batch rollout stops and counts as a timeout
+DIFFICULTY_BIN_FRAMES = 60       # Width of a level-duration histogram bin in difficulty estimates (one second)
+DIFFICULTY_RESULTS_PATH = 'difficulty_results.json'  # Difficulty estimates accumulate here
 WHITE = (255, 255, 255)
 BLUE = (50, 100, 255)
 GREEN = (50, 200, 50)
@@ -0,0 +1,112 @@
+"""
+Uniform-grid spatial hash used as the collision broad-phase.
+Sprites are bucketed into fixed-size cells by their rect, so a query only
+tests the sprites sharing a cell with the query rect instead of scanning a
+whole group.
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+from settings import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """Buckets sprites into grid cells for fast overlap queries"""
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, pygame.sprite.Sprite]]] = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        """Remove all sprites from the grid"""
+        self.cells.clear()
+        self._count = 0
+
+    def insert(self, sprite):
+        """
+        Add a sprite at its current rect.
+
+        Args:
+            sprite: Sprite with a rect attribute
+        """
+        # Insertion order is stored so queries can report hits in the same
+        # order as iterating the original group
+        entry = (self._count, sprite)
+        self._count += 1
+        cells = self.cells
+        size = self.cell_size
+        left, top, width, height = sprite.rect
+        x0 = left // size
+        x1 = (left + width - 1) // size
+        y0 = top // size
+        y1 = (top + height - 1) // size
+        # Cells are looped over inline; this runs for every target every frame
+        if x0 == x1 and y0 == y1:
+            # Most sprites are smaller than a cell and sit inside one
+            bucket = cells.get((x0, y0))
+            if bucket is None:
+                cells[(x0, y0)] = [entry]
+            else:
+                bucket.append(entry)
+            return
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild(self, sprites):
+        """
+        Replace the grid contents with the given sprites.
+
+        Args:
+            sprites: Iterable of sprites (e.g. a pygame Group)
+        """
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect, layers=None) -> List[pygame.sprite.Sprite]:
+        """
+        Find every sprite whose rect overlaps the given rect.
+
+        Args:
+            rect: pygame Rect to test
+            layers: Optional collision layer bits; sprites whose
+                collision_layer has none of them are ignored
+
+        Returns:
+            Overlapping sprites in insertion order
+        """
+        found = {}
+        cells = self.cells
+        size = self.cell_size
+        left, top, width, height = rect
+        colliderect = rect.colliderect
+        for cx in range(left // size, (left + width - 1) // size + 1):
+            for cy in range(top // size, (top + height - 1) // size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for order, sprite in bucket:
+                    if order in found:
+                        continue
+                    if layers is not None and not sprite.collision_layer & layers:
+                        continue
+                    if colliderect(sprite.rect):
+                        found[order] = sprite
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
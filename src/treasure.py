@@ -1,9 +1,13 @@
 import pygame
 import random
 from settings import YELLOW, ORANGE, WIDTH, HEIGHT
+from collision import LAYER_PLAYER, LAYER_TREASURE
 
 class Treasure(pygame.sprite.Sprite):
     """Collectible treasure that grants stickers"""
+    collision_layer = LAYER_TREASURE
+    collision_mask = LAYER_PLAYER
+    
     def __init__(self, x, y, sticker_id=None, hidden_initially=True):
         super().__init__()
         self.size = 25
@@ -22,6 +26,20 @@ class Treasure(pygame.sprite.Sprite):
         if self.hidden:
             self.hide()
 
+    def get_state(self):
+        """Return the treasure's mutable state as a tuple (see Game.snapshot)"""
+        return (self.hidden, self.collected)
+
+    def set_state(self, state):
+        """Restore a tuple returned by get_state"""
+        hidden, self.collected = state
+        # Only redraw when the visibility actually changes
+        if hidden != self.hidden:
+            if hidden:
+                self.hide()
+            else:
+                self.reveal()
+
     def hide(self):
         """Hide the treasure until enemies are defeated"""
         self.hidden = True
@@ -1,6 +1,7 @@
 # Utility functions for terrain generation and game helpers
 import random
 from platform import Platform
+from reachability import repair_platform
 from obstacles import spike, fire, slow_trap, slippery, block, falling_rock, poison_pool, electric, healing_plant, bouncy
 from settings import WIDTH, HEIGHT, OBSTACLE_SIZE
 
@@ -9,7 +10,20 @@ def load_image(path):
     return pygame.image.load(path).convert_alpha()
 
 
-def generate_terrain(seed=None, difficulty=1, is_boss=False):
+def level_difficulty(level):
+    """
+    Difficulty a level is generated at: it rises every three levels.
+
+    Args:
+        level: Level number
+
+    Returns:
+        Difficulty from 1 to 3
+    """
+    return min(1 + (level - 1) // 3, 3)
+
+
+def generate_terrain(seed=None, difficulty=1, is_boss=False, rng=None, repair=True):
     """
     Procedurally generate platforms for a level.
     Generates taller levels for vertical exploration within screen bounds.
@@ -18,12 +32,21 @@ def generate_terrain(seed=None, difficulty=1, is_boss=False):
         seed: Random seed for reproducible generation
         difficulty: Affects platform spacing and complexity (1-3)
         is_boss: If True, generate a smaller arena for boss stage
+        rng: random.Random to seed and draw from (defaults to the random module)
+        repair: If True, move platforms the player could not jump onto (see reachability.py)
     
     Returns:
         List of Platform objects
+
+    Raises:
+        ValueError: If repair is on and a platform cannot be moved into reach;
+            the layout is rejected and the caller should try another seed
     """
+    import pygame
+    if rng is None:
+        rng = random
     if seed is not None:
-        random.seed(seed)
+        rng.seed(seed)
     
     platforms = []
     
@@ -47,28 +70,36 @@ def generate_terrain(seed=None, difficulty=1, is_boss=False):
         max_platform_width = 200 + (difficulty * 30)
         
         # Start the first platform closer to the ground (just above it with smaller gap)
-        y = HEIGHT - 40 - random.randint(80, 120)  # Smaller gap to start closer to ground
-        x = random.randint(50, WIDTH - 150)
+        y = HEIGHT - 40 - rng.randint(80, 120)  # Smaller gap to start closer to ground
+        x = rng.randint(50, WIDTH - 150)
         
         # Generate platforms with consistent spacing all the way to near the top
         # Keep generating until we're close to the top (y < 100)
         while y > 100:
-            platform_width = random.randint(min_platform_width, max_platform_width)
-            x = max(50, min(x + random.randint(-80, 80), WIDTH - platform_width - 50))
-            platforms.append(Platform(x, y, platform_width, 20))
-            gap = random.randint(min_gap, max_gap)
+            platform_width = rng.randint(min_platform_width, max_platform_width)
+            x = max(50, min(x + rng.randint(-80, 80), WIDTH - platform_width - 50))
+            rect = pygame.Rect(x, y, platform_width, 20)
+            if repair:
+                # Only the placed platform moves: the walk up the level (and
+                # so everything drawn from rng after it) stays the same
+                rect = repair_platform([p.rect for p in platforms], rect)
+            platforms.append(Platform(*rect))
+            gap = rng.randint(min_gap, max_gap)
             y -= gap
         
         # If there's still space, add a final platform at the top
         if y > 40:
-            top_platform_width = random.randint(min_platform_width, max_platform_width)
+            top_platform_width = rng.randint(min_platform_width, max_platform_width)
             top_x = (WIDTH - top_platform_width) // 2
-            platforms.append(Platform(top_x, y, top_platform_width, 20))
+            rect = pygame.Rect(top_x, y, top_platform_width, 20)
+            if repair:
+                rect = repair_platform([p.rect for p in platforms], rect)
+            platforms.append(Platform(*rect))
     
     return platforms
 
 
-def generate_obstacles(seed=None, count=10, difficulty=1):
+def generate_obstacles(seed=None, count=10, difficulty=1, rng=None):
     """
     Procedurally generate obstacles for a level.
     
@@ -76,12 +107,15 @@ def generate_obstacles(seed=None, count=10, difficulty=1):
         seed: Random seed for reproducible generation
         count: Number of obstacles to generate (up to 10)
         difficulty: Affects obstacle types and damages (1-3)
+        rng: random.Random to seed and draw from (defaults to the random module)
     
     Returns:
         List of Obstacle objects
     """
+    if rng is None:
+        rng = random
     if seed is not None:
-        random.seed(seed)
+        rng.seed(seed)
     
     count = min(count, 10)
     obstacles = []
@@ -91,9 +125,9 @@ def generate_obstacles(seed=None, count=10, difficulty=1):
                      poison_pool, electric, healing_plant, bouncy]
     
     for _ in range(count):
-        obstacle_type = random.choice(obstacle_types)
-        x = random.randint(0, WIDTH - OBSTACLE_SIZE)
-        y = random.randint(150, HEIGHT - OBSTACLE_SIZE - 100)
+        obstacle_type = rng.choice(obstacle_types)
+        x = rng.randint(0, WIDTH - OBSTACLE_SIZE)
+        y = rng.randint(150, HEIGHT - OBSTACLE_SIZE - 100)
         
         # Avoid creating spike_row to keep obstacle count manageable
         # Single obstacles only to meet the 4-6 constraint
@@ -0,0 +1,97 @@
+"""
+Batched agent environments.
+VectorEnv steps N independent game worlds in lockstep in one process and
+returns their observations, rewards and done flags stacked into NumPy
+arrays. The worlds share nothing but read-only caches (loaded assets,
+generated level descriptions), so they can run side by side; batching
+pays for console silencing and array conversion once per step instead of
+once per world.
+"""
+
+import contextlib
+import numpy as np
+from settings import ENV_MAX_STEPS, ENV_FRAME_SKIP
+from env import GameEnv, OBSERVATION_SIZE
+
+
+class VectorEnv:
+    """Steps several GameEnv worlds at once"""
+
+    def __init__(self, num_envs, max_steps=ENV_MAX_STEPS, frame_skip=ENV_FRAME_SKIP, quiet=True, seed=None):
+        """
+        Initialize the worlds. Their games are created on the first reset().
+
+        Args:
+            num_envs: Number of worlds
+            max_steps: Steps before an episode is cut off (None for no limit)
+            frame_skip: Simulation steps each action is held for
+            quiet: If True, silence the games' console messages
+            seed: Seeds the level seeds picked when none are given (world i uses seed + i)
+        """
+        self.num_envs = num_envs
+        self.quiet = quiet
+        self.envs = [GameEnv(max_steps, frame_skip, quiet=quiet, seed=None if seed is None else seed + i)
+                     for i in range(num_envs)]
+        self.n_actions = self.envs[0].n_actions
+        self.observation_size = OBSERVATION_SIZE
+        # Level each world plays (and resets to when an episode ends)
+        self.levels = [1] * num_envs
+
+    def _output(self):
+        """Context in which the games' prints are silenced if quiet"""
+        return contextlib.redirect_stdout(None) if self.quiet else contextlib.nullcontext()
+
+    def reset(self, seeds=None, levels=1):
+        """
+        Start a new episode in every world.
+
+        Args:
+            seeds: Level seed per world (None, or None entries, for random ones)
+            levels: Level to play, for all worlds or per world
+
+        Returns:
+            float32 array of shape (num_envs, OBSERVATION_SIZE)
+        """
+        if seeds is None:
+            seeds = [None] * self.num_envs
+        if isinstance(levels, int):
+            levels = [levels] * self.num_envs
+        if len(seeds) != self.num_envs or len(levels) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} seeds and levels")
+        self.levels = list(levels)
+        with self._output():
+            obs = [env._reset(seed, level) for env, seed, level in zip(self.envs, seeds, self.levels)]
+        return np.array(obs, dtype=np.float32)
+
+    def step(self, actions):
+        """
+        Step every world with its action. A world whose episode ends is reset
+        right away to a new seed on the same level, and its info holds the
+        episode's last observation as 'final_observation'.
+
+        Args:
+            actions: Index into ACTIONS per world
+
+        Returns:
+            (observations, rewards, dones, infos): arrays of shape
+            (num_envs, OBSERVATION_SIZE), (num_envs,) and (num_envs,), and
+            a list of info dicts
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        observations = []
+        rewards = []
+        dones = []
+        infos = []
+        with self._output():
+            for env, action, level in zip(self.envs, actions, self.levels):
+                obs, reward, done, info = env._step(int(action))
+                if done:
+                    info['final_observation'] = np.array(obs, dtype=np.float32)
+                    obs = env._reset(None, level)
+                observations.append(obs)
+                rewards.append(reward)
+                dones.append(done)
+                infos.append(info)
+        return (np.array(observations, dtype=np.float32), np.array(rewards, dtype=np.float32),
+                np.array(dones, dtype=bool), infos)
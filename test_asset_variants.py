@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for shared sprite variants:
+1. Variants are cached by (path, size, flip_x, alpha) and never change the
+   original sprite
+2. Sprites and animation frames are shared between everything that uses them
+3. The boss only re-tints its image when its phase changes
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import pygame
+from settings import ENEMY_SIZE, PLAYER_WIDTH, PLAYER_HEIGHT, PURPLE, ORANGE, RED
+from asset_loader import AssetLoader, get_loader
+from player import Player
+from enemies import Enemy
+from boss import Boss
+from platform_index import PlatformIndex
+
+IDLE = 'player/player_idle.png'
+
+
+def test_variant_keys():
+    """Test that each size, flip and alpha combination is its own cached variant"""
+    print("=" * 60)
+    print("TEST 1: Variant Cache Keys")
+    print("=" * 60)
+
+    try:
+        loader = AssetLoader()
+        assert loader.available, "The test needs the game's assets"
+        original = loader.load_sprite(IDLE)
+        original_pixels = pygame.image.tobytes(original, 'RGBA')
+        size = (PLAYER_WIDTH, PLAYER_HEIGHT)
+
+        variants = {}
+        for key in [(None, False, None), (size, False, None), (size, True, None),
+                    (size, False, 180), (size, True, 180), (None, True, None), (None, False, 180)]:
+            variant = loader.get_variant(IDLE, *key)
+            assert loader.get_variant(IDLE, *key) is variant, f"Variant {key} should be cached"
+            variants[key] = variant
+        assert len({id(v) for v in variants.values()}) == len(variants), "Each key should be its own variant"
+        assert variants[(None, False, None)] is original, "No transform should give back the sprite itself"
+        assert loader.get_variant(IDLE, original.get_size()) is original, "Its own size should not be scaled"
+        assert len(loader.variant_cache) == 8, "Every key asked for should be cached once"
+        print(f"  [+] {len(loader.variant_cache)} variants of one sprite are cached separately")
+
+        scaled, mirrored = variants[(size, False, None)], variants[(size, True, None)]
+        assert scaled.get_size() == size and mirrored.get_size() == size, "Variants should be scaled"
+        assert pygame.image.tobytes(pygame.transform.flip(scaled, True, False), 'RGBA') == \
+            pygame.image.tobytes(mirrored, 'RGBA'), "Flipped variants should mirror the scaled sprite"
+        assert variants[(size, True, 180)].get_alpha() == 180, "Alpha variants should be translucent"
+        assert variants[(None, False, 180)].get_alpha() == 180 and original.get_alpha() != 180, \
+            "An alpha variant of the unscaled sprite should be a copy"
+        assert pygame.image.tobytes(original, 'RGBA') == original_pixels, "The original should be untouched"
+        print("  [+] Variants are scaled, mirrored and faded without touching the original")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            missing = loader.get_variant('player/missing.png', size)
+        assert missing is None, "Missing sprites should give None"
+        print("  [+] Missing sprites give None")
+
+        print("[+] PASS: Variant cache keys")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_shared_identity():
+    """Test that sprites using the same variant share one surface"""
+    print("=" * 60)
+    print("TEST 2: Shared Variants")
+    print("=" * 60)
+
+    try:
+        loader = get_loader()
+        with contextlib.redirect_stdout(io.StringIO()):
+            players = [Player(100, 100), Player(300, 200)]
+            enemies = [Enemy(100, 100), Enemy(400, 300, pattern='jump')]
+        assert players[0].idle_image is players[1].idle_image, "Players should share their idle sprite"
+        assert players[0].idle_image_left is players[1].idle_image_left, "And its mirrored version"
+        assert players[0].idle_image is loader.get_variant(IDLE, (PLAYER_WIDTH, PLAYER_HEIGHT)), \
+            "The idle sprite should come from the loader's variants"
+        assert players[0].running_animation_left is players[1].running_animation_left, \
+            "Players should share animation frames"
+        assert enemies[0].image is enemies[1].image, "Enemies should share their sprite"
+        assert enemies[0].image.get_size() == (ENEMY_SIZE, ENEMY_SIZE), "Enemies should use the scaled sprite"
+        print("  [+] Players and enemies share their sprites and frames")
+
+        frames = loader.get_animation_variant('animations/sword_swing', 4, (60, 40), alpha=180)
+        assert loader.get_animation_variant('animations/sword_swing', 4, (60, 40), alpha=180) is frames, \
+            "Repeated animation variants should be one list"
+        assert [loader.get_variant(f'animations/sword_swing_{i}.png', (60, 40), False, 180) for i in range(4)] \
+            == frames, "Animation frames should be the per-frame variants"
+        assert all(frame.get_alpha() == 180 and frame.get_size() == (60, 40) for frame in frames), \
+            "Every frame should be transformed"
+        assert loader.get_animation_variant('animations/sword_swing', 4, (60, 40)) is not frames, \
+            "Other transforms should be other frames"
+        print("  [+] Animation variants are built from the shared per-frame variants")
+
+        print("[+] PASS: Shared variants")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_boss_retint():
+    """Test that the boss image is only re-tinted on a phase change"""
+    print("=" * 60)
+    print("TEST 3: Boss Re-Tint on Phase Change")
+    print("=" * 60)
+
+    try:
+        platforms = PlatformIndex([])
+        with contextlib.redirect_stdout(io.StringIO()):
+            player = Player(100, 100)
+            boss = Boss(300, 100)
+        bear = boss.base_image
+        for health in [150] * 10 + [70] * 10 + [30] * 10:
+            boss.health = health
+            boss.update(player, platforms)
+            assert boss.image is bear, "The bear sprite should be drawn as it is in every phase"
+        print("  [+] The bear sprite is never copied")
+
+        # The hand-drawn square used without assets is tinted per phase
+        boss.phase = 1
+        boss.base_image = pygame.Surface((ENEMY_SIZE * 2, ENEMY_SIZE * 2))
+        boss._image_phase = None
+        images = []
+        for health, phase, color in ((150, 1, PURPLE), (70, 2, ORANGE), (30, 3, RED)):
+            boss.health = health
+            boss.update(player, platforms)
+            image = boss.image
+            for _ in range(30):
+                boss.update(player, platforms)
+                assert boss.image is image, f"Phase {phase} should keep its image between frames"
+            assert boss.phase == phase and image.get_at((2, 2))[:3] == color, f"Phase {phase} should be tinted"
+            images.append(image)
+        assert len({id(image) for image in images}) == 3, "Each phase change should re-tint once"
+        assert boss.base_image.get_at((2, 2))[:3] == (0, 0, 0), "Tinting should not change the base image"
+        print("  [+] The fallback square is re-tinted once per phase, not per frame")
+
+        print("[+] PASS: Boss re-tint on phase change")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tests = [
+        test_variant_keys,
+        test_shared_identity,
+        test_boss_retint,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
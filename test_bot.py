@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the playtest bot:
+1. Routes are planned from the reachability graph, including landing on a
+   platform the player's head reaches and jumping across to one at the
+   same height
+2. The bot clears generated levels, the boss level included, and reports
+   time to clear and damage taken
+3. Bot runs are reproducible and play far faster than real time
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import time
+from settings import SIM_HZ, BOSS_LEVEL
+from platform import Platform
+from rollout import ALL_LEVELS, OUTCOME_COMPLETE
+from bot import PlaytestBot, playtest, _find_routes
+
+
+def test_jump_planning():
+    """Test which platforms the bot thinks it can jump to"""
+    print("=" * 60)
+    print("TEST 1: Jump Planning")
+    print("=" * 60)
+
+    try:
+        ground = Platform(0, 560, 800, 40)
+        low, head_high, too_high = (Platform(300, y, 200, 20) for y in (400, 360, 300))
+        routes = _find_routes([ground, low, head_high, too_high])
+        assert routes[ground, low] == (1, low), "A low platform overhead is in reach"
+        # Higher than a jump lifts the feet (about 148px), but the head gets there
+        assert routes[ground, head_high] == (1, head_high), "A platform the head reaches is in reach"
+        assert routes[ground, too_high][0] > 1, "A platform 260px up is out of reach in one jump"
+        print("  [+] Reach overhead matches the jump height plus the player's height")
+
+        ledge = Platform(100, 400, 150, 20)
+        near, far = Platform(340, 260, 150, 20), Platform(500, 260, 150, 20)
+        routes = _find_routes([ledge, near, far])
+        assert routes[ledge, near] == (1, near), "A 90px gap can be jumped from the edge"
+        assert routes[ledge, far] == (2, near), "A 250px gap is too wide, so the way is across the nearer one"
+        assert routes[near, far] == (1, far) and routes[far, near] == (1, near), \
+            "Platforms at the same height should be jumped between"
+        print("  [+] Gaps are jumped from the nearest edge, including to platforms at the same height")
+
+        top = Platform(300, 240, 200, 20)
+        middle = Platform(250, 400, 200, 20)
+        routes = _find_routes([ground, middle, top])
+        assert routes[ground, top] == (2, middle), "The top should be reached by way of the middle platform"
+        assert routes[top, ground] == (1, ground), "Dropping down should take one step"
+        print("  [+] Routes go through the fewest platforms")
+
+        print("[+] PASS: Jump planning")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_bot_clears_levels():
+    """Test that the bot clears levels and reports what it took"""
+    print("=" * 60)
+    print("TEST 2: Bot Clears Levels")
+    print("=" * 60)
+
+    try:
+        seeds = range(10)
+        results = list(playtest(seeds, workers=0))
+        assert [(r.seed, r.level) for r in results] == [(s, l) for s in seeds for l in ALL_LEVELS], \
+            "There should be one result per (seed, level)"
+
+        for level in ALL_LEVELS:
+            runs = [r for r in results if r.level == level]
+            cleared = [r for r in runs if r.outcome == OUTCOME_COMPLETE]
+            assert len(cleared) >= 0.9 * len(runs), f"The bot should clear level {level} almost every time"
+            assert all(r.enemies_left == 0 for r in cleared), "Levels are only cleared once the enemies are dead"
+            assert all(0 <= r.damage_taken <= 100 + 50 for r in cleared), "Damage taken out of range"
+            clear_time = sum(r.frames for r in cleared) / len(cleared) / SIM_HZ
+            damage = sum(r.damage_taken for r in cleared) / len(cleared)
+            print(f"  [+] Level {level}: cleared {len(cleared)}/{len(runs)}, "
+                  f"{clear_time:.1f}s to clear, {damage:.1f} damage taken")
+        assert any(r.damage_taken > 0 for r in results if r.level == BOSS_LEVEL), "The boss should fight back"
+
+        print("[+] PASS: Bot clears levels")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_reproducible_and_fast():
+    """Test that bot runs repeat exactly and beat real time by far"""
+    print("=" * 60)
+    print("TEST 3: Reproducible, Faster Than Real Time")
+    print("=" * 60)
+
+    try:
+        bot = PlaytestBot()
+        assert bot.read() == 0, "A bot with no game should press nothing"
+
+        seeds = range(20, 26)
+        start = time.perf_counter()
+        pooled = list(playtest(seeds, workers=2))
+        elapsed = time.perf_counter() - start
+        assert pooled == list(playtest(seeds, workers=0)), "Bot runs should be the same in every process"
+        print(f"  [+] {len(pooled)} runs repeat exactly on a process pool")
+
+        speedup = sum(r.frames for r in pooled) / SIM_HZ / elapsed
+        print(f"  [+] {speedup:.0f}x real time, pool start-up included")
+        assert speedup > 10, "Playtests should run many times faster than real time"
+
+        print("[+] PASS: Reproducible and faster than real time")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_jump_planning,
+        test_bot_clears_levels,
+        test_reproducible_and_fast,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the layered collision pipeline:
+1. Handlers run in registration order and only for masked layer pairs
+2. Game collisions (contact damage, pickups, power-ups) resolve through the pipeline
+3. Each mover queries the broad-phase once and is resolved before the next
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import pygame
+from collision import CollisionPipeline, LAYER_PLAYER, LAYER_ATTACK, LAYER_ENEMY, LAYER_PICKUP
+from game import Game
+from health_pickup import HealthPickup
+from powerup import PowerUp, SpeedPowerUp
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, rect, layer, mask=0):
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.collision_layer = layer
+        self.collision_mask = mask
+
+
+def test_pipeline_dispatch():
+    """Test dispatch order, layer masks and skipping of killed targets"""
+    print("=" * 60)
+    print("TEST 1: Pipeline Dispatch")
+    print("=" * 60)
+
+    try:
+        calls = []
+        pipeline = CollisionPipeline()
+        pipeline.register(LAYER_PLAYER, LAYER_PICKUP, lambda mover, hits: calls.append(('pickup', hits)))
+        pipeline.register(LAYER_PLAYER, LAYER_ENEMY, lambda mover, hits: calls.append(('enemy', hits)))
+
+        player = _Box((0, 0, 50, 50), LAYER_PLAYER, LAYER_ENEMY | LAYER_PICKUP)
+        enemies = pygame.sprite.Group(_Box((10, 10, 20, 20), LAYER_ENEMY), _Box((500, 500, 20, 20), LAYER_ENEMY))
+        pickup, dead = _Box((20, 20, 5, 5), LAYER_PICKUP), _Box((25, 25, 5, 5), LAYER_PICKUP)
+        pickups = pygame.sprite.Group(pickup, dead)
+
+        pipeline.build(enemies, pickups)
+        dead.kill()
+        pipeline.run([player])
+
+        assert [name for name, _ in calls] == ['pickup', 'enemy'], "Handlers should run in registration order"
+        assert calls[0][1] == [pickup], "Killed targets should be skipped"
+        assert calls[1][1] == [list(enemies)[0]], "Only overlapping enemies should be reported"
+        print("  [+] Handlers run in order with only overlapping, live targets")
+
+        calls.clear()
+        player.collision_mask = LAYER_PICKUP
+        pipeline.run([player])
+        assert [name for name, _ in calls] == ['pickup'], "Unmasked layers should not be dispatched"
+        print("  [+] Layer masks filter handler dispatch")
+
+        print("[+] PASS: Pipeline dispatches correctly")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_game_collisions():
+    """Test that in-game collisions resolve through the pipeline"""
+    print("=" * 60)
+    print("TEST 2: Game Collisions")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)
+        enemy = next(iter(game.enemies))
+        game.player.rect.topleft = enemy.rect.topleft
+        health = game.player.health
+        game.step(1)
+        assert game.player.health < health, "Enemy contact should damage the player"
+        print("  [+] Enemy contact damages the player")
+
+        game = Game(level=1, seed=42, headless=True)
+        game.enemies.empty()
+        game.step(1)  # Let the player settle onto the ground
+        game.player.health = 50
+        pickup = HealthPickup(game.player.rect.centerx, game.player.rect.centery)
+        powerup = SpeedPowerUp(game.player.rect.centerx, game.player.rect.centery)
+        game.health_pickups.add(pickup)
+        game.powerups.add(powerup)
+        game.step(1)
+        assert game.player.health == 50 + pickup.heal_amount, "Pickup should heal the player"
+        assert game.player.speed_mod > 1.0, "Speed power-up should boost the player"
+        assert not pickup.alive() and not powerup.alive(), "Collected items should be removed"
+        try:
+            PowerUp(0, 0)
+            assert False, "Power-ups without an effect should not be created"
+        except TypeError:
+            pass
+        print("  [+] Pickups and power-ups apply to the player")
+
+        print("[+] PASS: Game collisions resolve through the pipeline")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_per_mover_dispatch():
+    """Test that movers are resolved one at a time from one broad-phase query each"""
+    print("=" * 60)
+    print("TEST 3: Per-Mover Dispatch")
+    print("=" * 60)
+
+    try:
+        calls = []
+        pipeline = CollisionPipeline()
+        pipeline.register(LAYER_ATTACK, LAYER_ENEMY, lambda mover, hits: calls.append(('attack', mover, hits)))
+        pipeline.register(LAYER_PLAYER, LAYER_PICKUP, lambda mover, hits: calls.append(('pickup', mover, hits)))
+        pipeline.register(LAYER_PLAYER, LAYER_ENEMY, lambda mover, hits: calls.append(('enemy', mover, hits)))
+
+        enemy = _Box((10, 10, 20, 20), LAYER_ENEMY)
+        pickup = _Box((20, 20, 5, 5), LAYER_PICKUP)
+        player = _Box((0, 0, 50, 50), LAYER_PLAYER, LAYER_ENEMY | LAYER_PICKUP)
+        attacks = [_Box((0, 0, 40, 40), LAYER_ATTACK, LAYER_ENEMY), _Box((5, 5, 40, 40), LAYER_ATTACK, LAYER_ENEMY)]
+        pipeline.build(pygame.sprite.Group(enemy), static=(pygame.sprite.Group(pickup),))
+
+        queries = []
+        query = pipeline.grid.query
+
+        def counted(rect, mask):
+            queries.append(tuple(rect))
+            return query(rect, mask)
+        pipeline.grid.query = counted
+
+        pipeline.run([*attacks, player])
+        assert [(name, mover) for name, mover, _ in calls] == \
+            [('attack', attacks[0]), ('attack', attacks[1]), ('pickup', player), ('enemy', player)], \
+            "Each mover should be resolved in turn, running its handlers in registration order"
+        assert calls[2][2] == [pickup] and calls[3][2] == [enemy], "Hits should be split by target layer"
+        assert len(queries) == 3, "Each mover should query the grid once for all of its layers"
+        print("  [+] Movers resolve in turn from one query each")
+
+        calls.clear()
+        queries.clear()
+        pipeline.register(LAYER_PLAYER, LAYER_PICKUP, lambda mover, hits: mover.rect.move_ip(500, 500))
+        pipeline.run([player])
+        assert calls == [] and len(queries) == 2, "A moved mover should be queried again"
+        pipeline.register(LAYER_PLAYER, LAYER_PICKUP, lambda mover, hits: enemy.kill())
+        player.rect.topleft = (0, 0)
+        pipeline.run([player])
+        assert calls == [], "Targets killed by an earlier handler should be skipped"
+        print("  [+] Movers moved by a handler are queried again and killed targets are skipped")
+
+        print("[+] PASS: Per-mover dispatch")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_pipeline_dispatch,
+        test_game_collisions,
+        test_per_mover_dispatch,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
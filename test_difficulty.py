@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for Monte Carlo difficulty estimates:
+1. Deaths are put down to what dealt the killing blow
+2. Batches fold into per-level counts and NumPy duration histograms that
+   merge by adding up and survive a save/load round trip; batches replaying
+   recorded seeds are refused
+3. Repeated command-line runs continue with new seeds and merge into one file,
+   and runs over seeds already in the file are refused
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import os
+import tempfile
+import numpy as np
+from settings import BOSS_LEVEL
+from obstacles import spike
+from game import Game
+from rollout import RolloutResult, run_rollout, OUTCOME_COMPLETE, OUTCOME_DEATH, OUTCOME_TIMEOUT
+from input_source import ActionInput
+from difficulty import DifficultyResults, estimate, format_report, main as difficulty_main
+
+
+def test_death_causes():
+    """Test that the player remembers what hurt it last"""
+    print("=" * 60)
+    print("TEST 1: Death Causes")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=3, headless=True)
+            player = game.player
+            assert player.last_damage_source is None, "Nothing should have hurt a new player"
+
+            spike(player.rect.x, player.rect.y).apply_to(player)
+            assert player.last_damage_source == 'spike', "Obstacles should report their type"
+            blob = game.snapshot()
+            player.invuln_timer = 0
+            game._on_enemy_contact(player, [next(iter(game.enemies))])
+            assert player.last_damage_source == 'enemy', "Enemy contact should be reported"
+            game.restore(blob)
+            assert player.last_damage_source == 'spike', "Snapshots should keep the last damage source"
+        print("  [+] Obstacles and enemies are recorded, and snapshots keep them")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            boss_game = Game(level=BOSS_LEVEL, seed=3, headless=True)
+            boss_game.boss.health = boss_game.boss.max_health * 0.4
+            boss_game.boss.update(boss_game.player, boss_game.platform_index)
+            boss_game._on_enemy_contact(boss_game.player, [boss_game.boss])
+        assert boss_game.player.last_damage_source == 'boss phase 2', "Boss damage should name the boss phase"
+        print("  [+] Boss damage is put down to the boss phase")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_rollout(game, 5, BOSS_LEVEL, ActionInput(), max_frames=3600)
+        assert result.outcome == OUTCOME_DEATH, "Standing still should lose the boss fight"
+        assert result.death_cause.startswith('boss phase'), "The rollout should say the boss won"
+        print(f"  [+] Idle boss fight lost to: {result.death_cause}")
+
+        print("[+] PASS: Death causes")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def _result(seed, level, outcome, frames, cause=''):
+    """A made-up rollout result"""
+    return RolloutResult(seed, level, outcome, frames, 0, 0 if outcome == OUTCOME_DEATH else 100, 0, cause)
+
+
+def test_histograms_and_merge():
+    """Test the statistics kept for a batch and merging batches"""
+    print("=" * 60)
+    print("TEST 2: Histograms and Merging")
+    print("=" * 60)
+
+    try:
+        first = [_result(0, 1, OUTCOME_COMPLETE, 100), _result(1, 1, OUTCOME_COMPLETE, 130),
+                 _result(2, 1, OUTCOME_DEATH, 200, 'spike'), _result(0, 5, OUTCOME_TIMEOUT, 3600)]
+        second = [_result(3, 1, OUTCOME_COMPLETE, 3600), _result(4, 1, OUTCOME_DEATH, 50, 'enemy'),
+                  _result(3, 5, OUTCOME_DEATH, 70, 'spike')]
+
+        results = DifficultyResults('bot', max_frames=3600, bin_frames=60)
+        results.add(first)
+        stats = results.levels[1]
+        assert results.runs(1) == 3 and abs(results.clear_rate(1) - 2 / 3) < 1e-9, "Wrong clear rate"
+        assert stats['clear_frames'][1] == 1 and stats['clear_frames'][2] == 1, "Clears binned by duration"
+        assert stats['death_frames'].sum() == 1 and stats['death_causes'] == {'spike': 1}, "Wrong deaths"
+        assert results.levels[5]['difficulty'] == 2 and results.clear_rate(5) == 0, "Level 5 is difficulty 2"
+        assert results.clear_time(1) == 2.0 and results.clear_time(5) is None, "Wrong clear time"
+        assert results.next_seed == 3, "The next batch should carry on after seed 2"
+        assert stats['seeds'] == [(0, 3)] and results.levels[5]['seeds'] == [(0, 1)], "Seeds played per level"
+        print("  [+] Outcomes, death causes and duration histograms are counted per level")
+
+        batch = DifficultyResults('bot', max_frames=3600, bin_frames=60)
+        batch.add(second)
+        results.merge(batch)
+        combined = DifficultyResults('bot', max_frames=3600, bin_frames=60)
+        combined.add(first + second)
+        assert results.to_dict() == combined.to_dict(), "Merging should match one big batch"
+        assert results.levels[1]['clear_frames'][-1] == 1, "A clear on the last frame goes in the last bin"
+        assert results.levels[1]['seeds'] == [(0, 5)] and results.levels[5]['seeds'] == [(0, 1), (3, 4)], \
+            "Merging should join the seed ranges"
+        print("  [+] Merged batches match a single batch")
+
+        before = results.to_dict()
+        for replayed in ([_result(4, 1, OUTCOME_COMPLETE, 100), _result(5, 1, OUTCOME_COMPLETE, 100)],
+                         [_result(9, 1, OUTCOME_COMPLETE, 100), _result(3, 5, OUTCOME_DEATH, 70, 'spike')]):
+            overlapping = DifficultyResults('bot', max_frames=3600, bin_frames=60)
+            overlapping.add(replayed)
+            try:
+                results.merge(overlapping)
+                assert False, "Seeds already in the results should not merge"
+            except ValueError:
+                pass
+            assert results.to_dict() == before, "A refused merge should not change the results"
+        assert results.first_played(5, 1, 3) is None and results.first_played(5, 1, 10) == 3, \
+            "first_played should find recorded seeds in a range"
+        print("  [+] Batches replaying recorded seeds are refused, leaving the results unchanged")
+
+        path = os.path.join(tempfile.mkdtemp(), 'difficulty.json')
+        results.save(path)
+        loaded = DifficultyResults.load(path)
+        assert loaded.to_dict() == results.to_dict(), "Save/load should round-trip"
+        assert isinstance(loaded.levels[1]['clear_frames'], np.ndarray), "Histograms should load as arrays"
+        print("  [+] Results round-trip through JSON")
+
+        try:
+            results.merge(DifficultyResults('random', max_frames=3600, bin_frames=60))
+            assert False, "Results from another player should not merge"
+        except ValueError:
+            pass
+        print("  [+] Results from other players or settings are refused")
+
+        print("[+] PASS: Histograms and merging")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_incremental_runs():
+    """Test that command-line runs keep adding new seeds to the results file"""
+    print("=" * 60)
+    print("TEST 3: Incremental Runs")
+    print("=" * 60)
+
+    try:
+        path = os.path.join(tempfile.mkdtemp(), 'difficulty.json')
+        args = ['--seeds', '2', '--levels', '1', str(BOSS_LEVEL), '--workers', '0',
+                '--results', path]
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert difficulty_main(args) == 0, "First run failed"
+            assert difficulty_main(args) == 0, "Second run failed"
+            assert difficulty_main(args + ['--player', 'random']) == 1, "Another player should be refused"
+        assert "seeds 2-3" in output.getvalue(), "The second run should carry on with new seeds"
+
+        with open(path) as f:
+            saved = f.read()
+        for first_seed in ('0', '3'):
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                assert difficulty_main(args + ['--first-seed', first_seed]) == 1, "Replayed seeds should be refused"
+            assert "already been played" in output.getvalue(), "The refusal should say why"
+        with open(path) as f:
+            assert f.read() == saved, "A refused run should leave the file alone"
+        print("  [+] Runs over seeds already in the file are refused")
+
+        results = DifficultyResults.load(path)
+        expected = estimate(range(4), (1, BOSS_LEVEL), workers=0)
+        assert results.to_dict() == expected.to_dict(), "Two runs should add up to one run over all seeds"
+        assert results.runs(1) == 4 and results.next_seed == 4, "Both runs should be in the file"
+        for line in format_report(results):
+            print(f"  {line}")
+
+        print("[+] PASS: Incremental runs")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_death_causes,
+        test_histograms_and_merge,
+        test_incremental_runs,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
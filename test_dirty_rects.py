@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for dirty-rectangle rendering:
+1. Dirty-rect frames look identical to fully redrawn frames
+2. Only partial updates are produced while the camera is stationary
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import pygame
+from game import Game
+
+
+def test_dirty_frames_match_full_redraw():
+    """Test that dirty-rect rendering produces the same image as a full redraw"""
+    print("=" * 60)
+    print("TEST 1: Dirty Frames Match Full Redraw")
+    print("=" * 60)
+
+    try:
+        full_game = Game(level=1, seed=42)
+        dirty_game = Game(level=1, seed=42)
+        # Both games share the display surface, so render the reference offscreen
+        full_game.screen = pygame.Surface(dirty_game.screen.get_size())
+        dirty_game.dirty_rect_rendering = True
+
+        partial_frames = 0
+        for frame in range(120):
+            full_game.update()
+            dirty_game.update()
+            assert full_game.draw_game() is None, "Full redraw should request a flip"
+            full_image = pygame.image.tostring(full_game.screen, 'RGB')
+
+            rects = dirty_game.draw_game()
+            dirty_image = pygame.image.tostring(dirty_game.screen, 'RGB')
+            if rects is not None:
+                partial_frames += 1
+
+            assert full_image == dirty_image, f"Frame {frame} differs from full redraw"
+
+        print(f"  [+] {partial_frames}/120 frames used partial updates")
+        assert partial_frames > 0, "Expected partial updates once the camera settled"
+        print("[+] PASS: Dirty-rect frames match full redraws")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_camera_move_forces_full_redraw():
+    """Test that a moving camera repaints the whole screen"""
+    print("=" * 60)
+    print("TEST 2: Camera Movement Forces Full Redraw")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42)
+        game.dirty_rect_rendering = True
+        for _ in range(120):
+            game.update()
+            game.draw_game()
+
+        # Jump the camera target far away so it scrolls next frame
+        game.camera.y -= 200
+        assert game.draw_game() is None, "Camera movement should force a full redraw"
+        print("[+] PASS: Camera movement forces a full redraw")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_dirty_frames_match_full_redraw,
+        test_camera_move_forces_full_redraw,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
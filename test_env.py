@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the agent environment:
+1. reset/step return observations, rewards, done flags and info, episodes
+   are reproducible for a seed, and resetting to a new level reuses the game
+   (without re-initializing pygame) and a bounded cache of start snapshots
+2. Episodes end on level completion, death and the step limit
+3. Stepping runs at over 10,000 steps per second
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import random
+import time
+import numpy as np
+import pygame
+from input_source import INPUT_RIGHT
+from env import GameEnv, ACTIONS, OBSERVATION_SIZE, REWARD_LEVEL_COMPLETE, REWARD_DEATH
+
+
+def _rollout(env, seed, level, actions):
+    """Play a list of actions from a reset and record what the environment returned"""
+    trace = [env.reset(seed=seed, level=level).tolist()]
+    for action in actions:
+        obs, reward, done, info = env.step(action)
+        trace.append((obs.tolist(), reward, done, info))
+        if done:
+            break
+    return trace
+
+
+def test_reset_and_step():
+    """Test the reset/step API and reproducibility"""
+    print("=" * 60)
+    print("TEST 1: Reset And Step")
+    print("=" * 60)
+
+    try:
+        env = GameEnv()
+        obs = env.reset(seed=42, level=1)
+        assert obs.shape == (OBSERVATION_SIZE,) and obs.dtype == np.float32, "Bad observation shape"
+        assert env.n_actions == len(ACTIONS), "Every action should be exposed"
+
+        x = env.game.player.rect.x
+        obs, reward, done, info = env.step(ACTIONS.index(INPUT_RIGHT))
+        assert env.game.player.rect.x > x, "RIGHT should move the player right"
+        assert isinstance(reward, float) and not done, "First step should give a reward and go on"
+        assert set(info) == {'level', 'health', 'enemies_left', 'steps', 'success', 'truncated'}, \
+            "Unexpected info keys"
+        print("  [+] reset/step return observation, reward, done and info")
+
+        rng = random.Random(3)
+        actions = [rng.randrange(env.n_actions) for _ in range(600)]
+        first = _rollout(env, 7, 2, actions)
+        _rollout(env, 8, 3, actions)
+        assert _rollout(env, 7, 2, actions) == first, "Episodes with the same seed should repeat exactly"
+        assert _rollout(GameEnv(), 7, 2, actions) == first, "A new environment should play the same episode"
+        print("  [+] Episodes are reproducible per seed")
+
+        game = env.game
+        set_mode = pygame.display.set_mode
+        displays = []
+        pygame.display.set_mode = lambda *args, **kwargs: displays.append(args) or set_mode(*args, **kwargs)
+        try:
+            new_level = _rollout(env, 9, 1, actions)
+        finally:
+            pygame.display.set_mode = set_mode
+        assert env.game is game and not displays, "New levels should reset the game, not re-initialize pygame"
+        assert _rollout(GameEnv(), 9, 1, actions) == new_level, "A reset game should play like a new one"
+        print("  [+] New levels reset the same game without re-initializing pygame")
+
+        env = GameEnv(start_cache_size=3)
+        for seed in (1, 2, 3, 1, 4, 5):
+            env.reset(seed=seed, level=1)
+        assert list(env._starts) == [(1, 1), (4, 1), (5, 1)], "Least recently used starts should be dropped"
+        print(f"  [+] At most {env.start_cache_size} start snapshots are kept, least recently used dropped")
+
+        print("[+] PASS: Reset and step")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_episode_end():
+    """Test that episodes end on completion, death and the step limit"""
+    print("=" * 60)
+    print("TEST 2: Episode End")
+    print("=" * 60)
+
+    try:
+        env = GameEnv(max_steps=50)
+        env.reset(seed=42, level=1)
+        game = env.game
+        for enemy in list(game.enemies):
+            enemy.take_damage(1000)
+        door = next(iter(game.doors))
+        game.player.rect.center = door.rect.center
+        obs, reward, done, info = env.step(0)
+        assert done and info['success'], "Reaching the unlocked door should end the episode"
+        assert reward >= REWARD_LEVEL_COMPLETE, "Completion should be rewarded"
+        print("  [+] Level completion ends the episode")
+
+        env.reset(seed=42, level=1)
+        env.game.player.health = 1
+        env.game.player.take_damage(1000)
+        obs, reward, done, info = env.step(0)
+        assert done and not info['success'] and reward <= REWARD_DEATH, "Death should end the episode"
+        print("  [+] Death ends the episode")
+
+        env.reset(seed=42, level=1)
+        for _ in range(50):
+            obs, reward, done, info = env.step(0)
+        assert done and info['truncated'] and info['steps'] == 50, "Episodes should be cut off at max_steps"
+        print("  [+] Episodes are cut off at the step limit")
+
+        print("[+] PASS: Episode end")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_throughput():
+    """Test environment steps per second with random actions"""
+    print("=" * 60)
+    print("TEST 3: Environment Throughput")
+    print("=" * 60)
+
+    try:
+        env = GameEnv()
+        rng = random.Random(0)
+        steps = 2000
+        # Best of a few rounds, so a busy machine doesn't fail the test
+        rates = []
+        for _ in range(5):
+            env.reset(seed=42, level=1)
+            start = time.perf_counter()
+            for _ in range(steps):
+                obs, reward, done, info = env.step(rng.randrange(env.n_actions))
+                if done:
+                    env.reset(seed=42, level=1)
+            rates.append(steps / (time.perf_counter() - start))
+        rate = max(rates)
+
+        print(f"  [+] {rate:.0f} steps/s with random actions (best of {len(rates)} rounds)")
+        assert rate > 10000, "Stepping should reach 10,000 steps per second"
+
+        print("[+] PASS: Environment throughput")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_reset_and_step,
+        test_episode_end,
+        test_throughput,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
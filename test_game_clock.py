@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for injectable game clocks:
+1. Each clock reports the expected amount of game time per tick
+2. Game.run simulates several steps per frame with an unthrottled clock
+3. The fixed-timestep loop carries leftover time between frames, clamps the
+   steps run per frame and moves the camera per step, not per frame
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import time
+from settings import SIM_DT_MS, LEVEL_HEIGHT
+from game import Game
+from game_clock import RealTimeClock, FixedStepClock, UnthrottledClock
+
+
+def test_clock_ticks():
+    """Test the game time each clock reports"""
+    print("=" * 60)
+    print("TEST 1: Clock Tick Values")
+    print("=" * 60)
+
+    try:
+        fixed = FixedStepClock(throttle=False)
+        assert fixed.tick(60) == SIM_DT_MS, "FixedStepClock should report one step per tick"
+        print("  [+] FixedStepClock reports one step per tick")
+
+        unthrottled = UnthrottledClock(steps_per_frame=8)
+        start = time.perf_counter()
+        for _ in range(100):
+            assert unthrottled.tick(60) == SIM_DT_MS * 8, "UnthrottledClock should report 8 steps per tick"
+        elapsed = time.perf_counter() - start
+        assert elapsed < 0.5, f"UnthrottledClock should not sleep ({elapsed:.3f}s for 100 ticks)"
+        print("  [+] UnthrottledClock reports 8 steps per tick without sleeping")
+
+        warped = RealTimeClock(time_scale=4.0)
+        assert warped.max_steps_per_frame >= 4, "Warped clock must allow catch-up steps"
+        print("  [+] RealTimeClock allows enough catch-up steps for time warp")
+
+        print("[+] PASS: Clocks report expected game time")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_run_with_unthrottled_clock():
+    """Test that Game.run simulates several steps per rendered frame"""
+    print("=" * 60)
+    print("TEST 2: Game.run With Unthrottled Clock")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, clock=UnthrottledClock(steps_per_frame=4))
+
+        frames = {'rendered': 0, 'simulated': 0}
+        max_frames = 30
+
+        def handle_events():
+            frames['rendered'] += 1
+            return frames['rendered'] < max_frames
+
+        original_update = game.update
+
+        def counting_update():
+            frames['simulated'] += 1
+            original_update()
+
+        game.handle_events = handle_events
+        game.update = counting_update
+
+        try:
+            game.run()
+        except SystemExit:
+            pass
+
+        print(f"  [+] {frames['rendered']} frames rendered, {frames['simulated']} steps simulated")
+        assert frames['simulated'] == max_frames * 4, "Expected 4 simulation steps per frame"
+        print("[+] PASS: Game runs faster than real time")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+class _StubClock:
+    """Clock that reports a scripted amount of game time per tick"""
+
+    def __init__(self, ticks, max_steps_per_frame):
+        self.ticks = list(ticks)
+        self.max_steps_per_frame = max_steps_per_frame
+
+    def tick(self, framerate=0):
+        return self.ticks.pop(0)
+
+
+def _run_frames(game, ticks, max_steps_per_frame=5):
+    """
+    Drive Game.run for one frame per scripted tick.
+
+    Returns:
+        List of (steps simulated, render_alpha, camera y drawn) per frame
+    """
+    game.clock = _StubClock(ticks, max_steps_per_frame)
+    frames = []
+    steps = [0]
+    original_update = game.update
+    original_draw = game._draw_scene
+
+    def counting_update():
+        steps[0] += 1
+        original_update()
+
+    def recording_draw():
+        frames.append((steps[0], game.render_alpha, game.camera.y))
+        steps[0] = 0
+        return original_draw()
+
+    game.update = counting_update
+    game._draw_scene = recording_draw
+    game.handle_events = lambda: len(game.clock.ticks) > 0
+    try:
+        game.run()
+    except SystemExit:
+        pass
+    return frames
+
+
+def _high_up_game():
+    """A game whose player stands on the topmost platform, so the camera has far to scroll"""
+    game = Game(level=1, seed=42, clock=FixedStepClock(throttle=False))
+    top = game.platform_index.topmost()
+    game.player.rect.midbottom = top.rect.midtop
+    return game
+
+
+def test_fixed_timestep_loop():
+    """Test the accumulator, the per-frame step clamp and render interpolation"""
+    print("=" * 60)
+    print("TEST 3: Fixed-Timestep Loop")
+    print("=" * 60)
+
+    try:
+        game = _high_up_game()
+        frames = _run_frames(game, [SIM_DT_MS / 2, SIM_DT_MS / 2, SIM_DT_MS * 2.5, 1000])
+        steps = [f[0] for f in frames]
+        alphas = [round(f[1], 3) for f in frames]
+        assert steps == [0, 1, 2, 5], f"Leftover time should carry over and steps be clamped, got {steps}"
+        assert alphas == [0.5, 0.0, 0.5, 1.0], f"Render alpha should be the leftover fraction, got {alphas}"
+        print("  [+] Leftover time carries over, steps per frame are clamped, alpha is the leftover fraction")
+
+        # Half way into a step, the camera is drawn half way along its last move
+        game = _high_up_game()
+        frames = _run_frames(game, [SIM_DT_MS * 3, SIM_DT_MS * 1.5])
+        before, after = game._prev_camera[1], game.camera.y
+        assert after < before < LEVEL_HEIGHT, "The camera should be scrolling up"
+        assert abs(frames[-1][2] - (before + after) / 2) < 1e-6, "The camera should be drawn interpolated"
+        print("  [+] The camera is drawn between its last two simulated positions")
+
+        # The same number of steps gives the same camera, however they are spread over frames
+        per_frame = _high_up_game()
+        _run_frames(per_frame, [SIM_DT_MS] * 12)
+        batched = _high_up_game()
+        _run_frames(batched, [SIM_DT_MS * 4] * 3)
+        assert per_frame.camera.y == batched.camera.y, "Camera motion should not depend on the render rate"
+        print(f"  [+] Camera at y={batched.camera.y:.1f} after 12 steps at 1 or 4 steps per frame")
+
+        print("[+] PASS: Fixed-timestep loop")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_clock_ticks,
+        test_run_with_unthrottled_clock,
+        test_fixed_timestep_loop,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -13,6 +13,16 @@ sys.path.insert(0, 'src')
 
 import pygame
 from game import Game
+from input_source import INPUT_LEFT, INPUT_RIGHT, INPUT_ATTACK
+
+
+class ScriptedInput:
+    """Input source returning whatever buttons the test sets"""
+    def __init__(self):
+        self.buttons = 0
+
+    def read(self):
+        return self.buttons
 
 def test_game_features():
     """Run game for a brief test"""
@@ -30,6 +40,8 @@ def test_game_features():
     try:
         # Create game
         game = Game(level=1, seed=42)
+        scripted_input = ScriptedInput()
+        game.set_input_source(scripted_input)
         
         # Run game for 120 frames
         frame_count = 0
@@ -80,17 +92,15 @@ def test_game_features():
             else:
                 print(f"Frame {frame_count}: Idle")
             
-            # Update game state manually
-            game.player.vel_x = 0
+            # Feed the simulated buttons to the player through its input source
+            buttons = 0
             if current_input.get('RIGHT'):
-                game.player.vel_x = 5
-                game.player.facing_right = True
+                buttons |= INPUT_RIGHT
             elif current_input.get('LEFT'):
-                game.player.vel_x = -5
-                game.player.facing_right = False
-            
+                buttons |= INPUT_LEFT
             if current_input.get('a'):
-                game.player.attack()
+                buttons |= INPUT_ATTACK
+            scripted_input.buttons = buttons
             
             # Update game
             game.update()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for headless simulation mode:
+1. Headless game initializes without fonts, music or drawing, and without
+   changing the process's SDL driver settings
+2. step() advances the simulation without frame limiting
+3. step() stops once the game leaves the playing state
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import os
+import time
+import pygame
+from settings import GAME_STATE_PLAYING, GAME_STATE_GAMEOVER
+from game import Game
+
+
+def test_headless_init():
+    """Test that a headless game skips display-only setup"""
+    print("=" * 60)
+    print("TEST 1: Headless Initialization")
+    print("=" * 60)
+
+    saved = {name: os.environ.get(name) for name in ('SDL_VIDEODRIVER', 'SDL_AUDIODRIVER')}
+    try:
+        assert not pygame.display.get_init(), "The display should not be initialized before the first game"
+        os.environ.pop('SDL_VIDEODRIVER', None)
+        os.environ['SDL_AUDIODRIVER'] = 'disk'
+        game = Game(level=1, seed=42, headless=True)
+        assert pygame.display.get_driver() == 'dummy', "Headless games should use the dummy display"
+        assert 'SDL_VIDEODRIVER' not in os.environ and os.environ['SDL_AUDIODRIVER'] == 'disk', \
+            "The process's driver settings should be put back for games started later"
+        print("  [+] Dummy drivers are used without changing the process's settings")
+
+        assert game.headless, "Game should report headless mode"
+        assert game.font is None and game.small_font is None, "Fonts should not be loaded headless"
+        assert game.victory_music_path is None, "Music should not be loaded headless"
+        assert game.game_state == GAME_STATE_PLAYING, "Game should start in PLAYING state"
+        print("[+] PASS: Headless game initialized")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_headless_step():
+    """Test that step() runs many frames quickly"""
+    print("=" * 60)
+    print("TEST 2: Headless Stepping")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)
+        frames = 600
+        start = time.perf_counter()
+        state = game.step(frames)
+        elapsed = time.perf_counter() - start
+
+        print(f"  [+] Simulated {frames} frames in {elapsed:.3f}s ({frames / elapsed:.0f} frames/s)")
+        # 600 frames is 10 seconds of real-time play; headless must be much faster
+        assert elapsed < 5.0, f"Headless stepping too slow: {elapsed:.3f}s"
+        assert state == game.game_state, "step() should return the current game state"
+        print("[+] PASS: Headless stepping is uncapped")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_step_stops_when_not_playing():
+    """Test that step() stops simulating once the game is over"""
+    print("=" * 60)
+    print("TEST 3: Step Stops On Game Over")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)
+        game.player.health = 0
+        state = game.step(10)
+        assert state == GAME_STATE_GAMEOVER, f"Expected GAMEOVER, got {state}"
+
+        player_pos = game.player.rect.topleft
+        game.step(10)
+        assert game.player.rect.topleft == player_pos, "Simulation should not advance after game over"
+        print("[+] PASS: step() stops when the game is not playing")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_headless_init,
+        test_headless_step,
+        test_step_stops_when_not_playing,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
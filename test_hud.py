@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for HUD caching:
+1. TextCache renders each (font, text, color) once and hands back the same
+   surface after that
+2. The HUD is only re-composed when a displayed value changes, reusing the
+   cached text for values that did not
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import pygame
+from settings import WIDTH, HEIGHT
+from hud import HUD, TextCache
+from game import Game
+
+
+class CountingFont:
+    """Wraps a font, counting the text it rasterizes"""
+
+    def __init__(self, font):
+        self.font = font
+        self.rendered = []
+
+    def render(self, text, antialias, color):
+        self.rendered.append(text)
+        return self.font.render(text, antialias, color)
+
+
+def test_text_cache():
+    """Test that text is rendered once per font, text and color"""
+    print("=" * 60)
+    print("TEST 1: Text Cache")
+    print("=" * 60)
+
+    try:
+        font = CountingFont(pygame.font.Font(None, 24))
+        other_font = CountingFont(pygame.font.Font(None, 36))
+        cache = TextCache(max_entries=4)
+
+        health = cache.render(font, "Health: 100/100", (0, 255, 0))
+        assert cache.render(font, "Health: 100/100", (0, 255, 0)) is health, "Repeats should share a surface"
+        assert font.rendered == ["Health: 100/100"], "Repeats should not render again"
+        print("  [+] Repeated text comes from the cache")
+
+        assert cache.render(font, "Health: 90/100", (0, 255, 0)) is not health, "New text should render"
+        assert cache.render(font, "Health: 100/100", (255, 0, 0)) is not health, "New colors should render"
+        assert cache.render(other_font, "Health: 100/100", (0, 255, 0)) is not health, "New fonts should render"
+        assert len(font.rendered) == 3 and len(other_font.rendered) == 1, "Each new key should render once"
+        print("  [+] Font, text and color are all part of the key")
+
+        cache.render(font, "Level: 1", (0, 0, 0))
+        assert cache.render(font, "Health: 100/100", (0, 255, 0)) is not health, \
+            "A full cache should be cleared before growing"
+        assert len(cache._cache) <= cache.max_entries, "The cache should stay within its limit"
+        print(f"  [+] The cache is cleared past {cache.max_entries} entries")
+
+        print("[+] PASS: Text cache")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_hud_composition():
+    """Test that the HUD surface is only re-composed for changed values"""
+    print("=" * 60)
+    print("TEST 2: HUD Composition")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=42)
+        font = CountingFont(game.small_font)
+        hud = HUD(game.font, font)
+        composed = []
+        compose = hud._compose
+
+        def counted(state):
+            composed.append(state)
+            compose(state)
+        hud._compose = counted
+        screen = pygame.Surface((WIDTH, HEIGHT))
+
+        def draw():
+            screen.fill((255, 255, 255))
+            hud.draw(screen, game)
+            return pygame.image.tobytes(screen, 'RGB')
+
+        first = draw()
+        texts = list(font.rendered)
+        assert len(composed) == 1 and f"Health: {game.player.health}/{game.player.max_health}" in texts, \
+            "The first draw should compose the HUD"
+        for _ in range(10):
+            assert draw() == first, "Unchanged values should draw the same HUD"
+        assert len(composed) == 1 and font.rendered == texts, "Unchanged values should reuse the cached HUD"
+        print(f"  [+] Ten more frames reuse the HUD without rendering text ({len(texts)} texts rendered once)")
+
+        game.player.health -= 10
+        hurt = draw()
+        assert len(composed) == 2 and hurt != first, "New health should re-compose the HUD"
+        assert font.rendered[len(texts):] == [f"Health: {game.player.health}/{game.player.max_health}"], \
+            "Only the changed text should be rendered"
+        print("  [+] Losing health re-renders just the health text")
+
+        game.player.health += 10
+        assert draw() == first and len(composed) == 3, "Going back should re-compose the HUD"
+        assert len(font.rendered) == len(texts) + 1, "Text seen before should come from the cache"
+        print("  [+] Values shown before are re-composed from cached text")
+
+        game.player.armor_active = True
+        game.player.armor_timer = 280
+        draw()
+        game.player.armor_timer = 250
+        draw()
+        assert len(composed) == 4, "Timers should only re-compose when the shown seconds change"
+        game.player.armor_timer = 230
+        draw()
+        assert len(composed) == 5 and font.rendered[-1] == "ARMOR: 3s", "A new second should be shown"
+        game.collected_stickers.add(3)
+        draw()
+        assert len(composed) == 6, "Collecting a sticker should re-compose the HUD"
+        print("  [+] Power-up seconds and stickers re-compose only when they change")
+
+        print("[+] PASS: HUD composition")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    pygame.init()
+    tests = [
+        test_text_cache,
+        test_hud_composition,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
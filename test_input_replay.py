@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for input sources and replays:
+1. Keyboard keys map to button bitmasks
+2. A recorded replay saved to disk plays back to the same state, across
+   levels, and files store keyframes as plain data that is never unpickled
+3. Seeking through keyframes reaches the exact recorded state
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import io
+import os
+import pickle
+import random
+import contextlib
+import struct
+import tempfile
+import zlib
+import pygame
+from input_source import (KeyboardInput, RecordingInput, ReplayInput, Replay, play_replay,
+                          REPLAY_MAGIC, REPLAY_VERSION, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_DOWN, INPUT_ATTACK)
+from game import Game
+
+
+class _Keys(dict):
+    """Stand-in for pygame.key.get_pressed()"""
+    def __getitem__(self, key):
+        return self.get(key, False)
+
+
+class _RandomInput:
+    """Reproducible random button presses"""
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def read(self):
+        return self.rng.randrange(32) & self.rng.randrange(32)
+
+
+class _Payload:
+    """Pickles into a call that would leave a marker file if it were ever unpickled"""
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, 'w'))
+
+
+def test_keyboard_bitmask():
+    """Test that held keys become button bits"""
+    print("=" * 60)
+    print("TEST 1: Keyboard Bitmask")
+    print("=" * 60)
+
+    get_pressed = pygame.key.get_pressed
+    try:
+        keyboard = KeyboardInput()
+        pygame.key.get_pressed = lambda: _Keys({pygame.K_LEFT: True, pygame.K_a: True})
+        assert keyboard.read() == INPUT_LEFT | INPUT_ATTACK, "LEFT + A should map to LEFT | ATTACK"
+        pygame.key.get_pressed = lambda: _Keys({pygame.K_RIGHT: True, pygame.K_SPACE: True, pygame.K_DOWN: True})
+        assert keyboard.read() == INPUT_RIGHT | INPUT_JUMP | INPUT_DOWN, "RIGHT + SPACE + DOWN mask is wrong"
+        pygame.key.get_pressed = lambda: _Keys()
+        assert keyboard.read() == 0, "No keys should map to 0"
+        print("  [+] Keys map to button bits")
+
+        print("[+] PASS: Keyboard bitmask")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        pygame.key.get_pressed = get_pressed
+
+
+def test_replay_round_trip():
+    """Test that a saved replay reproduces the recorded run"""
+    print("=" * 60)
+    print("TEST 2: Replay Round Trip")
+    print("=" * 60)
+
+    path = os.path.join(tempfile.mkdtemp(), 'run.replay')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=42, headless=True)
+            recorder = RecordingInput(game, source=_RandomInput(3), keyframe_interval=200)
+            game.set_input_source(recorder)
+            game.step(500)
+            # Continue to the next level as if SPACE was pressed on the level-complete screen
+            game._advance_level()
+            game.step(500)
+            expected = game.snapshot()
+
+            recorder.replay.save(path)
+            replay = Replay.load(path)
+            played = play_replay(replay)
+
+        assert len(replay) == 1000, f"Expected 1000 recorded steps, got {len(replay)}"
+        assert replay.masks == recorder.replay.masks, "Masks should survive saving"
+        assert played.level == 2, "Playback should follow the recording into the next level"
+        assert played.snapshot() == expected, "Replay should end in exactly the recorded state"
+        size = os.path.getsize(path)
+        print(f"  [+] 1000 steps across 2 levels replayed exactly ({size} bytes, "
+              f"{len(replay.keyframes)} keyframes)")
+
+        assert [k[:3] for k in replay.keyframes] == [k[:3] for k in recorder.replay.keyframes] and \
+            [pickle.loads(k[3]) for k in replay.keyframes] == [pickle.loads(k[3]) for k in recorder.replay.keyframes], \
+            "Keyframes should survive saving"
+        marker = os.path.join(os.path.dirname(path), 'unpickled')
+        for data in (pickle.dumps(_Payload(marker)), zlib.compress(pickle.dumps(_Payload(marker)))):
+            with open(path, 'wb') as f:
+                f.write(REPLAY_MAGIC + struct.pack('<HiiII', REPLAY_VERSION, 42, 1, 0, 1))
+                f.write(struct.pack('<IiiI', 0, 42, 1, len(data)) + data)
+            try:
+                Replay.load(path)
+                assert False, "A pickled keyframe should not load"
+            except ValueError:
+                pass
+            assert not os.path.exists(marker), "Keyframes in replay files should never be unpickled"
+        print("  [+] Keyframes are stored as plain data; pickled keyframes are refused")
+
+        print("[+] PASS: Replay round trip")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_seek():
+    """Test that seeking reaches the recorded state at any step"""
+    print("=" * 60)
+    print("TEST 3: Seeking")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=3, seed=9, headless=True)
+            recorder = RecordingInput(game, source=_RandomInput(5), keyframe_interval=100)
+            game.set_input_source(recorder)
+            recorded = {}
+            for step in range(600):
+                if step in (0, 99, 100, 345, 599):
+                    recorded[step] = game.snapshot()
+                game.update()
+
+            playback = ReplayInput(recorder.replay)
+            other = Game(level=1, seed=1, headless=True, input_source=playback)
+            for step in (345, 100, 599, 0, 99):  # Forwards and backwards
+                playback.seek(other, step)
+                assert other.snapshot() == recorded[step], f"Seeking to step {step} gave a different state"
+        print("  [+] Seeking forwards and backwards matches the recording")
+
+        print("[+] PASS: Seeking")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_keyboard_bitmask,
+        test_replay_round_trip,
+        test_seek,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the level cache:
+1. Levels rebuilt from the memory and disk tiers match freshly generated ones
+2. Cached levels skip generation and are keyed by seed, level and version
+3. The disk tier is opt-in, stores plain JSON (never unpickled) and is pruned
+   to a fixed number of files
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import zlib
+import level_cache
+from level_cache import LevelCache, LEVEL_GENERATOR_VERSION
+from settings import BOSS_LEVEL
+from game import Game
+
+
+def _level_state(game, steps=300):
+    """Describe a level's sprites, then play it for a while with no input"""
+    state = [
+        [tuple(p.rect) for p in game.platforms],
+        [(tuple(e.rect), e.pattern, e.speed, e.health, e.ranged) for e in game.enemies],
+        [(tuple(o.rect), o.sprite_type, o.damage, o.health) for o in game.obstacles],
+        [(tuple(p.rect), p.heal_amount) for p in game.health_pickups],
+        [(type(p).__name__, tuple(p.rect)) for p in game.powerups],
+        [tuple(d.rect) for d in game.doors],
+        [(tuple(t.rect), t.sticker_id) for t in game.treasures],
+        game.rng.random(),
+    ]
+    game.rng.seed(1234)  # Whatever follows must not depend on the tier the level came from
+    game.step(steps)
+    state.append([(tuple(e.rect), e.health) for e in game.enemies])
+    state.append((tuple(game.player.rect), game.player.health, len(game.projectiles)))
+    return state
+
+
+def test_cached_levels_match_generated():
+    """Test that both cache tiers rebuild levels exactly"""
+    print("=" * 60)
+    print("TEST 1: Cached Levels Match Generated Levels")
+    print("=" * 60)
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        for level in (1, 2, BOSS_LEVEL):
+            level_cache._level_cache = LevelCache(cache_dir)
+            generated = _level_state(Game(level=level, seed=42, headless=True))
+            from_memory = _level_state(Game(level=level, seed=42, headless=True))
+            level_cache._level_cache = LevelCache(cache_dir)  # Cold memory, warm disk
+            from_disk = _level_state(Game(level=level, seed=42, headless=True))
+            assert level_cache.get_level_cache().hits == 1, "Level should have been read from disk"
+
+            assert from_memory == generated, f"Level {level} from memory differs from generation"
+            assert from_disk == generated, f"Level {level} from disk differs from generation"
+            print(f"  [+] Level {level}: generated, memory and disk levels match")
+
+        print("[+] PASS: Cached levels match generated levels")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        level_cache._level_cache = None
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def test_cache_keys_and_speed():
+    """Test cache keys and that cached levels skip generation"""
+    print("=" * 60)
+    print("TEST 2: Cache Keys And Instant Levels")
+    print("=" * 60)
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = LevelCache(cache_dir, memory_size=2)
+        level_cache._level_cache = cache
+        game = Game(level=1, seed=5, headless=True)
+        assert cache.misses == 1 and cache.hits == 0, "First init_level should generate"
+        assert cache.get(6, 1) is None and cache.get(5, 2) is None, "Other seeds and levels must miss"
+        assert f'_v{LEVEL_GENERATOR_VERSION}.' in cache._path(5, 1), "Files should be keyed by generator version"
+
+        # Keep generating from scratch by clearing the cache each time
+        runs = 10
+        start = time.perf_counter()
+        for _ in range(runs):
+            cache.clear()
+            game.init_level()
+        generate_ms = (time.perf_counter() - start) / runs * 1000
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            game.init_level()
+        cached_ms = (time.perf_counter() - start) / runs * 1000
+
+        print(f"  [+] init_level: {generate_ms:.2f} ms generated, {cached_ms:.2f} ms cached")
+        assert cached_ms < generate_ms, "Cached levels should initialize faster than generated ones"
+
+        for level in (2, 3):
+            cache.put(5, level, cache.get(5, 1))
+        assert len(cache.memory) == 2, "Memory tier should drop the least recently used level"
+        print("  [+] Memory tier is bounded")
+
+        print("[+] PASS: Cache keys and instant levels")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        level_cache._level_cache = None
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+class _Payload:
+    """Pickles into a call that would leave a marker file if it were ever unpickled"""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, 'w'))
+
+
+def test_disk_tier():
+    """Test that the disk tier is opt-in, plain data and bounded"""
+    print("=" * 60)
+    print("TEST 3: Plain, Bounded, Opt-In Disk Tier")
+    print("=" * 60)
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        assert LevelCache().cache_dir is None, "Levels should only be cached in memory by default"
+        level_cache._level_cache = None
+        cwd = os.getcwd()
+        os.chdir(cache_dir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                Game(level=1, seed=5, headless=True)
+        finally:
+            os.chdir(cwd)
+            level_cache._level_cache = None
+        assert os.listdir(cache_dir) == [], "The default cache should not write files"
+        print("  [+] Nothing is written to disk unless a cache directory is set")
+
+        cache = LevelCache(cache_dir, max_files=3)
+        level_cache._level_cache = cache
+        game = Game(level=1, seed=5, headless=True)
+        with open(cache._path(5, 1), 'rb') as f:
+            stored = json.loads(zlib.decompress(f.read()))
+        assert stored['platforms'] == [list(p.rect) for p in game.platforms], "Files should hold plain JSON"
+        assert LevelCache(cache_dir).get(5, 1) == cache.get(5, 1), "JSON should read back as the same description"
+        print("  [+] Levels are stored as compressed JSON")
+
+        marker = os.path.join(cache_dir, 'unpickled')
+        with open(cache._path(6, 1), 'wb') as f:
+            f.write(zlib.compress(pickle.dumps(_Payload(marker))))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert LevelCache(cache_dir).get(6, 1) is None, "A pickled file should not be read as a level"
+        assert not os.path.exists(marker), "Cached files should never be unpickled"
+        assert "Ignoring unreadable" in output.getvalue(), "Unreadable files should be reported"
+        print("  [+] A pickled file in the cache directory is ignored, not unpickled")
+
+        description = cache.get(5, 1)
+        os.utime(cache._path(5, 1), (1, 1))
+        os.utime(cache._path(6, 1), (2, 2))
+        for seed in (10, 11, 12):
+            cache.put(seed, 1, description)
+            os.utime(cache._path(seed, 1), (seed, seed))  # Ordered by last use
+        assert LevelCache(cache_dir).get(10, 1) == description, "Level 10 should be read from disk"
+        cache.put(13, 1, description)
+        files = sorted(name for name in os.listdir(cache_dir) if name.endswith('.lvl'))
+        assert files == sorted(os.path.basename(cache._path(seed, 1)) for seed in (10, 12, 13)), \
+            "The least recently used files should be removed first"
+        print(f"  [+] The directory is pruned to {cache.max_files} files")
+
+        print("[+] PASS: Plain, bounded, opt-in disk tier")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        level_cache._level_cache = None
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_cached_levels_match_generated,
+        test_cache_keys_and_speed,
+        test_disk_tier,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the pre-rendered level canvas:
+1. Blitting the visible part of the canvas draws the same pixels as blitting
+   every visible platform one by one
+2. A new canvas is built for each level (advancing, restarting and lazily
+   for headless games) and matches that level's platforms
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import pygame
+from settings import WIDTH, HEIGHT, LEVEL_HEIGHT
+from game import Game
+
+BACKGROUND = (120, 70, 140)
+
+
+def _draw_canvas(game, camera_x, camera_y):
+    """Draw the platforms the way draw_game does, from the level canvas"""
+    game.camera.x, game.camera.y = camera_x, camera_y
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    screen.fill(BACKGROUND)
+    view_rect = pygame.Rect(int(game.camera.x), int(game.camera.y), WIDTH, HEIGHT)
+    screen.blit(game.level_canvas, (0, 0), view_rect)
+    return pygame.image.tobytes(screen, 'RGB')
+
+
+def _draw_platforms(game, camera_x, camera_y):
+    """Draw the platforms the way draw_game did before the canvas, one blit each"""
+    game.camera.x, game.camera.y = camera_x, camera_y
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    screen.fill(BACKGROUND)
+    for platform in game.platforms:
+        if game.camera.is_visible(platform.rect):
+            screen.blit(platform.image, game.camera.apply_offset(platform.rect))
+    return pygame.image.tobytes(screen, 'RGB')
+
+
+def _matches_platforms(game):
+    """Whether the canvas draws like the platforms at views all down the level"""
+    views = [(0, 0), (0, HEIGHT - 300), (0, 1234.6), (0, LEVEL_HEIGHT - HEIGHT)]
+    return all(_draw_canvas(game, x, y) == _draw_platforms(game, x, y) for x, y in views)
+
+
+def test_canvas_matches_platforms():
+    """Test that the canvas blit matches drawing platforms one by one"""
+    print("=" * 60)
+    print("TEST 1: Canvas Matches Per-Platform Drawing")
+    print("=" * 60)
+
+    try:
+        for level, seed in ((1, 42), (3, 7), (5, 11)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                game = Game(level=level, seed=seed)
+            assert game.level_canvas is not None, "The canvas should be built with the level"
+            assert game.level_canvas.get_size() == (WIDTH, LEVEL_HEIGHT), "The canvas should cover the level"
+            assert _matches_platforms(game), f"Level {level} should draw the same pixels from the canvas"
+            print(f"  [+] Level {level}: {len(game.platforms)} platforms drawn pixel-for-pixel the same")
+
+        print("[+] PASS: Canvas matches per-platform drawing")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_canvas_rebuilt_per_level():
+    """Test that every level gets its own canvas"""
+    print("=" * 60)
+    print("TEST 2: Canvas Rebuilt Per Level")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=42)
+            first = game.level_canvas
+            game._advance_level()
+        assert game.level == 2, "The game should be on level 2"
+        assert game.level_canvas is not first, "A new level should get a new canvas"
+        assert _matches_platforms(game), "The new canvas should show the new level's platforms"
+        new_view = _draw_canvas(game, 0, 0)
+        game.level_canvas = first
+        assert _draw_canvas(game, 0, 0) != new_view, "Level 1's canvas should not show level 2"
+        game.level_canvas = None
+        game._draw_static_scene()
+        assert _draw_canvas(game, 0, 0) == new_view, "A dropped canvas should be rebuilt from the platforms"
+        print("  [+] Advancing a level builds a canvas of the new platforms")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            second = game.level_canvas
+            game.restart()
+        assert game.level == 1 and game.level_canvas is not second, "Restarting should build a new canvas"
+        assert _matches_platforms(game), "The restarted canvas should show level 1's platforms"
+        print("  [+] Restarting builds a canvas of level 1's platforms")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            headless = Game(level=2, seed=42, headless=True)
+        assert headless.level_canvas is None, "Headless games should not build a canvas up front"
+        headless.screen = pygame.Surface((WIDTH, HEIGHT))
+        headless._draw_static_scene()
+        assert headless.level_canvas is not None and _matches_platforms(headless), \
+            "The first draw should build the canvas"
+        print("  [+] Headless games build the canvas on first draw")
+
+        print("[+] PASS: Canvas rebuilt per level")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_canvas_matches_platforms,
+        test_canvas_rebuilt_per_level,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for prefetching the next level:
+1. The next level is built on a worker thread and swapped in on SPACE
+2. A prefetched level matches one built synchronously
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import threading
+import pygame
+from settings import GAME_STATE_PLAYING, GAME_STATE_LEVEL_COMPLETE, BOSS_LEVEL
+from game import Game
+
+
+def _press_space(game):
+    """Continue from the level-complete screen"""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    game.handle_events()
+
+
+def _level_summary(game):
+    """Describe the parts of a level that generation decides"""
+    return (
+        game.level,
+        [tuple(p.rect) for p in game.platforms],
+        [(tuple(e.rect), e.pattern, e.health) for e in game.enemies],
+        [(tuple(o.rect), o.sprite_type) for o in game.obstacles],
+        [tuple(p.rect) for p in game.health_pickups],
+        [(type(p).__name__, tuple(p.rect)) for p in game.powerups],
+        [tuple(d.rect) for d in game.doors],
+        [t.sticker_id for t in game.treasures],
+        tuple(game.player.rect),
+    )
+
+
+def test_prefetch_on_worker_thread():
+    """Test that levels are built in the background and swapped in on SPACE"""
+    print("=" * 60)
+    print("TEST 1: Next Level Built On A Worker Thread")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42)
+        built_on = []
+        build_level = game.build_level
+
+        def recording_build_level(level):
+            built_on.append((level, threading.current_thread() is threading.main_thread()))
+            return build_level(level)
+        game.build_level = recording_build_level
+
+        for expected_level in (2, 3, BOSS_LEVEL):
+            game.game_state = GAME_STATE_LEVEL_COMPLETE
+            game._prefetch_next_level()
+            game._prefetch_next_level()  # Redrawing the screen must not start a second build
+            game._prefetch[1].result()   # Let the worker finish, as it would while the screen is shown
+            _press_space(game)
+
+            assert game.game_state == GAME_STATE_PLAYING, "SPACE should resume play"
+            assert game.level == expected_level, f"Expected level {expected_level}, got {game.level}"
+            assert built_on[-1] == (expected_level, False), "Level should have been built on the worker"
+            print(f"  [+] Level {expected_level} was prefetched and swapped in")
+
+        assert len(built_on) == 3, "Each level should be built exactly once"
+        assert game._prefetch is None, "Prefetch should be consumed by the transition"
+        game._prefetch_executor.shutdown()
+
+        print("[+] PASS: Next level built on a worker thread")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_prefetched_level_matches():
+    """Test that a prefetched level is the same as one built on the spot"""
+    print("=" * 60)
+    print("TEST 2: Prefetched Level Matches Synchronous Build")
+    print("=" * 60)
+
+    try:
+        prefetched = Game(level=1, seed=7)
+        prefetched.game_state = GAME_STATE_LEVEL_COMPLETE
+        prefetched._prefetch_next_level()
+        _press_space(prefetched)  # May wait for the worker to finish
+        prefetched._prefetch_executor.shutdown()
+
+        direct = Game(level=1, seed=7)
+        direct.game_state = GAME_STATE_LEVEL_COMPLETE
+        _press_space(direct)
+
+        assert _level_summary(prefetched) == _level_summary(direct), "Prefetched level differs"
+        assert prefetched.level_canvas is not None and prefetched.underground_layer is not None, \
+            "Level layers should be pre-rendered by the worker"
+        print("  [+] Prefetched and synchronously built levels match")
+
+        print("[+] PASS: Prefetched level matches")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_prefetch_on_worker_thread,
+        test_prefetched_level_matches,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
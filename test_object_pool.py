@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for object pooling:
+1. ObjectPool recycles released objects and reports hit/miss metrics
+2. Player attacks and projectiles are served from preallocated pools
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+from object_pool import ObjectPool
+from projectiles import ProjectileSystem
+from settings import GAME_STATE_PLAYING
+from game import Game
+
+
+class _Pooled:
+    created = 0
+
+    def __init__(self):
+        _Pooled.created += 1
+        self.pool = None
+        self.value = None
+
+    def reset(self, value):
+        self.value = value
+
+
+def test_pool_recycles_objects():
+    """Test acquire/release reuse and metrics"""
+    print("=" * 60)
+    print("TEST 1: Pool Recycles Objects")
+    print("=" * 60)
+
+    try:
+        pool = ObjectPool(_Pooled, capacity=2)
+        assert _Pooled.created == 2 and len(pool) == 2, "Pool should preallocate its capacity"
+
+        a = pool.acquire(1)
+        b = pool.acquire(2)
+        c = pool.acquire(3)
+        assert (a.value, b.value, c.value) == (1, 2, 3), "Acquire should reset objects"
+        assert pool.hits == 2 and pool.misses == 1, "Third acquire should miss"
+
+        pool.release(a)
+        pool.release(a)  # Releasing twice must not hand the object out twice
+        assert len(pool) == 1, "Double release should be ignored"
+        assert pool.acquire(4) is a, "Released objects should be reused"
+        assert pool.hits == 3 and abs(pool.hit_rate - 0.75) < 1e-9, "Hit rate should be 3/4"
+        print("  [+] Objects are reused and metrics are tracked")
+
+        print("[+] PASS: Pool recycles objects")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_game_objects_are_pooled():
+    """Test that attacks and projectiles come from preallocated pools"""
+    print("=" * 60)
+    print("TEST 2: Attacks And Projectiles Are Pooled")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)
+        player = game.player
+        swings = 0
+        for _ in range(600):
+            if player.attack_cooldown <= 0:
+                player.attack()
+                swings += 1
+                attack = next(iter(player.attacks))
+                assert attack.lifetime == 10 and not attack.hit_enemies, "Recycled attack was not reset"
+            game.step(1)
+            if game.game_state != GAME_STATE_PLAYING:
+                break
+
+        pool = player.attack_pool
+        print(f"  [+] {swings} swings: {pool.hits} pool hits, {pool.misses} misses")
+        assert swings > 10, "Expected many swings"
+        assert pool.misses == 0, "Attacks should never need a new allocation"
+
+        system = ProjectileSystem(capacity=8)
+        for i in range(10):
+            system.spawn(100, 100, vx=1)
+        assert system.hits == 9 and system.misses == 1, "Only the spawn that grew the arrays should miss"
+        assert system.capacity >= 10, "Arrays should grow when the pool is exhausted"
+        print("  [+] Projectile slots report pool hits and growth")
+
+        print("[+] PASS: Game objects are pooled")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_pool_recycles_objects,
+        test_game_objects_are_pooled,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the parallax background engine:
+1. Background images and pre-tiled surfaces are built once per size and
+   shared between layers
+2. Layers scroll the same as blitting the image tile by tile, including for
+   negative camera positions and ones that wrap past the tile height
+3. Layers hidden behind an opaque nearer layer are not drawn
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import os
+import tempfile
+import pygame
+from settings import WIDTH, HEIGHT
+from parallax import ParallaxLayer, draw_layers, load_background_image, _get_tiled_surface
+
+
+def _striped_image(width, height):
+    """An image whose every row has its own color, so any vertical offset shows"""
+    image = pygame.Surface((width, height))
+    for y in range(height):
+        image.fill(((y * 7) % 256, (y * 13) % 256, y % 256), (0, y, width, 1))
+    return image
+
+
+def _draw_tiles(image, depth, camera_y):
+    """Draw a layer the way the game did before pre-tiling: one blit per visible tile"""
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    tile_height = image.get_height()
+    y = (-int(camera_y * depth) % tile_height) - tile_height
+    while y < HEIGHT:
+        surface.blit(image, (0, y))
+        y += tile_height
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def test_surface_caches():
+    """Test that images and tiled surfaces are reused for repeated sizes"""
+    print("=" * 60)
+    print("TEST 1: Image and Tiled Surface Caches")
+    print("=" * 60)
+
+    try:
+        path = os.path.join(tempfile.mkdtemp(), 'background.png')
+        pygame.image.save(_striped_image(64, 48), path)
+        image = load_background_image(path)
+        assert image.get_size() == (WIDTH, HEIGHT), "Backgrounds should be scaled to the screen"
+        assert load_background_image(path) is image, "A second load should come from the cache"
+        small = load_background_image(path, 400, 300)
+        assert small is not image and small.get_size() == (400, 300), "Other sizes should be scaled separately"
+        assert load_background_image(path, 400, 300) is small, "Each size should be cached"
+        print("  [+] Background images are loaded and scaled once per size")
+
+        near, far = ParallaxLayer(0.5, image), ParallaxLayer(0.2, image)
+        assert near.surface is far.surface, "Layers of one image should share the tiled surface"
+        assert _get_tiled_surface(image, HEIGHT) is near.surface, "Repeated sizes should hit the cache"
+        assert near.surface.get_height() >= 2 * HEIGHT, "A window starting anywhere in a tile should fit"
+        short = _get_tiled_surface(image, 200)
+        assert short is not near.surface, "Other viewport heights should be tiled separately"
+        assert _get_tiled_surface(image, 200) is short, "Each viewport height should be cached"
+        print("  [+] Tiled surfaces are built once per image and viewport height")
+
+        print("[+] PASS: Image and tiled surface caches")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_tiling_offsets():
+    """Test that scrolling matches blitting the tiles one by one"""
+    print("=" * 60)
+    print("TEST 2: Tiling Offsets")
+    print("=" * 60)
+
+    try:
+        screen = pygame.Surface((WIDTH, HEIGHT))
+        # A screen-sized tile like the game's, and a short one that needs several copies
+        for image in (_striped_image(WIDTH, HEIGHT), _striped_image(WIDTH, 250)):
+            tile_height = image.get_height()
+            for depth in (0.2, 0.3, 0.5):
+                layer = ParallaxLayer(depth, image)
+                wrap = tile_height / depth
+                # Negative, exactly on a tile, wrapped once or many times, and fractional
+                for camera_y in (-1, -123.7, -wrap, 0, 1, wrap, wrap + 17, 5 * wrap - 3, 1800.5):
+                    layer.draw(screen, camera_y)
+                    assert pygame.image.tobytes(screen, 'RGB') == _draw_tiles(image, depth, camera_y), \
+                        f"Tile {tile_height}px at depth {depth} should scroll like tiles at camera y {camera_y}"
+            print(f"  [+] {tile_height}px tiles scroll like tile-by-tile blits at every camera position")
+
+        print("[+] PASS: Tiling offsets")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_hidden_layers_skipped():
+    """Test that only the nearest opaque layer and what is in front of it are drawn"""
+    print("=" * 60)
+    print("TEST 3: Hidden Layers Skipped")
+    print("=" * 60)
+
+    try:
+        drawn = []
+
+        class CountedLayer(ParallaxLayer):
+            def draw(self, surface, camera_y):
+                drawn.append(self)
+                super().draw(surface, camera_y)
+
+        see_through = _striped_image(WIDTH, HEIGHT).convert_alpha()
+        sky = CountedLayer(0.1, color=(30, 50, 100))
+        hills = CountedLayer(0.2, _striped_image(WIDTH, HEIGHT))
+        mist = CountedLayer(0.5, see_through)
+        assert hills.opaque and not mist.opaque, "Only images without alpha should be opaque"
+
+        screen = pygame.Surface((WIDTH, HEIGHT))
+        assert draw_layers(screen, [sky, hills, mist], 100), "An opaque layer should cover the screen"
+        assert drawn == [hills, mist], "Layers behind the nearest opaque one should be skipped"
+        drawn.clear()
+        assert not draw_layers(screen, [mist], 100) and drawn == [mist], \
+            "See-through layers alone should not cover the screen"
+        print("  [+] Only the nearest opaque layer and the layers in front of it are drawn")
+
+        print("[+] PASS: Hidden layers skipped")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    tests = [
+        test_surface_caches,
+        test_tiling_offsets,
+        test_hidden_layers_skipped,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for swept platform landing:
+1. Fast-falling entities land on thin platforms instead of tunneling
+2. The first platform crossed wins, and rising or dropping through never lands
+3. A thin platform above a thick one is landed on even when the fall ends
+   inside the thick one, and crossings follow the rect's sideways motion
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import pygame
+from game import Game
+from platform_index import PlatformIndex
+from physics import sweep_landing
+
+
+def _platform(x, y, width, height):
+    platform = pygame.sprite.Sprite()
+    platform.rect = pygame.Rect(x, y, width, height)
+    return platform
+
+
+def test_no_tunneling_through_thin_platforms():
+    """Test that entities falling faster than a platform is thick still land"""
+    print("=" * 60)
+    print("TEST 1: No Tunneling Through Thin Platforms")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)  # Sets up pygame for input
+        thin = _platform(300, 300, 200, 2)
+        index = PlatformIndex([thin])
+
+        player = game.player
+        player.rect.bottomleft = (350, 290)
+        player.vel_y = 100  # Ends the step entirely below the platform
+        player.update(index)
+        assert player.rect.bottom == thin.rect.top, f"Player fell through (bottom={player.rect.bottom})"
+        assert player.on_ground and player.vel_y == 0, "Player should be standing on the platform"
+        print("  [+] Player falling 100 px/step lands on a 2 px platform")
+
+        # Falls longer than the entity is tall used to skip the platform entirely
+        rect = pygame.Rect(350, 400, 40, 40)
+        assert not rect.colliderect(thin.rect.inflate(0, 2)), "Scenario should be a tunneling case"
+        assert sweep_landing(index, rect, 280, inflate=2) is thin, "Swept test should find the platform"
+        print("  [+] Swept test catches a fall that skips the platform")
+
+        print("[+] PASS: Thin platforms stop fast falls")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_landing_rules():
+    """Test which platform is landed on and when landing is skipped"""
+    print("=" * 60)
+    print("TEST 2: Landing Rules")
+    print("=" * 60)
+
+    try:
+        upper = _platform(0, 200, 400, 4)
+        lower = _platform(0, 260, 400, 4)
+        index = PlatformIndex([lower, upper])
+
+        rect = pygame.Rect(100, 300, 50, 70)  # Moved down from bottom=150 to bottom=370
+        assert sweep_landing(index, rect, 150) is upper, "First platform crossed should be landed on"
+        assert rect.bottom == upper.rect.top, "Rect should be snapped onto the platform"
+        print("  [+] First top edge crossed is used")
+
+        rect = pygame.Rect(100, 300, 50, 70)
+        assert sweep_landing(index, rect, 400) is None, "Moving up should never land"
+        print("  [+] Rising entities pass through")
+
+        game = Game(level=1, seed=42, headless=True)
+        player = game.player
+        player.rect.bottomleft = (100, 190)
+        player.vel_y = 60
+        player.falling_through = True
+        player.fall_through_timer = 5
+        player.update(index)
+        assert not player.on_ground, "Dropping through should skip platforms"
+        print("  [+] Dropping through platforms still works")
+
+        print("[+] PASS: Landing rules hold")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_first_crossing_before_overlap():
+    """Test that crossing a top edge beats overlapping a platform further down"""
+    print("=" * 60)
+    print("TEST 3: First Crossing Before Overlap")
+    print("=" * 60)
+
+    try:
+        thin = _platform(300, 500, 200, 4)
+        thick = _platform(300, 560, 200, 20)
+        for order in ([thin, thick], [thick, thin]):
+            index = PlatformIndex(order)
+            rect = pygame.Rect(350, 495, 50, 70)  # Feet moved from 495 to 565, ending inside the thick one
+            assert rect.colliderect(thick.rect), "Scenario should overlap the thick platform"
+            assert sweep_landing(index, rect, 495, inflate=2) is thin, "The thin platform is crossed first"
+            assert rect.bottom == thin.rect.top, "Rect should be snapped onto the thin platform"
+        print("  [+] A fall ending inside a thick platform lands on the thin one above it")
+
+        game = Game(level=1, seed=42, headless=True)
+        player = game.player
+        player.rect.bottomleft = (350, 495)
+        player.on_ground = False
+        player.vel_y = 70
+        player.update(PlatformIndex([thick, thin]))
+        assert player.rect.bottom == thin.rect.top and player.on_ground, "The player should stop on the thin one"
+        print("  [+] The player lands on the thin platform too")
+
+        # Moving right while falling: over the ledge when the feet reach its
+        # top, past its right edge by the end of the step
+        ledge = _platform(300, 500, 100, 4)
+        index = PlatformIndex([ledge])
+        rect = pygame.Rect(410, 445, 50, 70)  # From left=380, bottom=490
+        assert sweep_landing(index, rect, 490, prev_left=380) is ledge, "The ledge was under the feet on the way"
+        rect = pygame.Rect(410, 445, 50, 70)
+        assert sweep_landing(index, rect, 490) is None, "A straight drop at the end position misses it"
+        rect = pygame.Rect(460, 445, 50, 70)  # From left=410: never over the ledge
+        assert sweep_landing(index, rect, 490, prev_left=410) is None, "Falls beside the ledge should miss it"
+        print("  [+] Crossings are tested along the rect's sideways path")
+
+        rect = pygame.Rect(350, 431, 50, 70)  # Resting on the ledge, pulled down 1px by gravity
+        assert sweep_landing(index, rect, 500, inflate=2) is ledge, "Resting entities should stay on the ledge"
+        rect = pygame.Rect(402, 431, 50, 70)  # Just walked off the edge
+        assert sweep_landing(index, rect, 500, inflate=2, prev_left=398) is None, "Walking off should fall"
+        print("  [+] Resting on and walking off a platform are unchanged")
+
+        print("[+] PASS: First crossing before overlap")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_no_tunneling_through_thin_platforms,
+        test_landing_rules,
+        test_first_crossing_before_overlap,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
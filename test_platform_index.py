@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the static platform index:
+1. Ground queries match a linear scan over every platform
+2. The topmost platform and level wiring match the original behavior
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import random
+import pygame
+from platform_index import PlatformIndex
+from game import Game
+
+
+def _linear_first_colliding(platforms, rect, inflate):
+    for platform in platforms:
+        if rect.colliderect(platform.rect.inflate(0, inflate)):
+            return platform
+    return None
+
+
+def test_first_colliding_matches_scan():
+    """Test that index queries agree with scanning every platform in order"""
+    print("=" * 60)
+    print("TEST 1: Ground Queries Match Linear Scan")
+    print("=" * 60)
+
+    try:
+        rng = random.Random(99)
+        platforms = []
+        for _ in range(2000):
+            platform = pygame.sprite.Sprite()
+            platform.rect = pygame.Rect(rng.randint(-20, 780), rng.randint(0, 20000),
+                                        rng.randint(20, 400), rng.choice([20, 40]))
+            platforms.append(platform)
+        index = PlatformIndex(platforms)
+        assert len(index) == 2000 and list(index) == platforms, "Index should keep the original order"
+
+        for _ in range(2000):
+            rect = pygame.Rect(rng.randint(-50, 800), rng.randint(-50, 20050), 50, 70)
+            for inflate in (0, 2):
+                expected = _linear_first_colliding(platforms, rect, inflate)
+                assert index.first_colliding(rect, inflate) is expected, \
+                    f"Query {rect} (inflate={inflate}) differs from linear scan"
+
+        print("  [+] 4000 queries over 2000 platforms matched the linear scan")
+        print("[+] PASS: Ground queries match linear scan")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_topmost_and_level_wiring():
+    """Test the topmost platform query and the index built for each level"""
+    print("=" * 60)
+    print("TEST 2: Topmost Platform And Level Index")
+    print("=" * 60)
+
+    try:
+        for level in (1, 2, 3, 4):
+            game = Game(level=level, seed=42, headless=True)
+            expected = min(game.platforms, key=lambda p: p.rect.y)
+            assert game.platform_index.topmost() is expected, f"Wrong topmost platform on level {level}"
+            assert len(game.platform_index) == len(game.platforms), "Index should cover every platform"
+            for door in game.doors:
+                assert door.rect.bottom == expected.rect.top, "Door should sit on the topmost platform"
+            print(f"  [+] Level {level}: door sits on the topmost platform")
+
+        # Entities still accept a plain platform group
+        game = Game(level=4, seed=42, headless=True)
+        game.boss.update(game.player, game.platforms, None)
+        print("[+] PASS: Topmost platform and level index are correct")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_first_colliding_matches_scan,
+        test_topmost_and_level_wiring,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the NumPy projectile system:
+1. Vectorized projectiles move, cull and hit exactly like Projectile sprites
+2. Thousands of projectiles update, collide and draw within a frame budget
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import random
+import time
+import pygame
+from game import Game
+from enemies import Projectile
+from projectiles import ProjectileSystem
+
+
+def test_matches_projectile_sprites():
+    """Test that the arrays reproduce the sprite-based projectiles"""
+    print("=" * 60)
+    print("TEST 1: Matches Projectile Sprites")
+    print("=" * 60)
+
+    try:
+        rng = random.Random(7)
+        system = ProjectileSystem(capacity=4)  # Forces the arrays to grow
+        sprites = pygame.sprite.Group()
+        target = pygame.Rect(300, 250, 50, 70)
+
+        for step in range(200):
+            for _ in range(rng.randint(0, 3)):
+                x, y = rng.randint(0, 800), rng.randint(0, 600)
+                vx, vy = rng.uniform(-9, 9), rng.uniform(-9, 9)
+                dmg = rng.randint(5, 15)
+                system.spawn(x, y, vx=vx, vy=vy, dmg=dmg)
+                sprites.add(Projectile(x, y, vx=vx, vy=vy, dmg=dmg))
+
+            system.update()
+            sprites.update()
+
+            hits = system.collide_rect(target)
+            sprite_hits = [p for p in sprites if p.rect.colliderect(target)]
+            assert system.damage[hits].tolist() == [p.damage for p in sprite_hits], f"Hits differ at step {step}"
+            system.kill(hits)
+            for p in sprite_hits:
+                p.kill()
+
+            positions = list(zip(system.x[:len(system)].tolist(), system.y[:len(system)].tolist()))
+            assert positions == [p.rect.topleft for p in sprites], f"Positions differ at step {step}"
+
+        print(f"  [+] 200 steps matched ({len(system)} projectiles alive at the end)")
+        print("[+] PASS: Projectile arrays match sprites")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_thousands_of_projectiles():
+    """Test a bullet-hell load stays within a 60 FPS frame budget"""
+    print("=" * 60)
+    print("TEST 2: Thousands Of Projectiles")
+    print("=" * 60)
+
+    try:
+        game = Game(level=4, seed=42)
+        game.update()
+        for _ in range(120):  # Let the camera settle on the player
+            game.camera.update(game.player.rect)
+        rng = random.Random(3)
+        for _ in range(3000):
+            game.projectiles.spawn(rng.randint(0, 800), rng.randint(0, 600),
+                                   vx=rng.choice([-1, 1]) * rng.uniform(0.1, 0.5), vy=rng.uniform(-0.5, 0.5))
+        game.player.armor_active = True
+
+        frames = 30
+        drawn = 0
+        start = time.perf_counter()
+        for _ in range(frames):
+            game.projectiles.update()
+            game.projectiles.collide_rect(game.player.rect)
+            drawn = len(game.projectiles.draw(game.screen, game.camera))
+        per_frame = (time.perf_counter() - start) / frames * 1000
+
+        print(f"  [+] {len(game.projectiles)} projectiles ({drawn} on screen): {per_frame:.2f} ms per frame")
+        assert len(game.projectiles) > 2000, "Slow projectiles should still be alive"
+        assert drawn > 1000, "Projectiles in view should be drawn"
+        assert per_frame < 1000 / 60, "Projectiles alone should fit in a 60 FPS frame"
+        print("[+] PASS: Thousands of projectiles fit in a frame")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_matches_projectile_sprites,
+        test_thousands_of_projectiles,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for terrain reachability:
+1. The jump envelope matches the player's own physics, including landing on
+   a platform the head reaches and walking off edges
+2. The reachability graph finds platforms (and the door's platform) that
+   cannot be reached, in microseconds per level
+3. Generated terrain is always reachable; layouts that are not get repaired
+   without changing the rest of the level, and layouts that cannot be
+   repaired are rejected
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import random
+import time
+import pygame
+from platform import Platform
+from platform_index import PlatformIndex
+from player import Player
+from input_source import ActionInput, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP
+import game as game_module
+from level_cache import LevelCache
+from utils import generate_terrain
+from reachability import can_reach, reachability_graph, unreachable_platforms, repair_platform
+
+
+def _player_lands(here, there, goal, jump):
+    """
+    Play a move with the real player: stand on one platform and jump (or walk
+    off an edge) steering for a spot over the other.
+
+    Args:
+        here: Platform the player starts on
+        there: Platform to get onto
+        goal: rect.left to steer for
+        jump: True to jump, False to walk off the edge towards the goal
+
+    Returns:
+        True if the player lands on the other platform
+    """
+    platforms = PlatformIndex([here, there])
+    with contextlib.redirect_stdout(io.StringIO()):
+        player = Player(0, 0)
+    player.input_source = ActionInput()
+    if jump:
+        player.rect.left = min(max(goal, here.rect.left - player.rect.width + 1), here.rect.right - 1)
+    elif goal >= here.rect.right:
+        player.rect.left = here.rect.right - 5
+    else:
+        player.rect.left = here.rect.left - player.rect.width + 5
+    player.rect.bottom = here.rect.top
+    player.on_ground = True
+    for frame in range(200):
+        buttons = INPUT_JUMP if jump and frame == 0 else 0
+        if player.rect.left < goal:
+            buttons |= INPUT_RIGHT
+        elif player.rect.left > goal:
+            buttons |= INPUT_LEFT
+        player.input_source.buttons = buttons
+        player.update(platforms)
+        if player.on_ground and player.rect.bottom != here.rect.top:
+            return player.rect.bottom == there.rect.top
+    return False
+
+
+def test_jump_envelope():
+    """Test that the envelope agrees with moves played by the real player"""
+    print("=" * 60)
+    print("TEST 1: Jump Envelope")
+    print("=" * 60)
+
+    try:
+        ledge = Platform(100, 450, 200, 20)
+        # Straight up: the feet rise about 148px, but the head reaches higher
+        heights = [rise for rise in range(100, 300, 2)
+                   if can_reach(ledge.rect, Platform(100, 450 - rise, 200, 20).rect)]
+        played = [rise for rise in range(100, 300, 2)
+                  if _player_lands(ledge, Platform(100, 450 - rise, 200, 20), 150, True)]
+        assert heights == played, "Jump height should match the player's"
+        assert 148 < max(heights) <= 148 + 70 + 20, "The head should reach past the top of the jump"
+        print(f"  [+] Platforms up to {max(heights)}px overhead are in reach")
+
+        # Sideways, on the way up and on the way down
+        rng = random.Random(1)
+        checked = 0
+        for _ in range(25):
+            width = rng.randint(100, 250)
+            x = rng.randint(50, 750 - width)
+            # Up to 230px above the ledge, or down towards the ground
+            y = rng.choice((450 - rng.randint(20, 230), 450 + rng.randint(20, 90)))
+            there = Platform(x, y, width, 20)
+            jump = y < 450
+            goals = range(max(there.rect.left - 49, 0), min(there.rect.right - 1, 750) + 1)
+            played = any(_player_lands(ledge, there, goal, jump) for goal in goals)
+            assert can_reach(ledge.rect, there.rect) == played, \
+                f"Reach to {tuple(there.rect)} should match the player's"
+            checked += 1
+        print(f"  [+] {checked} random jumps and drops agree with the player")
+
+        print("[+] PASS: Jump envelope")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_reachability_graph():
+    """Test finding unreachable platforms in hand-made layouts"""
+    print("=" * 60)
+    print("TEST 2: Reachability Graph")
+    print("=" * 60)
+
+    try:
+        ground = pygame.Rect(0, 560, 800, 40)
+        low = pygame.Rect(300, 420, 200, 20)
+        high = pygame.Rect(350, 260, 150, 20)
+        graph = reachability_graph([ground, low, high])
+        assert graph == [[1], [0, 2], [0, 1]], "Each step of the ladder should lead to the next"
+        assert unreachable_platforms([ground, low, high]) == [], "The ladder should be climbable"
+        print("  [+] A ladder of platforms is climbable, and every platform leads back down")
+
+        # Too high above the ladder, and too far to the side of it
+        too_high = pygame.Rect(350, 10, 150, 20)
+        aside = pygame.Rect(700, 60, 100, 20)
+        assert unreachable_platforms([ground, low, high, too_high, aside]) == [3, 4], \
+            "Platforms out of jumping range should be found"
+        # The door stands on the topmost platform
+        assert unreachable_platforms([ground, low, high, pygame.Rect(400, 100, 150, 20)]) == [], \
+            "The door's platform is reachable from the top of the ladder"
+        print("  [+] Platforms out of reach (and so the door on them) are found")
+
+        rects = [p.rect for p in generate_terrain(seed=7, difficulty=3)]
+        repeats = 200
+        start = time.perf_counter()
+        for _ in range(repeats):
+            unreachable_platforms(rects)
+        per_level = (time.perf_counter() - start) / repeats
+        print(f"  [+] {len(rects)} platforms checked in {1e6 * per_level:.0f}us")
+        assert per_level < 0.001, "Checking a level should take well under a millisecond"
+
+        print("[+] PASS: Reachability graph")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_generation_repair():
+    """Test that generated terrain is reachable and bad layouts are repaired"""
+    print("=" * 60)
+    print("TEST 3: Generation Repair")
+    print("=" * 60)
+
+    try:
+        for difficulty in (1, 2, 3):
+            for seed in range(300):
+                rects = [p.rect for p in generate_terrain(seed, difficulty, repair=False)]
+                assert unreachable_platforms(rects) == [], f"Seed {seed} should be reachable"
+        print("  [+] 900 generated levels are reachable without repairs")
+
+        ground = pygame.Rect(0, 560, 800, 40)
+        ledge = pygame.Rect(600, 300, 150, 20)
+        moved = repair_platform([ground, ledge], pygame.Rect(100, 120, 150, 20))
+        assert can_reach(ledge, moved) and moved.size == (150, 20), "The platform should be moved into reach"
+        assert moved.top == 120, "A platform that is high enough should only be slid sideways"
+        assert repair_platform([ground, ledge], ledge.move(-50, -150)) == ledge.move(-50, -150), \
+            "Reachable platforms should stay where they are"
+        print("  [+] Out-of-reach platforms are slid towards the one below")
+
+        buried = pygame.Rect(300, 580, 150, 20)
+        try:
+            repair_platform([ground], buried)
+            assert False, "A platform under the ground cannot be reached and should not be returned"
+        except ValueError:
+            pass
+        assert buried == pygame.Rect(300, 580, 150, 20), "A failed repair should not change the argument"
+        print("  [+] Platforms that cannot be moved into reach raise ValueError")
+
+        # A layout that cannot be repaired is rejected, and the game tries the next seed
+        tried = []
+
+        def rejecting(seed=None, **kwargs):
+            tried.append(seed)
+            if len(tried) == 1:
+                raise ValueError("Platform cannot be moved into reach")
+            return generate_terrain(seed=seed, **kwargs)
+        game_module.generate_terrain = rejecting
+        try:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                game = game_module.Game(level=1, seed=42, headless=True, level_cache=LevelCache(cache_dir=None))
+        finally:
+            game_module.generate_terrain = generate_terrain
+        assert tried == [43, 44], "The rejected terrain seed should be followed by the next one"
+        assert "Level 1 terrain rejected" in output.getvalue(), "The rejection should be reported"
+        assert sorted(tuple(p.rect) for p in game.platforms) == \
+            sorted(tuple(p.rect) for p in generate_terrain(44, 1)), "The level should be built from the next seed"
+        print("  [+] Layouts that cannot be repaired are rejected and regenerated from the next seed")
+
+        # Wider spacing than the real difficulties leaves some levels unreachable
+        repaired = 0
+        for seed in range(100):
+            unrepaired_rng, repaired_rng = random.Random(), random.Random()
+            rects = [p.rect for p in generate_terrain(seed, -1, rng=unrepaired_rng, repair=False)]
+            fixed = [p.rect for p in generate_terrain(seed, -1, rng=repaired_rng)]
+            assert unreachable_platforms(fixed) == [], f"Seed {seed} should be repaired"
+            assert len(fixed) == len(rects) and unrepaired_rng.random() == repaired_rng.random(), \
+                "Repairs should not change what else the level draws"
+            if unreachable_platforms(rects):
+                repaired += 1
+        assert repaired > 0, "Some widely spaced levels should have needed repairs"
+        print(f"  [+] {repaired} of 100 widely spaced levels repaired")
+
+        print("[+] PASS: Generation repair")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    pygame.init()
+    tests = [
+        test_jump_envelope,
+        test_reachability_graph,
+        test_generation_repair,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for batch rollouts:
+1. Pool rollouts stream one result per (seed, level), matching in-process runs
+2. Workers load assets once, up front, and reuse them for every run, with
+   a memory-only level cache and without re-initializing pygame
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import inspect
+import time
+import pygame
+import parallax
+import rollout
+from asset_loader import get_loader
+from level_cache import get_level_cache
+from rollout import (run_rollouts, RolloutResult, ALL_LEVELS, OUTCOME_COMPLETE, OUTCOME_DEATH,
+                     OUTCOME_TIMEOUT)
+
+
+def test_pool_matches_in_process():
+    """Test that pool rollouts cover every job and match in-process rollouts"""
+    print("=" * 60)
+    print("TEST 1: Pool Rollouts Match In-Process Rollouts")
+    print("=" * 60)
+
+    try:
+        seeds = range(5)
+        stream = run_rollouts(seeds, workers=2, max_frames=600)
+        assert inspect.isgenerator(stream), "Results should be streamed"
+
+        start = time.perf_counter()
+        pooled = list(stream)
+        elapsed = time.perf_counter() - start
+        assert [(r.seed, r.level) for r in pooled] == [(s, l) for s in seeds for l in ALL_LEVELS], \
+            "There should be one result per (seed, level), in order"
+        assert all(isinstance(r, RolloutResult) for r in pooled), "Results should be RolloutResults"
+        assert all(r.outcome in (OUTCOME_COMPLETE, OUTCOME_DEATH, OUTCOME_TIMEOUT) for r in pooled), \
+            "Unknown outcome"
+        assert all(0 < r.frames <= 600 for r in pooled), "Runs should stop at max_frames"
+        print(f"  [+] {len(pooled)} runs on 2 workers in {elapsed:.2f}s")
+
+        local = list(run_rollouts(seeds, workers=0, max_frames=600))
+        assert local == pooled, "Worker processes should play exactly like this process"
+        print("  [+] Pool results match in-process results")
+
+        print("[+] PASS: Pool rollouts match in-process rollouts")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_assets_loaded_once():
+    """Test that a worker's runs reuse the assets loaded when it started"""
+    print("=" * 60)
+    print("TEST 2: Assets Loaded Once Per Worker")
+    print("=" * 60)
+
+    try:
+        rollout._init_worker(rollout.random_input, 120)
+        loader = get_loader()
+        loaded = (len(loader.sprite_cache), len(loader.animation_cache), len(parallax._image_cache))
+        game = rollout._worker_game
+        assert game.level_cache is not get_level_cache() and game.level_cache.cache_dir is None, \
+            "Workers should keep their own memory-only level cache"
+
+        set_mode = pygame.display.set_mode
+        displays = []
+        pygame.display.set_mode = lambda *args, **kwargs: displays.append(args) or set_mode(*args, **kwargs)
+        try:
+            for level in ALL_LEVELS:
+                rollout._run_job((123, level))
+        finally:
+            pygame.display.set_mode = set_mode
+        assert rollout._worker_game is game, "Runs should reuse the worker's game"
+        assert not displays, "Runs should reset the game, not re-initialize pygame"
+        after = (len(loader.sprite_cache), len(loader.animation_cache), len(parallax._image_cache))
+        assert after == loaded, "Runs should not load any new images"
+        print(f"  [+] {loaded[0]} sprites and {loaded[2]} backgrounds loaded at start, none by the runs")
+        print("  [+] Runs reset one game and keep levels in the worker's own memory cache")
+
+        print("[+] PASS: Assets loaded once per worker")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_pool_matches_in_process,
+        test_assets_loaded_once,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for game snapshots:
+1. Restoring a snapshot replays the simulation exactly, also on another Game
+2. Killed sprites, attacks and projectiles are brought back by restore
+3. Snapshots are compact and restore is cheap enough for every frame
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import io
+import pickle
+import random
+import contextlib
+import time
+import pygame
+from settings import BOSS_LEVEL
+from game import Game
+
+
+class _Keys(dict):
+    """Stand-in for pygame.key.get_pressed()"""
+    def __getitem__(self, key):
+        return self.get(key, False)
+
+
+def _press_random_keys(frame):
+    """Hold a reproducible random set of keys for a frame"""
+    rng = random.Random(frame)
+    keys = _Keys({key: rng.random() < 0.3
+                  for key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_a, pygame.K_DOWN)})
+    pygame.key.get_pressed = lambda: keys
+
+
+def _play(game, start, frames):
+    """Play frames with scripted input and record the simulation state after each"""
+    trace = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(start, start + frames):
+            _press_random_keys(frame)
+            game.update()
+            trace.append((game.player.get_state(), [e.get_state() for e in game.enemies],
+                          game.projectiles.get_state(), [a.get_state() for a in game.player.attacks],
+                          len(game.obstacles), len(game.health_pickups), game.game_state))
+    return trace
+
+
+def test_restore_replays_exactly():
+    """Test that play continues identically after restoring a snapshot"""
+    print("=" * 60)
+    print("TEST 1: Restore Replays Exactly")
+    print("=" * 60)
+
+    get_pressed = pygame.key.get_pressed
+    try:
+        for level in (1, BOSS_LEVEL):
+            game = Game(level=level, seed=11, headless=True)
+            _play(game, 0, 300)
+            blob = game.snapshot()
+            expected = _play(game, 300, 600)
+
+            game.restore(blob)
+            assert _play(game, 300, 600) == expected, f"Level {level}: replay after restore differs"
+
+            other = Game(level=2, seed=5, headless=True)
+            other.restore(blob)
+            assert other.level == level and other.seed == 11, "Restore should switch to the snapshot's level"
+            assert _play(other, 300, 600) == expected, f"Level {level}: replay on another Game differs"
+            print(f"  [+] Level {level}: 600 frames replay identically")
+
+        print("[+] PASS: Restore replays exactly")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+    finally:
+        pygame.key.get_pressed = get_pressed
+
+
+def test_restore_revives_sprites():
+    """Test that restore brings back killed sprites and in-flight objects"""
+    print("=" * 60)
+    print("TEST 2: Restore Revives Sprites")
+    print("=" * 60)
+
+    try:
+        game = Game(level=1, seed=42, headless=True)
+        game.step(1)
+        game.player.attack()
+        game.projectiles.spawn(400, 300, vx=2)
+        game.player.health = 37
+        blob = game.snapshot()
+        enemies = list(game.enemies)
+
+        for enemy in enemies:
+            enemy.take_damage(1000)
+        for pickup in game.health_pickups:
+            pickup.collect()
+        game.projectiles.clear()
+        game.step(20)
+        assert len(game.enemies) == 0 and len(game.player.attacks) == 0, "Setup should clear the level"
+
+        game.restore(blob)
+        assert list(game.enemies) == enemies, "Enemies should be revived in their original order"
+        assert all(enemy.alive() and enemy in game.all_sprites for enemy in enemies), "Revived enemies should be drawn"
+        assert len(game.health_pickups) > 0, "Pickups should be revived"
+        assert len(game.player.attacks) == 1, "The in-flight attack should be restored"
+        assert len(game.projectiles) >= 1, "Projectiles should be restored"
+        assert game.player.health == 37, "Player state should be restored"
+        print("  [+] Enemies, pickups, attacks and projectiles restored")
+
+        bad = pickle.dumps((0,) + pickle.loads(blob)[1:])
+        try:
+            game.restore(bad)
+            assert False, "Snapshots of another version should be rejected"
+        except ValueError:
+            print("  [+] Snapshots of another version are rejected")
+
+        print("[+] PASS: Restore revives sprites")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_snapshot_cost():
+    """Test snapshot size and restore speed"""
+    print("=" * 60)
+    print("TEST 3: Snapshot Size And Restore Cost")
+    print("=" * 60)
+
+    try:
+        game = Game(level=3, seed=42, headless=True)
+        game.step(120)
+        blob = game.snapshot()
+
+        runs = 1000
+        start = time.perf_counter()
+        for _ in range(runs):
+            game.restore(blob)
+        restore_ms = (time.perf_counter() - start) / runs * 1000
+
+        print(f"  [+] Snapshot is {len(blob)} bytes, restore takes {restore_ms:.3f} ms")
+        assert len(blob) < 16 * 1024, "Snapshot should stay compact"
+        assert restore_ms < 1.0, "Restore should be cheap enough to call every frame"
+
+        print("[+] PASS: Snapshot size and restore cost")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_restore_replays_exactly,
+        test_restore_revives_sprites,
+        test_snapshot_cost,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the spatial hash collision broad-phase:
+1. Queries return the same sprites, in the same order, as spritecollide
+2. Queries can be restricted to collision layers
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import random
+import pygame
+from spatial_hash import SpatialHash
+
+
+def _make_sprite(x, y, w, h):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(x, y, w, h)
+    return sprite
+
+
+def test_query_matches_spritecollide():
+    """Test that grid queries agree with a linear spritecollide scan"""
+    print("=" * 60)
+    print("TEST 1: Query Matches spritecollide")
+    print("=" * 60)
+
+    try:
+        rng = random.Random(1234)
+        group = pygame.sprite.Group()
+        for _ in range(500):
+            group.add(_make_sprite(rng.randint(-50, 800), rng.randint(-50, 2400),
+                                   rng.randint(1, 200), rng.randint(1, 200)))
+
+        grid = SpatialHash(cell_size=64)
+        grid.rebuild(group)
+        assert len(grid) == 500, "Every sprite should be inserted"
+
+        for _ in range(300):
+            probe = _make_sprite(rng.randint(-100, 850), rng.randint(-100, 2450),
+                                 rng.randint(1, 300), rng.randint(1, 300))
+            expected = pygame.sprite.spritecollide(probe, group, False)
+            assert grid.query(probe.rect) == expected, "Grid query differs from spritecollide"
+
+        print("  [+] 300 random queries matched spritecollide exactly")
+        print("[+] PASS: Grid queries match spritecollide")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_query_layer_filter():
+    """Test that queries can be restricted to collision layers"""
+    print("=" * 60)
+    print("TEST 2: Query Layer Filter")
+    print("=" * 60)
+
+    try:
+        grid = SpatialHash()
+        near = _make_sprite(0, 0, 40, 40)
+        near.collision_layer = 4
+        other = _make_sprite(10, 10, 40, 40)
+        other.collision_layer = 8
+        grid.insert(near)
+        grid.insert(other)
+
+        probe = pygame.Rect(0, 0, 60, 60)
+        assert grid.query(probe) == [near, other], "Unfiltered query should return both sprites"
+        assert grid.query(probe, 4) == [near], "Layer 4 query should only return layer 4 sprites"
+        assert grid.query(probe, 4 | 8) == [near, other], "Combined layers should return both sprites"
+        assert grid.query(probe, 16) == [], "Unused layer should return nothing"
+        print("[+] PASS: Queries respect layer filters")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_query_matches_spritecollide,
+        test_query_layer_filter,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
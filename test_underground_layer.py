@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the cached underground layer:
+1. The layer is drawn once and reused every frame the ground is visible
+2. The layer is keyed by (level, seed): changing level, seed, restarting or
+   restoring a snapshot of another level draws a new one
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import contextlib
+import io
+import pygame
+from settings import WIDTH, HEIGHT, LEVEL_HEIGHT
+from game import Game
+
+
+def _count_builds(game):
+    """Count the game's underground layer builds, returning the list they are recorded in"""
+    builds = []
+    build = game._build_underground_layer
+
+    def counted(level):
+        builds.append((level, game.seed))
+        return build(level)
+    game._build_underground_layer = counted
+    return builds
+
+
+def _draw_ground(game):
+    """Draw the underground with the ground 100px above the bottom of the screen"""
+    game.camera.y = LEVEL_HEIGHT - HEIGHT + 100
+    game._draw_underground()
+    return game.underground_layer
+
+
+def _pixels(surface):
+    """A surface's pixels, for comparing"""
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def test_layer_reused():
+    """Test that drawing the ground reuses one pre-rendered layer"""
+    print("=" * 60)
+    print("TEST 1: Layer Reused Between Frames")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=42)
+        builds = _count_builds(game)
+        layer = _draw_ground(game)
+        assert layer is not None and game._underground_key == (1, 42), "The level should come with its layer"
+        for _ in range(5):
+            assert _draw_ground(game) is layer, "Later frames should reuse the layer"
+        assert builds == [], "The layer should not be drawn again"
+        print("  [+] Five frames of ground reuse the layer built with the level")
+
+        expected = game.screen.subsurface((0, HEIGHT - 100, WIDTH, 100))
+        assert _pixels(expected) == _pixels(layer.subsurface((0, 0, WIDTH, 100))), \
+            "The top of the layer should be blitted at the ground line"
+        assert _pixels(layer) == _pixels(Game._build_underground_layer(game, 1)), \
+            "The cached layer should match a freshly drawn one"
+        print("  [+] The ground line shows the top of the layer")
+
+        game.camera.y = 0
+        game._draw_underground()
+        assert builds == [], "Nothing should be drawn while the ground is off screen"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            headless = Game(level=1, seed=42, headless=True)
+        assert headless.underground_layer is None, "Headless games should not draw the layer up front"
+        headless.screen = pygame.Surface((WIDTH, HEIGHT))
+        assert _pixels(_draw_ground(headless)) == _pixels(layer), "The first draw should build the same layer"
+        print("  [+] Headless games build it on first draw")
+
+        print("[+] PASS: Layer reused between frames")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_layer_invalidated():
+    """Test that the layer is rebuilt whenever the level or seed changes"""
+    print("=" * 60)
+    print("TEST 2: Layer Keyed by Level and Seed")
+    print("=" * 60)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(level=1, seed=42)
+            level_one = _pixels(_draw_ground(game))
+            blob = game.snapshot()
+            game._advance_level()
+        layer = _draw_ground(game)
+        assert game._underground_key == (2, 42), "The next level should key its layer by level 2"
+        assert _pixels(layer) != level_one, "Level 2 should have its own layer"
+        print("  [+] Advancing a level swaps in that level's layer")
+
+        builds = _count_builds(game)
+        game.seed = 43
+        reseeded = _draw_ground(game)
+        assert builds == [(2, 43)] and game._underground_key == (2, 43), "A new seed should rebuild the layer"
+        assert _pixels(reseeded) != _pixels(layer), "The skeletons should move with the seed"
+        print("  [+] A new seed rebuilds the layer on the next draw")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.restore(blob)
+        assert game._underground_key == (1, 42), "Restoring level 1 should key its layer by level 1"
+        assert _pixels(_draw_ground(game)) == level_one, "The restored level should draw level 1's layer"
+        print("  [+] Restoring a snapshot of another level brings back its layer")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            game._advance_level()
+            game.restart()
+        layer = _draw_ground(game)
+        assert game.level == 1 and game._underground_key == (1, game.seed), "Restarting should key by level 1"
+        assert _pixels(layer) == _pixels(Game._build_underground_layer(game, 1)), \
+            "Restarting should draw level 1's layer for the new seed"
+        print(f"  [+] Restarting draws level 1's layer for seed {game.seed}")
+
+        print("[+] PASS: Layer keyed by level and seed")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_layer_reused,
+        test_layer_invalidated,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
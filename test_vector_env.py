@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for running many game worlds in one process:
+1. Games keep their random generator and attack counter to themselves,
+   and levels built concurrently match levels built one at a time
+2. VectorEnv steps worlds in lockstep exactly like separate environments
+3. Batched stepping throughput
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+import random
+import threading
+import time
+import numpy as np
+from settings import BOSS_LEVEL
+from game import Game
+from env import GameEnv, OBSERVATION_SIZE
+from vector_env import VectorEnv
+
+
+def _level_summary(state):
+    """Describe what generation decided for a built level"""
+    return (
+        [tuple(p.rect) for p in state.platforms],
+        [(tuple(o.rect), o.sprite_type) for o in state.obstacles],
+        [(tuple(p.rect), p.heal_amount) for p in state.health_pickups],
+        [(type(p).__name__, tuple(p.rect)) for p in state.powerups],
+        state.rng.getstate(),
+    )
+
+
+def test_games_are_independent():
+    """Test that games do not share random or attack state"""
+    print("=" * 60)
+    print("TEST 1: Independent Game Worlds")
+    print("=" * 60)
+
+    try:
+        random.seed(99)
+        expected = random.getstate()
+        game = Game(level=1, seed=42, headless=True)
+        other = Game(level=2, seed=7, headless=True)
+        game.restore(other.snapshot())
+        assert random.getstate() == expected, "Levels and snapshots should not touch the random module"
+        print("  [+] Level generation and restore leave the random module alone")
+
+        game.enemies_attacking = 2
+        other.step(1)
+        assert game.enemies_attacking == 2, "Attack counters should be per game"
+        print("  [+] Enemy attack limits are counted per game")
+
+        games = [Game(level=level, seed=seed, headless=True) for seed in (3, 4) for level in (1, 2, BOSS_LEVEL)]
+        for game in games:
+            game.level_cache.clear()
+        sequential = [_level_summary(game.build_level(game.level)) for game in games]
+        for game in games:
+            game.level_cache.clear()
+        concurrent = [None] * len(games)
+
+        def build(i):
+            concurrent[i] = _level_summary(games[i].build_level(games[i].level))
+        threads = [threading.Thread(target=build, args=(i,)) for i in range(len(games))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert concurrent == sequential, "Levels built on concurrent threads should match"
+        print(f"  [+] {len(games)} levels built concurrently match sequential builds")
+
+        print("[+] PASS: Independent game worlds")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_lockstep_matches_separate_envs():
+    """Test that a VectorEnv behaves like the same number of separate environments"""
+    print("=" * 60)
+    print("TEST 2: Lockstep Worlds Match Separate Environments")
+    print("=" * 60)
+
+    try:
+        seeds = [1, 2, 3, 4]
+        levels = [1, 2, 3, BOSS_LEVEL]
+        rng = random.Random(5)
+        actions = [[rng.randrange(10) for _ in seeds] for _ in range(400)]
+
+        vector = VectorEnv(len(seeds), max_steps=150, seed=10)
+        obs = vector.reset(seeds, levels)
+        assert obs.shape == (len(seeds), OBSERVATION_SIZE) and obs.dtype == np.float32, "Bad batch shape"
+        batched = []
+        for step_actions in actions:
+            obs, rewards, dones, infos = vector.step(step_actions)
+            assert rewards.shape == (len(seeds),) and dones.shape == (len(seeds),), "Bad reward/done shape"
+            batched.append((obs.tolist(), rewards.tolist(), dones.tolist()))
+        assert any(any(step[2]) for step in batched), "Some episodes should have ended and reset"
+
+        separate = [GameEnv(max_steps=150, seed=10 + i) for i in range(len(seeds))]
+        first = [env.reset(seed, level) for env, seed, level in zip(separate, seeds, levels)]
+        assert np.array_equal(np.array(first), vector.reset(seeds, levels)), "Reset observations differ"
+        for step, step_actions in enumerate(actions):
+            row_obs = []
+            row_rewards = []
+            row_dones = []
+            for env, action, level in zip(separate, step_actions, levels):
+                obs, reward, done, info = env.step(action)
+                if done:
+                    obs = env.reset(level=level)
+                row_obs.append(obs.tolist())
+                row_rewards.append(np.float32(reward).item())
+                row_dones.append(done)
+            assert batched[step] == (row_obs, row_rewards, row_dones), f"Worlds diverge at step {step}"
+        print(f"  [+] {len(seeds)} worlds over {len(actions)} steps match separate environments")
+
+        print("[+] PASS: Lockstep worlds match separate environments")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def test_batched_throughput():
+    """Test environment steps per second summed over a batch of worlds"""
+    print("=" * 60)
+    print("TEST 3: Batched Throughput")
+    print("=" * 60)
+
+    try:
+        num_envs = 16
+        vector = VectorEnv(num_envs, seed=0)
+        vector.reset(list(range(num_envs)), [1 + i % BOSS_LEVEL for i in range(num_envs)])
+        rng = np.random.default_rng(0)
+        steps = 500
+        start = time.perf_counter()
+        for _ in range(steps):
+            vector.step(rng.integers(0, vector.n_actions, num_envs))
+        rate = steps * num_envs / (time.perf_counter() - start)
+
+        print(f"  [+] {num_envs} worlds: {rate:.0f} environment steps/s")
+        assert rate > 2000, "Batched stepping should be far faster than real time"
+
+        print("[+] PASS: Batched throughput")
+        return True
+    except AssertionError as e:
+        print(f"[X] FAIL: {e}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_games_are_independent,
+        test_lockstep_matches_separate_envs,
+        test_batched_throughput,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            if test() is not False:
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"[X] EXCEPTION in {test.__name__}: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"TEST SUMMARY: {passed} PASSED, {failed} FAILED out of {len(tests)} tests")
+    print("=" * 60)
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)